@@ -3,6 +3,7 @@ Wincap API - FastAPI REST endpoints for FEC processing
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
@@ -12,6 +13,7 @@ import threading
 import uuid
 from uuid import UUID
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager
 from datetime import datetime
 from decimal import Decimal
@@ -39,14 +41,19 @@ from pydantic import BaseModel
 
 from config.settings import settings
 from src.parser.fec_parser import FECParser
-from src.mapper.account_mapper import AccountMapper
+from src.parser.cache import create_parse_cache
+from src.parser.multi import parse_files
+from src.parser.stream import GrowingFile
+from src.mapper.registry import mapping_registry
+from src.models.cube import AccountCube
 from src.engine.pl_builder import PLBuilder
 from src.engine.balance_builder import BalanceBuilder
 from src.engine.kpi_calculator import KPICalculator
 from src.engine.cashflow_builder import CashFlowBuilder
 from src.engine.monthly_builder import MonthlyBuilder
 from src.engine.variance_builder import VarianceBuilder
-from src.engine.detail_builder import DetailBuilder
+from src.engine.fused_builder import FusedBuilder
+from src.engine.statement_cache import StatementCache
 from src.export.excel_writer import ExcelWriter
 from src.export.template_writer import TemplateWriter
 from src.exceptions import FECParsingError, ValidationError
@@ -58,8 +65,8 @@ try:
 except OSError:
     PDFWriter = None
     PDF_AVAILABLE = False
-from src.validators import validate_fec_file, sanitize_filename
 from src.agent.tools import DealAgent
+from src.validators import sanitize_filename, validate_fec_extension, validate_fec_file
 
 # =============================================================================
 # Logging Configuration
@@ -114,6 +121,12 @@ def validate_session_dir(session_dir_str: str) -> Path:
 
 SESSIONS = {}
 SESSIONS_LOCK = threading.Lock()  # Thread-safe access to SESSIONS dict
+PARSE_CACHE = create_parse_cache(settings.UPLOAD_TEMP_DIR, settings.PARSE_CACHE_MAX_BYTES)
+# Streamed parses block while waiting for upload bytes: they get their own
+# threads so they never hold up the default executor (asyncio.to_thread)
+STREAM_PARSE_EXECUTOR = ThreadPoolExecutor(
+    max_workers=settings.STREAM_PARSE_WORKERS, thread_name_prefix="stream-parse"
+)
 cleanup_task: Optional[asyncio.Task] = None
 
 # =============================================================================
@@ -224,6 +237,147 @@ def decimal_to_float(obj):
         return [decimal_to_float(i) for i in obj]
     return obj
 
+# Size of the chunks read from an uploaded file
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+async def receive_and_parse(file: UploadFile, file_path: Path) -> FECParser:
+    """Copy an upload to ``file_path`` in chunks while a thread parses it.
+
+    The parser reads the file as it grows (GrowingFile), so parsing is
+    mostly done when the last chunk is written. The chunks are hashed as
+    they arrive: if PARSE_CACHE has a result for the same bytes, the parse
+    is stopped and the cached result is returned instead. MAX_FILE_SIZE is
+    enforced as chunks arrive; on any error the partial file is removed.
+
+    The parse runs on STREAM_PARSE_EXECUTOR: a parse waiting for bytes
+    must not occupy a thread that this coroutine needs (the cache lookup
+    uses the default executor), or concurrent uploads could deadlock.
+
+    Raises:
+        HTTPException: 400 if the file is too large or too small
+    """
+    growing = GrowingFile(file_path, timeout=settings.UPLOAD_STALL_TIMEOUT)
+    parser = FECParser(
+        str(file_path), amount_mode=settings.AMOUNT_MODE, cache=PARSE_CACHE, aggregate=True,
+        max_decompressed_bytes=settings.MAX_DECOMPRESSED_SIZE,
+    )
+
+    def parse():
+        with growing.reader() as reader:
+            return parser.parse_stream(reader)
+
+    parse_task = asyncio.get_running_loop().run_in_executor(STREAM_PARSE_EXECUTOR, parse)
+    digest = hashlib.sha256()
+    try:
+        while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+            if growing.size + len(chunk) > settings.MAX_FILE_SIZE:
+                _, error = validate_fec_file(Path(file.filename), growing.size + len(chunk))
+                raise HTTPException(status_code=400, detail=error)
+            digest.update(chunk)
+            growing.write(chunk)
+
+        is_valid, error = validate_fec_file(Path(file.filename), growing.size)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=error)
+
+        cached = FECParser(
+            str(file_path), amount_mode=settings.AMOUNT_MODE, cache=PARSE_CACHE, aggregate=True
+        )
+        if await asyncio.to_thread(cached.parse_cached, digest.hexdigest()) is not None:
+            # The streamed parse is not needed; it stops at its next read
+            growing.abort()
+            await asyncio.gather(parse_task, return_exceptions=True)
+            return cached
+
+        growing.close()
+        await parse_task
+    except BaseException:
+        growing.abort()
+        # The parser thread stops at its next read; its error is not relevant
+        await asyncio.gather(parse_task, return_exceptions=True)
+        file_path.unlink(missing_ok=True)
+        raise
+
+    return parser
+
+async def receive_file(file: UploadFile, file_path: Path) -> None:
+    """Copy an upload to ``file_path`` in chunks, without parsing it.
+
+    MAX_FILE_SIZE is enforced as chunks arrive; on any error the partial
+    file is removed.
+
+    Raises:
+        HTTPException: 400 if the file is too large or too small
+    """
+    size = 0
+    try:
+        with open(file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                size += len(chunk)
+                if size > settings.MAX_FILE_SIZE:
+                    _, error = validate_fec_file(Path(file.filename), size)
+                    raise HTTPException(status_code=400, detail=error)
+                f.write(chunk)
+
+        is_valid, error = validate_fec_file(Path(file.filename), size)
+        if not is_valid:
+            raise HTTPException(status_code=400, detail=error)
+    except BaseException:
+        file_path.unlink(missing_ok=True)
+        raise
+
+def _parse_pending(session: dict) -> None:
+    """Parse the files of a session uploaded with defer=True, then merge them.
+
+    Runs once: later calls wait for the parse in progress, then return. If
+    a file fails, nothing is merged and the next call tries again.
+
+    Raises:
+        HTTPException: 400 if a file is not a valid FEC
+    """
+    if not session.get("pending"):
+        return
+    with session["parse_lock"]:
+        pending = session["pending"]
+        if not pending:
+            return
+
+        entries = []
+        cube = AccountCube()
+        for file_path, file_info in pending:
+            parser = FECParser(
+                file_path, amount_mode=settings.AMOUNT_MODE, cache=PARSE_CACHE, aggregate=True,
+                max_decompressed_bytes=settings.MAX_DECOMPRESSED_SIZE,
+            )
+            try:
+                parser.parse_with_mode(settings.PARSE_MODE)
+            except (FECParsingError, ValueError) as e:
+                logger.warning(f"FEC parse error for {file_info['filename']}: {e}")
+                raise HTTPException(
+                    status_code=400,
+                    detail=f"Invalid FEC format in {file_info['filename']}: {str(e)}"
+                )
+            entries.extend(parser.entries)
+            cube.merge(parser.cube)
+            file_info["entries"] = len(parser.entries)
+            file_info["years"] = sorted(parser.years)
+            logger.info(
+                f"Parsed deferred file {file_info['filename']}: {len(parser.entries)} entries"
+            )
+
+        with session["data_lock"]:
+            session["entries"].extend(entries)
+            session["cube"].merge(cube)
+            session["statements"].add_entries(entries)
+            session["pending"] = []
+
+def _parse_pending_in_background(session: dict) -> None:
+    """_parse_pending() for a background task: errors surface on /api/process."""
+    try:
+        _parse_pending(session)
+    except HTTPException as e:
+        logger.warning(f"Background parse failed: {e.detail}")
+
 # =============================================================================
 # Endpoints
 # =============================================================================
@@ -255,6 +409,7 @@ async def upload_options():
 @app.post("/api/upload")
 async def upload_fec(
     files: List[UploadFile] = File(...),
+    defer: bool = False,
     api_key: str = Depends(verify_api_key),
 ):
     """
@@ -263,18 +418,31 @@ async def upload_fec(
     Validates file types and sizes, then parses FEC entries.
     Returns a session_id to use for subsequent operations.
 
+    Several files are saved first, then parsed concurrently in up to
+    MAX_PARALLEL_FILES processes. A file that fails to parse is reported in
+    `errors` and left out of the session; the others are kept.
+
+    With `defer=true`, files are only saved and probed (encoding, delimiter,
+    years and row count estimated from a few sampled windows, see
+    FECParser.probe). They are parsed in the background; /api/process
+    waits for that parse.
+
     **Parameters:**
-    - `files`: One or more FEC text files (.txt)
+    - `files`: One or more FEC text files (.txt), optionally compressed
+      (.txt.gz, .zip, .txt.zst); archives are decompressed while parsing
+    - `defer`: Return after probing instead of parsing
 
     **Returns:**
     - `session_id`: UUID for referencing this upload session
-    - `files`: List of uploaded files with metadata
-    - `total_entries`: Total number of accounting entries
-    - `years`: Fiscal years found in files
+    - `files`: List of uploaded files with metadata (`entries` is null and
+      `estimated_entries` is set while a deferred file is not parsed)
+    - `total_entries`: Total number of accounting entries (null if deferred)
+    - `years`: Fiscal years found in files (sampled if deferred)
+    - `errors`: Files of a multi-file upload that could not be parsed
 
     **Errors:**
     - 400: Invalid file type or size
-    - 400: Invalid FEC format
+    - 400: Invalid FEC format (every file, for a multi-file upload)
     """
     logger.info(f"Upload endpoint received {len(files) if files else 0} files")
     if not files:
@@ -286,14 +454,15 @@ async def upload_fec(
 
     uploaded_files = []
     all_entries = []
+    pending = []
+    received = []
+    parse_errors = []
+    cube = AccountCube()
 
     for file in files:
         try:
-            # Read file content
-            content = await file.read()
-
-            # Validate file
-            is_valid, error = validate_fec_file(Path(file.filename), len(content))
+            # Reject bad extensions before receiving the content
+            is_valid, error = validate_fec_extension(Path(file.filename))
             if not is_valid:
                 logger.warning(f"File validation failed: {error}")
                 raise HTTPException(status_code=400, detail=error)
@@ -302,15 +471,40 @@ async def upload_fec(
             safe_filename = sanitize_filename(file.filename)
             file_path = session_dir / safe_filename
 
-            # Save file temporarily
-            with open(file_path, "wb") as f:
-                f.write(content)
-
-            # Parse FEC
+            if defer:
+                await receive_file(file, file_path)
+                try:
+                    probe = await asyncio.to_thread(FECParser(str(file_path)).probe)
+                except ValueError as e:
+                    logger.warning(f"FEC probe error for {file.filename}: {e}")
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid FEC format in {file.filename}: {str(e)}"
+                    )
+                file_info = {
+                    "filename": file.filename,
+                    "entries": None,
+                    "estimated_entries": probe.estimated_rows,
+                    "years": probe.years,
+                    "encoding": probe.encoding,
+                    "delimiter": probe.delimiter,
+                }
+                uploaded_files.append(file_info)
+                pending.append((str(file_path), file_info))
+                continue
+
+            if len(files) > 1:
+                # Parsed below, all files at once
+                await receive_file(file, file_path)
+                received.append((file.filename, file_path))
+                continue
+
+            # Save and parse FEC (streamed)
             try:
-                parser = FECParser(str(file_path))
-                entries = parser.parse()
+                parser = await receive_and_parse(file, file_path)
+                entries = parser.entries
                 all_entries.extend(entries)
+                cube.merge(parser.cube)
                 logger.info(f"Successfully parsed {file.filename}: {len(entries)} entries")
 
                 uploaded_files.append({
@@ -320,7 +514,7 @@ async def upload_fec(
                     "encoding": parser.encoding,
                     "delimiter": parser.delimiter,
                 })
-            except FECParsingError as e:
+            except (FECParsingError, ValueError) as e:
                 logger.warning(f"FEC parse error for {file.filename}: {e}")
                 raise HTTPException(
                     status_code=400,
@@ -335,25 +529,235 @@ async def upload_fec(
                 detail="Internal server error during file processing"
             )
 
+    if received:
+        outcomes = await asyncio.to_thread(
+            parse_files,
+            [file_path for _, file_path in received],
+            max_workers=settings.MAX_PARALLEL_FILES,
+            amount_mode=settings.AMOUNT_MODE,
+            cache=PARSE_CACHE,
+            aggregate=True,
+            max_decompressed_bytes=settings.MAX_DECOMPRESSED_SIZE,
+            mode=settings.PARSE_MODE,
+        )
+        for (filename, file_path), outcome in zip(received, outcomes):
+            if not outcome.ok:
+                logger.warning(f"FEC parse error for {filename}: {outcome.error}")
+                parse_errors.append({"filename": filename, "error": outcome.error})
+                file_path.unlink(missing_ok=True)
+                continue
+            all_entries.extend(outcome.entries)
+            cube.merge(outcome.cube)
+            logger.info(f"Successfully parsed {filename}: {len(outcome.entries)} entries")
+            uploaded_files.append({
+                "filename": filename,
+                "entries": len(outcome.entries),
+                "years": outcome.years,
+                "encoding": outcome.encoding,
+                "delimiter": outcome.delimiter,
+            })
+        if not uploaded_files:
+            raise HTTPException(
+                status_code=400,
+                detail="Invalid FEC format in "
+                + "; ".join(f"{error['filename']}: {error['error']}" for error in parse_errors)
+            )
+
+    statements = StatementCache(mapping_registry.mapper())
+    statements.add_entries(all_entries)
+
     # Store in session (thread-safe)
     with SESSIONS_LOCK:
         SESSIONS[session_id] = {
             "entries": all_entries,
+            "cube": cube,
+            "statements": statements,
             "files": uploaded_files,
             "dir": str(session_dir),
             "created": datetime.now().isoformat(),
+            "pending": pending,
+            "parse_lock": threading.Lock(),
+            # Held while entries, cube and statements are merged or built
+            "data_lock": threading.Lock(),
         }
 
-    # Get unique years
-    years = sorted(set(e.fiscal_year for e in all_entries))
+    if pending:
+        session = SESSIONS[session_id]
+        session["parse_task"] = asyncio.create_task(
+            asyncio.to_thread(_parse_pending_in_background, session)
+        )
+        years = sorted(set(year for file_info in uploaded_files for year in file_info["years"]))
+        total_entries = None
+    else:
+        years = sorted(set(e.fiscal_year for e in all_entries))
+        total_entries = len(all_entries)
 
     return {
         "session_id": session_id,
         "files": uploaded_files,
-        "total_entries": len(all_entries),
+        "total_entries": total_entries,
         "years": years,
+        "errors": parse_errors,
     }
 
+@app.post("/api/session/{session_id}/files")
+async def add_session_files(
+    session_id: str,
+    files: List[UploadFile] = File(...),
+    api_key: str = Depends(verify_api_key),
+):
+    """
+    Add FEC file(s) (e.g. a new fiscal year) to an existing session.
+
+    Only the new files are parsed. Their entries and pre-aggregates are merged
+    into the session; only the P&L of the years they touch, and the balance
+    sheets of those years and later ones (cumulative), are rebuilt. If the
+    session was already processed, it is reprocessed with the same request.
+
+    **Returns:**
+    - `files`: The added files with metadata
+    - `total_entries`: Total number of entries in the session
+    - `years`: Fiscal years of the session
+    - `affected_years`: Years whose statements were invalidated
+    - `reprocessed`: True if processed data was refreshed
+
+    **Errors:**
+    - 400: Invalid file type, size or FEC format
+    - 404: Session not found
+    - 409: A file with the same name is already in the session
+    """
+    validate_session_id(session_id)
+    if not files:
+        raise HTTPException(status_code=400, detail="No files provided")
+    with SESSIONS_LOCK:
+        session = SESSIONS.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found. Please upload files first.")
+
+    await asyncio.to_thread(_parse_pending, session)
+    session_dir = validate_session_dir(session["dir"])
+    added_files = []
+    new_entries = []
+    cube = AccountCube()
+    written = []
+
+    try:
+        for file in files:
+            try:
+                is_valid, error = validate_fec_extension(Path(file.filename))
+                if not is_valid:
+                    logger.warning(f"File validation failed: {error}")
+                    raise HTTPException(status_code=400, detail=error)
+
+                file_path = session_dir / sanitize_filename(file.filename)
+                if file_path.exists():
+                    raise HTTPException(
+                        status_code=409,
+                        detail=f"{file.filename} is already in this session"
+                    )
+
+                try:
+                    parser = await receive_and_parse(file, file_path)
+                except (FECParsingError, ValueError) as e:
+                    logger.warning(f"FEC parse error for {file.filename}: {e}")
+                    raise HTTPException(
+                        status_code=400,
+                        detail=f"Invalid FEC format in {file.filename}: {str(e)}"
+                    )
+                written.append(file_path)
+                entries = parser.entries
+                new_entries.extend(entries)
+                cube.merge(parser.cube)
+                logger.info(
+                    f"Added {file.filename} to session {session_id}: {len(entries)} entries"
+                )
+
+                added_files.append({
+                    "filename": file.filename,
+                    "entries": len(entries),
+                    "years": sorted(list(parser.years)),
+                    "encoding": parser.encoding,
+                    "delimiter": parser.delimiter,
+                })
+            except HTTPException:
+                raise
+            except Exception as e:
+                logger.error(f"Unexpected error processing {file.filename}: {e}", exc_info=True)
+                raise HTTPException(
+                    status_code=500,
+                    detail="Internal server error during file processing"
+                )
+    except HTTPException:
+        # Leave the session as it was: drop the files saved by this request
+        for file_path in written:
+            file_path.unlink(missing_ok=True)
+        raise
+
+    with session["data_lock"]:
+        session["entries"].extend(new_entries)
+        session_cube = session.setdefault("cube", AccountCube())
+        session_cube.merge(cube)
+        session["files"].extend(added_files)
+        statements = session.get("statements")
+        if statements is None:
+            statements = session["statements"] = StatementCache(mapping_registry.mapper())
+            affected_years = statements.add_entries(session["entries"])
+        else:
+            affected_years = statements.add_entries(new_entries)
+        total_entries = len(session["entries"])
+        years = sorted(set(e.fiscal_year for e in session["entries"]))
+
+    reprocessed = False
+    process_request = session.get("process_request")
+    if "processed" in session and process_request is not None:
+        await asyncio.to_thread(_process_session, session, process_request)
+        reprocessed = True
+
+    return {
+        "session_id": session_id,
+        "files": added_files,
+        "total_entries": total_entries,
+        "years": years,
+        "affected_years": sorted(affected_years),
+        "reprocessed": reprocessed,
+    }
+
+@app.get("/api/session/{session_id}/probe")
+async def probe_session(session_id: str, api_key: str = Depends(verify_api_key)):
+    """
+    Describe the files of a session without parsing them (FECParser.probe).
+
+    Reads only the head, the tail and a few sampled windows of each file,
+    so it answers in constant time whatever the file sizes.
+
+    **Returns:**
+    - `files`: Per file: encoding, delimiter, headers, column mapping, date
+      format, years seen, estimated row count and the first rows
+
+    **Errors:**
+    - 404: Session not found
+    """
+    validate_session_id(session_id)
+    with SESSIONS_LOCK:
+        session = SESSIONS.get(session_id)
+    if not session:
+        raise HTTPException(status_code=404, detail="Session not found. Please upload files first.")
+
+    session_dir = validate_session_dir(session["dir"])
+    probes = []
+    for file_info in session["files"]:
+        file_path = session_dir / sanitize_filename(file_info["filename"])
+        try:
+            probe = await asyncio.to_thread(FECParser(str(file_path)).probe)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Invalid FEC format in {file_info['filename']}: {str(e)}"
+            )
+        probes.append({"filename": file_info["filename"], **probe.to_dict()})
+
+    return {"session_id": session_id, "files": probes}
+
 @app.post("/api/process")
 async def process_fec(request: ProcessRequest, api_key: str = Depends(verify_api_key)):
     """
@@ -364,24 +768,61 @@ async def process_fec(request: ProcessRequest, api_key: str = Depends(verify_api
     if not session:
         raise HTTPException(status_code=404, detail="Session not found. Please upload files first.")
 
+    await asyncio.to_thread(_parse_pending, session)
+    summary = await asyncio.to_thread(_process_session, session, request)
+    return JSONResponse(content=decimal_to_float(summary))
+
+def _process_session(session: dict, request: ProcessRequest) -> dict:
+    """Build all statements of a session, store them and return the summary.
+
+    One FusedBuilder pass builds everything: the views from the session's
+    AccountCube, and P&L and balance sheets from the entries unless the
+    session's StatementCache still holds them all (no year filter, no file
+    added since the last run). Statements built are kept in the cache.
+    Holds the session's data lock, so files added meanwhile wait for the
+    build to finish. CPU-bound: call it through asyncio.to_thread().
+
+    Raises:
+        HTTPException: 400 if no entries match the requested years
+    """
+    with session["data_lock"]:
+        return _build_session(session, request)
+
+def _build_session(session: dict, request: ProcessRequest) -> dict:
+    """_process_session() with the session's data lock held."""
     all_entries = session["entries"]
+    cube = session.get("cube")
 
     # Filter by years if specified
     if request.years:
         all_entries = [e for e in all_entries if e.fiscal_year in request.years]
+        if cube is not None:
+            cube = cube.filter_years(request.years)
 
     if not all_entries:
         raise HTTPException(status_code=400, detail="No entries found for specified years.")
 
-    # Initialize mapper
-    mapper = AccountMapper()
+    # Shared mapper: accounts categorized by earlier requests are memoized
+    mapper = mapping_registry.mapper()
 
-    # Build financial statements
+    # Build financial statements, monthly and detail views in one call.
+    # Monthly and detail views only sum amounts: they come from the
+    # (account, year, month) cells of the cube instead of every FEC row.
+    # P&L and balance read the raw entries for their per-entry traces,
+    # unless the cache has them all.
     pl_builder = PLBuilder(mapper)
-    pl_list = pl_builder.build_multi_year(all_entries)
-
     balance_builder = BalanceBuilder(mapper)
-    balance_list = balance_builder.build_multi_year(all_entries)
+    statements = session.get("statements") if not request.years else None
+    cached = statements is not None and statements.complete
+    fused = FusedBuilder(mapper).build(all_entries, statements=not cached, cube=cube)
+    if cached:
+        pl_list = statements.pl_list()
+        balance_list = statements.balance_list()
+    else:
+        pl_list = fused.pl_list
+        balance_list = fused.balance_list
+        if statements is not None:
+            statements.store(pl_list, balance_list)
 
     kpi_calculator = KPICalculator({}, vat_rate=Decimal(str(request.vat_rate)))
     kpis_list = kpi_calculator.calculate_multi_year(pl_list, balance_list)
@@ -389,17 +830,16 @@ async def process_fec(request: ProcessRequest, api_key: str = Depends(verify_api
     cashflow_builder = CashFlowBuilder()
     cashflows = cashflow_builder.build_multi_year(pl_list, balance_list)
 
-    monthly_builder = MonthlyBuilder(mapper)
-    monthly_revenue = monthly_builder.build_monthly_revenue(all_entries)
+    monthly_revenue = fused.monthly_revenue
 
     # Build complete monthly data (detailed)
     monthly_data = {"revenue": monthly_revenue}
     try:
-        monthly_data["costs"] = monthly_builder.build_monthly_costs(all_entries)
-        monthly_data["ebitda"] = monthly_builder.build_monthly_ebitda(all_entries)
-        monthly_data["quarterly"] = monthly_builder.build_quarterly_summary(all_entries)
-        monthly_data["cumulative"] = monthly_builder.build_cumulative_revenue(all_entries)
-        monthly_data["seasonality"] = monthly_builder.get_seasonality_index(all_entries)
+        monthly_data["costs"] = fused.monthly_costs
+        monthly_data["ebitda"] = MonthlyBuilder.ebitda_from(monthly_revenue, fused.monthly_costs)
+        monthly_data["quarterly"] = MonthlyBuilder.quarterly_from(monthly_revenue)
+        monthly_data["cumulative"] = MonthlyBuilder.cumulative_from(monthly_revenue)
+        monthly_data["seasonality"] = MonthlyBuilder.seasonality_from(monthly_revenue)
     except Exception:
         pass  # Optional detailed monthly data
 
@@ -429,20 +869,12 @@ async def process_fec(request: ProcessRequest, api_key: str = Depends(verify_api
     except Exception:
         pass  # Optional synthesis data
 
-    # Build detail data for Excel export
-    detail_data = {}
-    detail_builder = DetailBuilder(mapper)
-    detail_data["account_summary"] = detail_builder.build_account_summary(all_entries)
-    detail_data["top_accounts"] = detail_builder.build_top_accounts_all_years(all_entries, top_n=20)
-    detail_data["category_breakdown"] = detail_builder.build_category_breakdown_all_years(all_entries)
+    # Detail data for Excel export (account summary, top accounts, category
+    # breakdown, P&L and balance detail of the latest year)
+    detail_data = fused.detail_data
 
-    years_sorted = sorted(set(e.fiscal_year for e in all_entries))
-    latest_year = years_sorted[-1] if years_sorted else None
-    if latest_year:
-        detail_data["pl_detail"] = detail_builder.build_pl_detail(all_entries, latest_year)
-        detail_data["balance_detail"] = detail_builder.build_balance_detail(all_entries, latest_year)
-
-    # Store processed data in session
+    # Store processed data in session (and the request, to reprocess on added files)
+    session["process_request"] = request
     session["processed"] = {
         "company_name": request.company_name,
         "pl_list": pl_list,
@@ -455,7 +887,7 @@ async def process_fec(request: ProcessRequest, api_key: str = Depends(verify_api
     }
 
     # Build response summary
-    years = sorted(set(e.fiscal_year for e in all_entries))
+    years = fused.years
     summary = {
         "years": years,
         "pl_summary": [],
@@ -488,12 +920,12 @@ async def process_fec(request: ProcessRequest, api_key: str = Depends(verify_api
             "dio": float(kpi.dio) if kpi.dio else None,
         })
 
-    return JSONResponse(content=decimal_to_float({
+    return {
         "session_id": request.session_id,
         "status": "processed",
         "years": years,
         "summary": summary,
-    }))
+    }
 
 @app.get("/api/data/{session_id}")
 async def get_data(session_id: str, api_key: str = Depends(verify_api_key)):
@@ -0,0 +1 @@
+"""Parser benchmarks and the synthetic FEC generator (development tooling)."""
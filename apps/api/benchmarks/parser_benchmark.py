@@ -0,0 +1,280 @@
+"""Throughput and memory benchmarks of the FEC parser modes."""
+
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+# resource is Unix-only - peak RSS is not reported elsewhere
+try:
+    import resource
+except ImportError:
+    resource = None
+
+from src.parser.fec_parser import FECParser
+
+# Benchmark mode -> (FECParser method, extra constructor arguments)
+BENCHMARK_MODES: Dict[str, Tuple[str, Dict[str, Any]]] = {
+    "csv": ("parse_with_result", {}),
+    "iter": ("iter_entries", {}),
+    "columnar": ("parse_columnar", {}),
+    "bulk": ("parse_bulk", {}),
+    "mmap": ("parse_mmap", {}),
+    "stream": ("parse_stream", {}),
+    "parallel": ("parse_parallel", {}),
+    "aggregate": ("parse_with_result", {"aggregate": True}),
+    "details": ("parse_with_result", {"details": True}),
+}
+
+# Relative slowdown (or memory growth) reported as a regression
+DEFAULT_TOLERANCE = 0.15
+
+# Benchmark every other one is measured against. Baselines store speed and
+# peak RSS as ratios to it, which carry over between machines where
+# absolute timings do not.
+REFERENCE_BENCHMARK = "csv/decimal"
+
+# Directory holding the src package (working directory of benchmark runs)
+APP_DIR = Path(__file__).resolve().parent.parent
+
+# Baselines file used by the benchmark CLI command
+DEFAULT_BASELINE_PATH = Path(__file__).resolve().parent / "parser_baselines.json"
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one parser mode on one file."""
+
+    mode: str
+    rows: int
+    seconds: float
+    rows_per_sec: float
+    mb_per_sec: float
+    peak_rss_mb: Optional[float]
+
+
+def benchmark_names(modes: Optional[Iterable[str]] = None) -> List[str]:
+    """Benchmark names ("mode/amount_mode") for the given modes (default: all).
+
+    parse_columnar and parse_bulk always store cents, so they have no
+    decimal variant.
+    """
+    names = []
+    for mode in modes or BENCHMARK_MODES:
+        if mode not in BENCHMARK_MODES:
+            raise ValueError(
+                f"Unknown benchmark mode '{mode}'. Expected one of {list(BENCHMARK_MODES)}"
+            )
+        for amount_mode in FECParser.AMOUNT_MODES:
+            if mode in ("columnar", "bulk") and amount_mode != "cents":
+                continue
+            names.append(f"{mode}/{amount_mode}")
+    return names
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak RSS of this process and its finished children, in MB."""
+    if resource is None:
+        return None
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in bytes on macOS, kilobytes elsewhere
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def _run(file_path: str, name: str) -> Tuple[int, float, Optional[float]]:
+    """Parse ``file_path`` with one benchmark; return (rows, seconds, peak RSS)."""
+    mode, amount_mode = name.split("/")
+    method, options = BENCHMARK_MODES[mode]
+    parser = FECParser(file_path, amount_mode=amount_mode, **options)
+
+    start = time.perf_counter()
+    if method == "iter_entries":
+        for _ in parser.iter_entries(batch_size=10_000):
+            pass
+    elif method == "parse_stream":
+        with open(file_path, "rb") as f:
+            parser.parse_stream(f)
+    else:
+        getattr(parser, method)()
+    seconds = time.perf_counter() - start
+
+    return parser.parse_result.total_rows, seconds, _peak_rss_mb()
+
+
+def _run_isolated(file_path: str, name: str) -> Tuple[int, float, Optional[float]]:
+    """Run one benchmark in a new interpreter (python -m benchmarks.parser_benchmark)."""
+    completed = subprocess.run(
+        [sys.executable, "-m", "benchmarks.parser_benchmark", file_path, name],
+        cwd=APP_DIR, capture_output=True, text=True,
+    )
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()
+        reason = error[-1] if error else completed.returncode
+        raise RuntimeError(f"Benchmark {name} failed: {reason}")
+    rows, seconds, peak_rss = json.loads(completed.stdout.strip().splitlines()[-1])
+    return rows, seconds, peak_rss
+
+
+def run_benchmark(
+    file_path: Union[str, Path],
+    names: Optional[Iterable[str]] = None,
+    repeat: int = 1,
+) -> List[BenchmarkResult]:
+    """Benchmark parser modes on a FEC file.
+
+    Each run happens in a new interpreter, so peak RSS is that of the mode
+    alone (worker processes of parse_parallel included) and runs do not
+    share warm caches. The fastest of ``repeat`` runs is kept.
+
+    Args:
+        file_path: FEC file to parse
+        names: Benchmark names from benchmark_names() (default: all)
+        repeat: Runs per benchmark
+
+    Raises:
+        RuntimeError: If a run fails
+    """
+    file_path = str(Path(file_path).resolve())
+    size_mb = os.path.getsize(file_path) / (1024 * 1024)
+
+    results = []
+    for name in names or benchmark_names():
+        best: Optional[Tuple[int, float, Optional[float]]] = None
+        for _ in range(max(1, repeat)):
+            outcome = _run_isolated(file_path, name)
+            if best is None or outcome[1] < best[1]:
+                best = outcome
+
+        rows, seconds, peak_rss = best
+        results.append(BenchmarkResult(
+            mode=name,
+            rows=rows,
+            seconds=round(seconds, 4),
+            rows_per_sec=round(rows / seconds, 1) if seconds else 0.0,
+            mb_per_sec=round(size_mb / seconds, 2) if seconds else 0.0,
+            peak_rss_mb=round(peak_rss, 1) if peak_rss is not None else None,
+        ))
+    return results
+
+
+def relative_results(results: List[BenchmarkResult]) -> Dict[str, Dict[str, Optional[float]]]:
+    """Speed and peak RSS of each result as ratios to REFERENCE_BENCHMARK.
+
+    Returns:
+        Dict mapping benchmark name to {"speed": rows/s ratio,
+        "peak_rss": peak RSS ratio (None if not measured)}
+
+    Raises:
+        ValueError: If REFERENCE_BENCHMARK is not among the results
+    """
+    by_name = {result.mode: result for result in results}
+    reference = by_name.get(REFERENCE_BENCHMARK)
+    if reference is None or not reference.rows_per_sec:
+        raise ValueError(f"Benchmark results must include {REFERENCE_BENCHMARK}")
+
+    ratios = {}
+    for result in results:
+        peak_rss = None
+        if result.peak_rss_mb is not None and reference.peak_rss_mb:
+            peak_rss = round(result.peak_rss_mb / reference.peak_rss_mb, 3)
+        ratios[result.mode] = {
+            "speed": round(result.rows_per_sec / reference.rows_per_sec, 3),
+            "peak_rss": peak_rss,
+        }
+    return ratios
+
+
+def environment() -> Dict[str, Any]:
+    """Machine description stored with baselines (ratios may still vary with it)."""
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def load_baselines(path: Union[str, Path]) -> Dict[str, Any]:
+    """Baselines by profile name ({} if the file does not exist)."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_baseline(path: Union[str, Path], profile: str, results: List[BenchmarkResult]) -> None:
+    """Store ``results`` as the baseline of ``profile``, keeping other profiles.
+
+    Only ratios to REFERENCE_BENCHMARK are stored (see relative_results()).
+
+    Raises:
+        ValueError: If REFERENCE_BENCHMARK is not among the results
+    """
+    path = Path(path)
+    baselines = load_baselines(path)
+    baselines[profile] = {
+        "environment": environment(),
+        "recorded": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "reference": REFERENCE_BENCHMARK,
+        "results": relative_results(results),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(baselines, f, indent=2, sort_keys=True)
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[str]:
+    """Describe results slower, or using more memory, than the baseline allows.
+
+    Speed and peak RSS are compared as ratios to REFERENCE_BENCHMARK of the
+    same run, so a faster or slower machine does not count as a change.
+    The reference itself therefore never regresses.
+
+    Args:
+        results: Current measurements, including REFERENCE_BENCHMARK
+        baseline: One profile of load_baselines()
+        tolerance: Accepted relative slowdown or memory growth
+
+    Returns:
+        One message per regression (empty if none)
+
+    Raises:
+        ValueError: If REFERENCE_BENCHMARK is not among the results
+    """
+    regressions = []
+    reference = baseline.get("results", {})
+    for mode, current in relative_results(results).items():
+        base = reference.get(mode)
+        if base is None:
+            continue
+        if current["speed"] < base["speed"] * (1 - tolerance):
+            regressions.append(
+                f"{mode}: {current['speed']:.2f}x {REFERENCE_BENCHMARK} speed vs "
+                f"{base['speed']:.2f}x baseline ({current['speed'] / base['speed'] - 1:+.0%})"
+            )
+        if (current["peak_rss"] is not None and base.get("peak_rss")
+                and current["peak_rss"] > base["peak_rss"] * (1 + tolerance)):
+            regressions.append(
+                f"{mode}: {current['peak_rss']:.2f}x {REFERENCE_BENCHMARK} peak RSS vs "
+                f"{base['peak_rss']:.2f}x baseline "
+                f"({current['peak_rss'] / base['peak_rss'] - 1:+.0%})"
+            )
+    return regressions
+
+
+if __name__ == "__main__":
+    # Child of run_benchmark(): python -m benchmarks.parser_benchmark FILE MODE/AMOUNT_MODE
+    print(json.dumps(_run(sys.argv[1], sys.argv[2])))
@@ -0,0 +1,155 @@
+"""Synthetic FEC files for benchmarks and tests."""
+
+import random
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Union
+
+from src.mapper.account_mapper import AccountMapper
+
+# Standard FEC columns (article A47 A-1 of the LPF)
+FEC_COLUMNS = [
+    "JournalCode", "JournalLib", "EcritureNum", "EcritureDate", "CompteNum",
+    "CompteLib", "CompAuxNum", "CompAuxLib", "PieceRef", "PieceDate",
+    "EcritureLib", "Debit", "Credit", "EcritureLet", "DateLet", "ValidDate",
+    "Montantdevise", "Idevise",
+]
+
+
+def _grouped(cents: int, separator: str) -> str:
+    """Amount with French decimal comma and a thousands separator."""
+    units, decimals = divmod(cents, 100)
+    return f"{units:,}".replace(",", separator) + f",{decimals:02d}"
+
+
+# Amount formats found in FEC exports: name -> formatter of positive cents
+AMOUNT_FORMATS: Dict[str, Callable[[int], str]] = {
+    "comma": lambda cents: f"{cents // 100},{cents % 100:02d}",  # 1234,56
+    "dot": lambda cents: f"{cents // 100}.{cents % 100:02d}",    # 1234.56
+    "space": lambda cents: _grouped(cents, " "),                 # 1 234,56
+    "nbsp": lambda cents: _grouped(cents, "\u00a0"),            # 1 234,56 (no-break space)
+    "dot_thousands": lambda cents: _grouped(cents, "."),         # 1.234,56
+}
+
+# (journal code, journal label, counterpart account, label prefix) by account class
+_JOURNALS = {
+    "6": ("AC", "Achats", "401000", "Facture fournisseur"),
+    "7": ("VE", "Ventes", "411000", "Facture client"),
+    "2": ("OD", "Opérations diverses", "404000", "Acquisition immobilisation"),
+    "1": ("OD", "Opérations diverses", "512000", "Opération capital"),
+    "3": ("OD", "Opérations diverses", "603000", "Variation de stock"),
+    "4": ("BQ", "Banque", "512000", "Règlement"),
+    "5": ("BQ", "Banque", "580000", "Virement interne"),
+}
+
+# Labels repeat a lot in real files (recurring suppliers, payroll...)
+_RECURRING_LABELS = [
+    "Loyer bureaux", "Salaires", "Charges sociales URSSAF", "Électricité EDF",
+    "Abonnement logiciel", "Frais bancaires", "Assurance", "Honoraires comptables",
+    "Téléphone et internet", "Carburant", "Fournitures de bureau", "Transport",
+]
+
+
+def fec_filename(year: int, siren: str = "123456789") -> str:
+    """Conventional FEC file name (SIRENFECYYYYMMDD.txt) for a fiscal year."""
+    return f"{siren}FEC{year}1231.txt"
+
+
+def _accounts(mapper: AccountMapper, rng: random.Random, per_prefix: int) -> List[str]:
+    """Six-digit account numbers derived from the mapping prefixes."""
+    accounts = set()
+    for prefix in mapper.mapping:
+        for _ in range(per_prefix):
+            suffix = "".join(rng.choice("0123456789") for _ in range(6 - len(prefix)))
+            accounts.add(prefix + suffix)
+    return sorted(accounts)
+
+
+def generate_fec(
+    file_path: Union[str, Path],
+    rows: int,
+    years: Sequence[int] = (2024,),
+    encoding: str = "utf-8",
+    delimiter: str = "\t",
+    date_format: str = "%Y%m%d",
+    amount_format: str = "comma",
+    seed: int = 0,
+    accounts_per_prefix: int = 4,
+    mapping_path: Optional[Union[str, Path]] = None,
+) -> Path:
+    """Write a balanced synthetic FEC file of ``rows`` entry lines.
+
+    Accounts derive from the PCG prefixes of the account mapping, each
+    écriture has one line on such an account and its counterpart (client,
+    supplier, bank...), and dates run through ``years`` in order. The file
+    is written as it is generated, so any row count fits in memory. The
+    same arguments always produce the same bytes.
+
+    Args:
+        file_path: Output file (see fec_filename() for a name with a year)
+        rows: Number of entry lines (rounded up to an even number)
+        years: Fiscal years covered, in order
+        encoding: Text encoding (e.g. "utf-8", "cp1252", "latin-1")
+        delimiter: Field delimiter ("\\t", "|" or ";")
+        date_format: strftime format of dates (see FECParser.DATE_FORMATS)
+        amount_format: Key of AMOUNT_FORMATS
+        seed: Random seed
+        accounts_per_prefix: Distinct accounts generated per mapping prefix
+        mapping_path: Account mapping YAML (default: config/default_mapping.yml)
+
+    Returns:
+        The path written
+
+    Raises:
+        ValueError: If ``rows``, ``years`` or ``amount_format`` is invalid
+    """
+    if rows < 0:
+        raise ValueError(f"rows must be positive, got {rows}")
+    if not years:
+        raise ValueError("At least one year is required")
+    if amount_format not in AMOUNT_FORMATS:
+        raise ValueError(
+            f"Unknown amount format '{amount_format}'. Expected one of {list(AMOUNT_FORMATS)}"
+        )
+
+    rng = random.Random(seed)
+    accounts = _accounts(AccountMapper(mapping_path), rng, accounts_per_prefix)
+    account_labels = {account: f"Compte {account}" for account in accounts}
+    format_amount = AMOUNT_FORMATS[amount_format]
+    zero = format_amount(0)
+
+    years = sorted(years)
+    start = date(years[0], 1, 1)
+    days = (date(years[-1], 12, 31) - start).days + 1
+    ecritures = (rows + 1) // 2
+
+    file_path = Path(file_path)
+    with open(file_path, "w", encoding=encoding, newline="") as f:
+        f.write(delimiter.join(FEC_COLUMNS) + "\r\n")
+        for n in range(ecritures):
+            day = start + timedelta(days=n * days // max(ecritures, 1))
+            entry_date = day.strftime(date_format)
+            account = rng.choice(accounts)
+            journal, journal_lib, counterpart, label_prefix = _JOURNALS.get(
+                account[0], ("OD", "Opérations diverses", "471000", "Ecriture")
+            )
+            if rng.random() < 0.5:
+                label = rng.choice(_RECURRING_LABELS)
+            else:
+                label = f"{label_prefix} {rng.randrange(100_000):05d}"
+            amount = format_amount(int(rng.lognormvariate(10, 1.5)) + 1)
+            piece = f"P{n:08d}"
+
+            # Charges and assets are debited, revenue and liabilities credited
+            debit_first = account[0] in "23456"
+            lines = (
+                (account, amount, zero) if debit_first else (account, zero, amount),
+                (counterpart, zero, amount) if debit_first else (counterpart, amount, zero),
+            )
+            for compte, debit, credit in lines:
+                f.write(delimiter.join((
+                    journal, journal_lib, str(n + 1), entry_date, compte,
+                    account_labels.get(compte, f"Compte {compte}"), "", "", piece,
+                    entry_date, label, debit, credit, "", "", entry_date, "", "",
+                )) + "\r\n")
+    return file_path
@@ -50,7 +50,15 @@ class Settings(BaseSettings):
     ALLOWED_EXTENSIONS: Set[str] = set(
         ext.strip() for ext in os.getenv("ALLOWED_EXTENSIONS", ".txt").split(",")
     )
+    # Size limit of the decompressed data of a .gz/.zip/.zst upload (500 MB)
+    MAX_DECOMPRESSED_SIZE: int = int(os.getenv("MAX_DECOMPRESSED_SIZE", str(500 * 1024 * 1024)))
     UPLOAD_TEMP_DIR: str = os.getenv("UPLOAD_TEMP_DIR", "/tmp/wincap")
+    # Size limit of the parsed-FEC cache under UPLOAD_TEMP_DIR (0 disables it)
+    PARSE_CACHE_MAX_BYTES: int = int(os.getenv("PARSE_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+    # Threads parsing uploads while they are received (extra uploads queue)
+    STREAM_PARSE_WORKERS: int = int(os.getenv("STREAM_PARSE_WORKERS", "4"))
+    # Seconds a parse waits for the next bytes of an upload before giving up
+    UPLOAD_STALL_TIMEOUT: float = float(os.getenv("UPLOAD_STALL_TIMEOUT", "120"))
 
     # =========================================================================
     # Session Configuration
@@ -63,6 +71,13 @@ class Settings(BaseSettings):
     # =========================================================================
     VAT_RATE_DEFAULT: Decimal = Decimal(os.getenv("VAT_RATE_DEFAULT", "1.20"))
     MAX_PARALLEL_FILES: int = int(os.getenv("MAX_PARALLEL_FILES", "4"))
+    # "decimal" or "cents" (faster, integer cents). Both give the same
+    # Decimals with 2 places; cents mode rejects amounts with more places
+    AMOUNT_MODE: str = os.getenv("AMOUNT_MODE", "decimal")
+    # Parse path of files read from disk (CLI, multi-file and deferred
+    # uploads; single uploads are parsed as they arrive): "csv", "mmap",
+    # "parallel" (all cores per file) or "bulk" (pandas, needs cents)
+    PARSE_MODE: str = os.getenv("PARSE_MODE", "csv")
 
     # =========================================================================
     # Logging Configuration
@@ -94,6 +109,8 @@ class Settings(BaseSettings):
         # Ensure reasonable file size limit (at least 1 MB)
         if self.MAX_FILE_SIZE < 1024 * 1024:
             raise ValueError("MAX_FILE_SIZE must be at least 1 MB")
+        if self.MAX_DECOMPRESSED_SIZE < self.MAX_FILE_SIZE:
+            raise ValueError("MAX_DECOMPRESSED_SIZE must be at least MAX_FILE_SIZE")
 
         # Ensure temp directory is writable
         temp_path = Path(self.UPLOAD_TEMP_DIR)
@@ -106,6 +123,17 @@ class Settings(BaseSettings):
         if not (Decimal("0.5") <= self.VAT_RATE_DEFAULT <= Decimal("2.0")):
             raise ValueError("VAT_RATE_DEFAULT must be between 0.5 and 2.0")
 
+        if self.STREAM_PARSE_WORKERS < 1:
+            raise ValueError("STREAM_PARSE_WORKERS must be at least 1")
+
+        if self.AMOUNT_MODE not in ("decimal", "cents"):
+            raise ValueError("AMOUNT_MODE must be 'decimal' or 'cents'")
+
+        if self.PARSE_MODE not in ("csv", "mmap", "parallel", "bulk"):
+            raise ValueError("PARSE_MODE must be 'csv', 'mmap', 'parallel' or 'bulk'")
+        if self.PARSE_MODE == "bulk" and self.AMOUNT_MODE != "cents":
+            raise ValueError("PARSE_MODE 'bulk' requires AMOUNT_MODE 'cents'")
+
 
 # Initialize global settings instance
 try:
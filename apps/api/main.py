@@ -30,6 +30,7 @@ from src.cli.output import (
     print_kpi_summary,
     print_file_info_table,
     print_panel,
+    print_benchmark_table,
 )
 from src.config.constants import (
     TIMESTAMP_FORMAT,
@@ -39,6 +40,8 @@ from src.config.constants import (
 )
 from src.logging_config import setup_logging, get_logger
 from src.parser.fec_parser import FECParser
+from src.parser.cache import create_parse_cache
+from src.parser.multi import parse_files
 from src.mapper.account_mapper import AccountMapper
 from src.engine.pl_builder import PLBuilder
 from src.engine.balance_builder import BalanceBuilder
@@ -53,6 +56,9 @@ from src.export.pdf_writer import PDFWriter
 # Setup logging
 logger = setup_logging(__name__)
 
+# Parsed-FEC cache shared with the API (repeat runs skip parsing)
+PARSE_CACHE = create_parse_cache(settings.UPLOAD_TEMP_DIR, settings.PARSE_CACHE_MAX_BYTES)
+
 
 @click.group()
 @click.version_option(version="0.2.0")
@@ -153,25 +159,44 @@ def generate(
         all_entries = []
         file_info = []
 
-        for fec_file in fec_files:
-            try:
-                print_info(f"Parsing: {fec_file}", indent=4)
-                parser = FECParser(fec_file)
-                entries = parser.parse()
-                all_entries.extend(entries)
-                logger.info(f"Successfully parsed {fec_file}: {len(entries)} entries")
-                print_success(f"{len(entries)} entries loaded", indent=6)
-
-                file_info.append({
-                    "filename": Path(fec_file).name,
-                    "entries": len(entries),
-                    "years": sorted(set(e.fiscal_year for e in entries)),
-                    "encoding": parser.encoding,
-                })
-            except Exception as e:
-                logger.error(f"Failed to parse {fec_file}: {e}", exc_info=True)
-                print_error(f"Failed to parse {fec_file}: {e}", indent=4)
-                sys.exit(1)
+        # Files are parsed concurrently; outcomes come back in argument order
+        if len(fec_files) > 1:
+            print_info(
+                f"Parsing {len(fec_files)} files "
+                f"(up to {settings.MAX_PARALLEL_FILES} in parallel)", indent=4
+            )
+        outcomes = parse_files(
+            fec_files,
+            max_workers=settings.MAX_PARALLEL_FILES,
+            amount_mode=settings.AMOUNT_MODE,
+            cache=PARSE_CACHE,
+            mode=settings.PARSE_MODE,
+        )
+        failed = 0
+        for fec_file, outcome in zip(fec_files, outcomes):
+            print_info(f"Parsing: {fec_file}", indent=4)
+            if not outcome.ok:
+                failed += 1
+                logger.error(f"Failed to parse {fec_file}: {outcome.error}")
+                print_error(f"Failed to parse {fec_file}: {outcome.error}", indent=6)
+                continue
+
+            entries = outcome.entries
+            all_entries.extend(entries)
+            logger.info(f"Successfully parsed {fec_file}: {len(entries)} entries")
+            print_success(f"{len(entries)} entries loaded", indent=6)
+
+            file_info.append({
+                "filename": Path(fec_file).name,
+                "entries": len(entries),
+                "years": outcome.years,
+                "encoding": outcome.encoding,
+            })
+
+        # Report every failing file before stopping (parsed files stay cached)
+        if failed:
+            print_error(f"{failed} of {len(fec_files)} file(s) could not be parsed.")
+            sys.exit(1)
 
         if not all_entries:
             print_error("No entries found in FEC file(s).")
@@ -395,33 +420,75 @@ def generate(
 
 @cli.command()
 @click.argument("fec_file", type=click.Path(exists=True))
-def analyze(fec_file: str):
+@click.option(
+    "--quick",
+    is_flag=True,
+    help=(
+        "Only probe the file (format, years, estimated rows) from sampled windows, "
+        "without parsing it."
+    ),
+)
+@click.option(
+    "--stream",
+    is_flag=True,
+    help="Parse the file in constant memory with FECParser.iter_entries(), keeping no entries.",
+)
+def analyze(fec_file: str, quick: bool, stream: bool):
     """Quick analysis of a FEC file without generating reports."""
     try:
         print_header("FEC File Analysis")
         print_info(f"Analyzing: {fec_file}\n", indent=2)
         logger.info(f"Starting FEC file analysis: {fec_file}")
 
-        parser = FECParser(fec_file)
-        entries = parser.parse()
+        if quick:
+            probe = FECParser(fec_file, amount_mode=settings.AMOUNT_MODE).probe(sample_rows=5)
+            rows = f"{probe.estimated_rows:,}" if probe.estimated_rows is not None else "unknown"
+            print_section("File Information (sampled)", indent=2)
+            label = "Entries" if probe.exact else "Estimated entries"
+            console.print(f"  {label}: [cyan]{rows}[/cyan]")
+            console.print(f"  Fiscal years: [magenta]{probe.years}[/magenta]")
+            console.print(f"  Encoding: [yellow]{probe.encoding}[/yellow]")
+            console.print(f"  Delimiter: [yellow]{repr(probe.delimiter)}[/yellow]")
+            console.print(f"  Date format: [yellow]{probe.date_format}[/yellow]")
+            console.print(f"  Columns: {probe.columns}")
+            if probe.sample_errors:
+                console.print(
+                    f"  [red]{probe.sample_errors} of {probe.sampled_rows} "
+                    "sampled rows are invalid[/red]"
+                )
+            return
 
-        # Basic information
-        print_section("File Information", indent=2)
-        console.print(f"  Total entries: [cyan]{len(entries):,}[/cyan]")
-        console.print(f"  Fiscal years: [magenta]{sorted(set(e.fiscal_year for e in entries))}[/magenta]")
-        console.print(f"  Encoding: [yellow]{parser.encoding}[/yellow]")
-        console.print(f"  Delimiter: [yellow]{repr(parser.delimiter)}[/yellow]")
-        logger.info(f"File info: {len(entries)} entries, encoding={parser.encoding}")
+        parser = FECParser(fec_file, amount_mode=settings.AMOUNT_MODE, cache=PARSE_CACHE)
+        if stream:
+            entries = parser.iter_entries()
+        else:
+            entries = parser.parse_with_mode(settings.PARSE_MODE).entries
 
-        # Account classes distribution
-        print_section("Account Distribution", indent=2)
+        entry_count = 0
+        years = set()
+        samples = []
         class_counts = {}
         class_totals = {}
         for entry in entries:
+            entry_count += 1
+            years.add(entry.fiscal_year)
+            if len(samples) < 5:
+                samples.append(entry)
             cls = entry.account_class
             class_counts[cls] = class_counts.get(cls, 0) + 1
             class_totals[cls] = class_totals.get(cls, Decimal("0")) + (entry.debit - entry.credit)
 
+        # Basic information
+        print_section("File Information", indent=2)
+        console.print(f"  Total entries: [cyan]{entry_count:,}[/cyan]")
+        console.print(f"  Fiscal years: [magenta]{sorted(years)}[/magenta]")
+        console.print(f"  Encoding: [yellow]{parser.encoding}[/yellow]")
+        console.print(f"  Delimiter: [yellow]{repr(parser.delimiter)}[/yellow]")
+        logger.info(f"File info: {entry_count} entries, encoding={parser.encoding}")
+
+        # Account classes distribution
+        print_section("Account Distribution", indent=2)
+
         from rich.table import Table
         table = Table(show_header=True, header_style="bold cyan")
         table.add_column("Account Class", style="cyan")
@@ -447,7 +514,7 @@ def analyze(fec_file: str):
         sample_table.add_column("Debit", justify="right")
         sample_table.add_column("Credit", justify="right")
 
-        for entry in entries[:5]:
+        for entry in samples:
             sample_table.add_row(
                 str(entry.date),
                 entry.account_num,
@@ -565,7 +632,8 @@ def template(
     all_entries = []
     for fec_file in fec_files:
         click.echo(f"  Parsing: {fec_file}")
-        parser = FECParser(fec_file)
+        # Keep JournalCode, PieceRef... for the template's FEC sheet
+        parser = FECParser(fec_file, amount_mode=settings.AMOUNT_MODE, details=True)
         entries = parser.parse()
         all_entries.extend(entries)
         click.echo(f"    → {len(entries)} entries loaded")
@@ -593,5 +661,274 @@ def template(
     click.echo("\nDone!")
 
 
+# Delimiters accepted by --delimiter (names are easier to type than a tab)
+DELIMITERS = {"tab": "\t", "pipe": "|", "semicolon": ";", "comma": ","}
+
+
+def _synthetic_options(func):
+    """Generator options shared by generate-fec and benchmark.
+
+    benchmarks.synthetic is only imported when one of them runs, so
+    --amount-format is checked by generate_fec() rather than click.
+    """
+    options = [
+        click.option("--rows", "-r", type=int, default=1_000_000, show_default=True,
+                     help="Number of entry lines (up to 10M and more)."),
+        click.option("--years", "-y", default="2024", show_default=True,
+                     help="Fiscal years covered (comma-separated)."),
+        click.option("--encoding", default="utf-8", show_default=True,
+                     help="Text encoding (utf-8, cp1252, latin-1...)."),
+        click.option("--delimiter", type=click.Choice(list(DELIMITERS)), default="tab",
+                     show_default=True, help="Field delimiter."),
+        click.option("--date-format", default="%Y%m%d", show_default=True,
+                     help="strftime format of dates."),
+        click.option("--amount-format", default="comma", show_default=True,
+                     help="Amount format (comma, dot, space, nbsp, dot_thousands)."),
+        click.option("--seed", type=int, default=0, show_default=True, help="Random seed."),
+    ]
+    for option in reversed(options):
+        func = option(func)
+    return func
+
+
+@cli.command("generate-fec")
+@click.argument("output", type=click.Path())
+@_synthetic_options
+def generate_fec_command(
+    output: str, rows: int, years: str, encoding: str, delimiter: str,
+    date_format: str, amount_format: str, seed: int,
+):
+    """Write a synthetic FEC file (accounts from the PCG mapping).
+
+    OUTPUT may be a directory, in which case the file is named after the
+    last year (SIRENFECYYYY1231.txt) so the parser picks up its source year.
+    """
+    from benchmarks.synthetic import fec_filename, generate_fec
+
+    year_list = [int(y.strip()) for y in years.split(",")]
+    output_path = Path(output)
+    if output_path.is_dir():
+        output_path = output_path / fec_filename(max(year_list))
+
+    try:
+        generate_fec(
+            output_path, rows, years=year_list, encoding=encoding,
+            delimiter=DELIMITERS[delimiter], date_format=date_format,
+            amount_format=amount_format, seed=seed,
+        )
+    except (ValueError, LookupError) as e:
+        print_error(f"Generation failed: {e}")
+        sys.exit(1)
+    size_mb = output_path.stat().st_size / (1024 * 1024)
+    print_success(f"{output_path} ({rows:,} rows, {size_mb:,.1f} MB)")
+
+
+@cli.command()
+@_synthetic_options
+@click.option(
+    "--file",
+    "-f",
+    "fec_file",
+    type=click.Path(exists=True),
+    help="Benchmark an existing FEC file instead of a generated one.",
+)
+@click.option(
+    "--mode",
+    "-m",
+    "modes",
+    multiple=True,
+    help=(
+        "Parser mode(s) to run (csv, iter, columnar, bulk, mmap, stream, parallel, aggregate, "
+        "details). Default: all."
+    ),
+)
+@click.option(
+    "--repeat", type=int, default=1, show_default=True, help="Runs per mode (fastest kept)."
+)
+@click.option(
+    "--baseline",
+    type=click.Path(),
+    default=None,
+    help="Baselines JSON file (default: benchmarks/parser_baselines.json).",
+)
+@click.option("--save-baseline", is_flag=True, help="Store the results as the new baseline.")
+@click.option(
+    "--tolerance",
+    type=float,
+    default=None,
+    help="Accepted relative slowdown or memory growth before failing (default: 0.15).",
+)
+def benchmark(
+    rows: int, years: str, encoding: str, delimiter: str, date_format: str,
+    amount_format: str, seed: int, fec_file: Optional[str], modes: tuple, repeat: int,
+    baseline: Optional[str], save_baseline: bool, tolerance: Optional[float],
+):
+    """Measure parser throughput (rows/s, MB/s) and peak RSS in every mode.
+
+    Results are compared with the stored baseline of the same input profile;
+    the command exits with status 1 if a mode regressed beyond the tolerance.
+    """
+    import tempfile
+
+    from benchmarks import parser_benchmark as bench
+    from benchmarks.synthetic import fec_filename, generate_fec
+
+    baseline_path = Path(baseline) if baseline else bench.DEFAULT_BASELINE_PATH
+    tolerance = bench.DEFAULT_TOLERANCE if tolerance is None else tolerance
+
+    try:
+        names = bench.benchmark_names(modes or None)
+    except ValueError as e:
+        print_error(str(e))
+        sys.exit(1)
+    # Baselines and regressions are ratios to the reference benchmark
+    if bench.REFERENCE_BENCHMARK not in names:
+        names.insert(0, bench.REFERENCE_BENCHMARK)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        if fec_file:
+            file_path = Path(fec_file)
+            profile = f"file:{file_path.name}:{file_path.stat().st_size}"
+        else:
+            year_list = [int(y.strip()) for y in years.split(",")]
+            file_path = Path(tmp) / fec_filename(max(year_list))
+            profile = (f"synthetic:rows={rows}:years={years}:encoding={encoding}:"
+                       f"delimiter={delimiter}:date={date_format}:amount={amount_format}:seed={seed}")
+            print_info(f"Generating {rows:,} rows...", indent=2)
+            try:
+                generate_fec(
+                    file_path, rows, years=year_list, encoding=encoding,
+                    delimiter=DELIMITERS[delimiter], date_format=date_format,
+                    amount_format=amount_format, seed=seed,
+                )
+            except (ValueError, LookupError) as e:
+                print_error(f"Generation failed: {e}")
+                sys.exit(1)
+
+        print_info(f"Benchmarking {len(names)} mode(s) on {file_path.name}", indent=2)
+        try:
+            results = bench.run_benchmark(file_path, names, repeat=repeat)
+        except RuntimeError as e:
+            print_error(str(e))
+            sys.exit(1)
+
+    reference = bench.load_baselines(baseline_path).get(profile)
+    print_benchmark_table(results, bench.relative_results(results), reference)
+
+    if save_baseline:
+        bench.save_baseline(baseline_path, profile, results)
+        print_success(f"Baseline saved to {baseline_path}")
+        return
+    if reference is None:
+        print_info("No baseline for this profile (use --save-baseline)", indent=2)
+        return
+    if reference.get("environment") != bench.environment():
+        print_warning("Baseline recorded on another machine: ratios may differ", indent=2)
+
+    regressions = bench.find_regressions(results, reference, tolerance)
+    for regression in regressions:
+        print_warning(regression, indent=2)
+    if regressions:
+        print_error(f"{len(regressions)} regression(s) beyond {tolerance:.0%}")
+        sys.exit(1)
+    print_success(f"No regression beyond {tolerance:.0%}")
+
+
+# Bytes read per chunk when streaming files to the API
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def _post_files(url: str, api_key: str, file_paths: List[Path]) -> dict:
+    """POST files as multipart/form-data (field ``files``) and return the JSON reply.
+
+    Files are streamed from disk in chunks, so memory does not grow with
+    their size.
+    """
+    import urllib.request
+    import uuid
+
+    boundary = uuid.uuid4().hex
+    heads = [
+        (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="files"; filename="{path.name}"\r\n'
+            "Content-Type: application/octet-stream\r\n\r\n"
+        ).encode()
+        for path in file_paths
+    ]
+    closing = f"--{boundary}--\r\n".encode()
+    length = sum(
+        len(head) + path.stat().st_size + 2 for head, path in zip(heads, file_paths)
+    ) + len(closing)
+
+    def body():
+        for head, path in zip(heads, file_paths):
+            yield head
+            with open(path, "rb") as f:
+                while chunk := f.read(UPLOAD_CHUNK_SIZE):
+                    yield chunk
+            yield b"\r\n"
+        yield closing
+
+    request = urllib.request.Request(
+        url,
+        data=body(),
+        method="POST",
+        headers={
+            "Content-Type": f"multipart/form-data; boundary={boundary}",
+            "Content-Length": str(length),
+            "X-API-Key": api_key,
+        },
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+@cli.command("session-add")
+@click.argument("session_id")
+@click.argument("fec_files", nargs=-1, required=True, type=click.Path(exists=True))
+@click.option(
+    "--api-url",
+    default=None,
+    help="Base URL of the running API (default: http://API_HOST:API_PORT).",
+)
+@click.option(
+    "--api-key",
+    default=None,
+    help="API key (default: API_KEY setting).",
+)
+def session_add(session_id: str, fec_files: tuple, api_url: Optional[str], api_key: Optional[str]):
+    """Add FEC file(s), e.g. a new fiscal year, to an existing API session.
+
+    Only the new files are parsed by the server; statements of the years
+    they touch (and later balance sheets) are recomputed.
+    """
+    import urllib.error
+
+    base_url = (api_url or f"http://{settings.API_HOST}:{settings.API_PORT}").rstrip("/")
+    url = f"{base_url}/api/session/{session_id}/files"
+    try:
+        print_info(f"Adding {len(fec_files)} file(s) to session {session_id}", indent=2)
+        result = _post_files(url, api_key or settings.API_KEY, [Path(f) for f in fec_files])
+    except urllib.error.HTTPError as e:
+        try:
+            detail = json.loads(e.read()).get("detail", e.reason)
+        except ValueError:
+            detail = e.reason
+        print_error(f"Adding files failed ({e.code}): {detail}")
+        sys.exit(1)
+    except urllib.error.URLError as e:
+        print_error(f"Cannot reach API at {base_url}: {e.reason}")
+        sys.exit(1)
+
+    for added in result["files"]:
+        print_success(f"{added['filename']}: {added['entries']:,} entries", indent=2)
+    print_info(f"Session entries: {result['total_entries']:,}", indent=2)
+    print_info(f"Years: {result['years']}", indent=2)
+    print_info(f"Recomputed years: {result['affected_years']}", indent=2)
+    if result["reprocessed"]:
+        print_info("Processed data refreshed", indent=2)
+
+
 if __name__ == "__main__":
     cli()
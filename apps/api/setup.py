@@ -10,6 +10,7 @@ setup(
         "fastapi>=0.109.0",
         "uvicorn[standard]>=0.27.0",
         "pandas>=2.0",
+        "numpy>=1.24",
         "openpyxl>=3.1",
         "jinja2>=3.1",
         "pyyaml>=6.0",
@@ -22,4 +23,7 @@ setup(
         "rich>=13.0",
         "anthropic>=0.25.0",
     ],
+    extras_require={
+        "zstd": ["zstandard>=0.21"],
+    },
 )
@@ -12,6 +12,7 @@ import time
 from pathlib import Path
 
 from config.settings import settings
+from src.parser.cache import PARSE_CACHE_DIRNAME
 
 logger = logging.getLogger(__name__)
 
@@ -38,7 +39,7 @@ def cleanup_old_sessions() -> int:
 
         # Iterate through session directories
         for session_dir in session_root.iterdir():
-            if not session_dir.is_dir():
+            if not session_dir.is_dir() or session_dir.name == PARSE_CACHE_DIRNAME:
                 continue
 
             # Check if directory is older than TTL
@@ -228,6 +228,55 @@ def print_file_info_table(files_info: List[Dict[str, Any]]) -> None:
     console.print(table)
 
 
+def print_benchmark_table(
+    results: List[Any],
+    relative: Optional[Dict[str, Dict[str, Any]]] = None,
+    baseline: Optional[Dict[str, Any]] = None,
+) -> None:
+    """
+    Print parser benchmark results, with the change against a baseline.
+
+    Args:
+        results: BenchmarkResult list
+        relative: Optional speed ratios by mode (see relative_results())
+        baseline: Optional baseline profile of the same ratios
+            (see benchmarks.parser_benchmark)
+    """
+    relative = relative or {}
+    reference = (baseline or {}).get("results", {})
+    table = Table(title="Parser Benchmark", show_header=True, header_style="bold cyan")
+
+    table.add_column("Mode", style="cyan")
+    table.add_column("Rows", justify="right")
+    table.add_column("Seconds", justify="right")
+    table.add_column("Rows/s", justify="right")
+    table.add_column("MB/s", justify="right")
+    table.add_column("Peak RSS (MB)", justify="right")
+    table.add_column("Speed Ratio", justify="right")
+    table.add_column("vs Baseline", justify="right")
+
+    for result in results:
+        ratio = relative.get(result.mode, {}).get("speed")
+        base = reference.get(result.mode)
+        change = ""
+        if ratio is not None and base and base.get("speed"):
+            delta = ratio / base["speed"] - 1
+            color = "green" if delta >= 0 else "red"
+            change = f"[{color}]{delta:+.1%}[/{color}]"
+        table.add_row(
+            result.mode,
+            f"{result.rows:,}",
+            f"{result.seconds:.2f}",
+            f"{result.rows_per_sec:,.0f}",
+            f"{result.mb_per_sec:.1f}",
+            f"{result.peak_rss_mb:,.0f}" if result.peak_rss_mb is not None else "n/a",
+            f"{ratio:.2f}x" if ratio is not None else "",
+            change,
+        )
+
+    console.print(table)
+
+
 # =============================================================================
 # Progress Functions
 # =============================================================================
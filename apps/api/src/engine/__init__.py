@@ -5,6 +5,8 @@ from .cashflow_builder import CashFlowBuilder
 from .monthly_builder import MonthlyBuilder
 from .variance_builder import VarianceBuilder
 from .detail_builder import DetailBuilder
+from .statement_cache import StatementCache
+from .fused_builder import FusedBuilder, FusedResult
 
 __all__ = [
     "PLBuilder",
@@ -14,4 +16,7 @@ __all__ = [
     "MonthlyBuilder",
     "VarianceBuilder",
     "DetailBuilder",
+    "StatementCache",
+    "FusedBuilder",
+    "FusedResult",
 ]
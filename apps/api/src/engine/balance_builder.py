@@ -1,14 +1,89 @@
 """Balance sheet builder from FEC entries."""
 
+from bisect import bisect_right
 from collections import defaultdict
 from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from src.mapper.account_mapper import AccountMapper
-from src.models.entry import JournalEntry
+from src.models.entry import Amount, JournalEntry, amount_accessors
 from src.models.financials import BalanceSheet, TracedValue
 
 
+class BalanceMovements:
+    """Balance sheet movements per effective year, with their traces.
+
+    Movements are added in entry order. Each trace tuple is created once and
+    shared by the balance sheets of its year and of every later year.
+    """
+
+    def __init__(self, to_decimal):
+        self.to_decimal = to_decimal
+        self.years = set()
+        # year -> category -> total movement of the year
+        self.totals: Dict[int, Dict[str, Amount]] = defaultdict(lambda: defaultdict(int))
+        # category -> [years, entry indexes, traces, years in order]
+        self._traces: Dict[str, list] = {}
+        self._count = 0
+
+    def add(
+        self, year: int, category: str, amount: Amount, trace: Tuple[str, str, str, Decimal]
+    ) -> None:
+        """Add the movement of one entry."""
+        self.totals[year][category] += amount
+        traced = self._traces.get(category)
+        if traced is None:
+            traced = self._traces[category] = [[], [], [], True]
+        years, indexes, traces, ordered = traced
+        if ordered and years and year < years[-1]:
+            traced[3] = False
+        years.append(year)
+        indexes.append(self._count)
+        traces.append(trace)
+        self._count += 1
+
+    def cumulate(self, years: List[int]) -> List[BalanceSheet]:
+        """Balance sheets at the end of ``years`` (sorted, any subset), as running sums.
+
+        Totals cost O(years x categories). Trace lists keep entry order;
+        when a category's entries come in year order (the usual case) each
+        list is a slice up to the year.
+        """
+        sheets = []
+        running: Dict[str, Amount] = {}
+        pending = sorted(self.totals)
+        position = 0
+        for year in years:
+            # Add the movements of every year up to this one (including
+            # years not asked for)
+            while position < len(pending) and pending[position] <= year:
+                for category, amount in self.totals[pending[position]].items():
+                    running[category] = running.get(category, 0) + amount
+                position += 1
+
+            # Categories in the order of their first entry up to the year,
+            # like BalanceBuilder.build()
+            kept = []
+            for category, (cat_years, indexes, traces, ordered) in self._traces.items():
+                if ordered:
+                    count = bisect_right(cat_years, year)
+                    if count:
+                        kept.append((indexes[0], category, traces[:count]))
+                else:
+                    picked = [i for i, y in enumerate(cat_years) if y <= year]
+                    if picked:
+                        kept.append((indexes[picked[0]], category, [traces[i] for i in picked]))
+            kept.sort(key=lambda item: item[0])
+
+            sheets.append(BalanceBuilder.from_totals(
+                year,
+                {category: running[category] for _, category, _ in kept},
+                {category: TracedValue(entries=entries) for _, category, entries in kept},
+                self.to_decimal,
+            ))
+        return sheets
+
+
 class BalanceBuilder:
     """Build balance sheets from journal entries."""
 
@@ -26,32 +101,51 @@ class BalanceBuilder:
         # Filter entries up to and including the year using effective_year
         # This ensures correct cumulation when loading FECs from different years
         year_entries = [e for e in entries if e.effective_year <= year]
+        return self.movements(year_entries).cumulate([year])[0]
 
-        # Aggregate by category + track traces
-        totals: Dict[str, Decimal] = defaultdict(Decimal)
-        traces: Dict[str, TracedValue] = defaultdict(lambda: TracedValue())
+    def movements(self, entries: List[JournalEntry]) -> BalanceMovements:
+        """Balance sheet movements of ``entries`` per effective year (one pass)."""
+        # Integer cents entries are aggregated as int and converted at the end
+        debit_of, credit_of, to_decimal = amount_accessors(entries)
+        movements = BalanceMovements(to_decimal)
 
-        for entry in year_entries:
+        for entry in entries:
+            movements.years.add(entry.effective_year)
             category = self.mapper.get_balance_category(entry.account_num)
             if category:
                 # Determine sign based on account nature
                 if self.mapper.is_debit_positive(entry.account_num):
                     # Assets: debit is positive
-                    amount = entry.debit - entry.credit
+                    amount = debit_of(entry) - credit_of(entry)
                 else:
                     # Liabilities: credit is positive
-                    amount = entry.credit - entry.debit
-
-                totals[category] += amount
+                    amount = credit_of(entry) - debit_of(entry)
 
                 # Track this entry in the trace (Phase A)
                 entry_tuple: Tuple[str, str, str, Decimal] = (
                     entry.date.isoformat(),
                     entry.account_num,
                     entry.label,
-                    amount
+                    to_decimal(amount)
                 )
-                traces[category].add(amount, entry_tuple)
+                movements.add(entry.effective_year, category, amount, entry_tuple)
+
+        return movements
+
+    @staticmethod
+    def from_totals(
+        year: int,
+        totals: Dict[str, Amount],
+        traces: Dict[str, TracedValue],
+        to_decimal,
+    ) -> BalanceSheet:
+        """Build a balance sheet from category totals and traces.
+
+        Totals are in the unit of ``to_decimal``.
+        """
+        totals = {category: to_decimal(total) for category, total in totals.items()}
+        for category, traced_value in traces.items():
+            traced_value.value = totals[category]
 
         # Build BalanceSheet object
         bs = BalanceSheet(
@@ -78,9 +172,11 @@ class BalanceBuilder:
         """Build balance sheets for all years in the data.
 
         Uses effective_year for correct grouping when source_year is available.
+        Movements are summed per year in one pass; each year-end balance
+        sheet is then the running sum of the movements up to its year.
         """
-        years = sorted(set(e.effective_year for e in entries))
-        return [self.build(entries, year) for year in years]
+        movements = self.movements(entries)
+        return movements.cumulate(sorted(movements.years))
 
     def compute_bfr_evolution(self, balance_list: List[BalanceSheet]) -> List[Dict]:
         """Compute BFR (Working Capital) evolution."""
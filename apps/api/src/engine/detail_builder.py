@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from src.mapper.account_mapper import AccountMapper
-from src.models.entry import JournalEntry
+from src.models.entry import JournalEntry, amount_accessors
 
 
 class DetailBuilder:
@@ -22,21 +22,27 @@ class DetailBuilder:
 
         Returns: {year: [{account, label, debit, credit, balance}, ...]}
         """
+        debit_of, credit_of, to_decimal = amount_accessors(entries)
+
         # Aggregate by year and account
         aggregated = defaultdict(lambda: defaultdict(lambda: {
-            "debit": Decimal("0"),
-            "credit": Decimal("0"),
+            "debit": 0,
+            "credit": 0,
             "label": "",
         }))
 
         for entry in entries:
             year = entry.fiscal_year
             account = entry.account_num
-            aggregated[year][account]["debit"] += entry.debit
-            aggregated[year][account]["credit"] += entry.credit
+            aggregated[year][account]["debit"] += debit_of(entry)
+            aggregated[year][account]["credit"] += credit_of(entry)
             if not aggregated[year][account]["label"]:
                 aggregated[year][account]["label"] = entry.label
 
+        return self.account_summary_from(aggregated, to_decimal)
+
+    def account_summary_from(self, aggregated: Dict, to_decimal) -> Dict[int, List[Dict]]:
+        """Account summary from {year: {account: {debit, credit, label}}} totals."""
         # Convert to list format
         result = {}
         for year, accounts in aggregated.items():
@@ -47,9 +53,9 @@ class DetailBuilder:
                     "account": account,
                     "label": data["label"],
                     "category": category or "Non classé",
-                    "debit": data["debit"],
-                    "credit": data["credit"],
-                    "balance": data["debit"] - data["credit"],
+                    "debit": to_decimal(data["debit"]),
+                    "credit": to_decimal(data["credit"]),
+                    "balance": to_decimal(data["debit"] - data["credit"]),
                 })
 
         return result
@@ -73,13 +79,15 @@ class DetailBuilder:
             if e.fiscal_year == year and e.account_num.startswith(class_filter)
         ]
 
+        debit_of, credit_of, to_decimal = amount_accessors(year_entries)
+
         # Aggregate by account
-        account_totals = defaultdict(lambda: {"total": Decimal("0"), "label": ""})
+        account_totals = defaultdict(lambda: {"total": 0, "label": ""})
         for entry in year_entries:
             if account_type == "expense":
-                amount = entry.debit - entry.credit
+                amount = debit_of(entry) - credit_of(entry)
             else:
-                amount = entry.credit - entry.debit
+                amount = credit_of(entry) - debit_of(entry)
 
             account_totals[entry.account_num]["total"] += amount
             if not account_totals[entry.account_num]["label"]:
@@ -96,7 +104,7 @@ class DetailBuilder:
             {
                 "account": acc,
                 "label": data["label"],
-                "amount": data["total"],
+                "amount": to_decimal(data["total"]),
                 "category": self.mapper.get_category(acc) or "Non classé",
             }
             for acc, data in sorted_accounts
@@ -111,9 +119,10 @@ class DetailBuilder:
         Returns: {category: {total, count, accounts: [...]}}
         """
         year_entries = [e for e in entries if e.fiscal_year == year]
+        debit_of, credit_of, to_decimal = amount_accessors(year_entries)
 
         categories = defaultdict(lambda: {
-            "total": Decimal("0"),
+            "total": 0,
             "count": 0,
             "accounts": set(),
         })
@@ -123,18 +132,19 @@ class DetailBuilder:
             if category:
                 # Determine sign based on account class
                 if entry.account_num[0] in ("6",):  # Expenses
-                    amount = entry.debit - entry.credit
+                    amount = debit_of(entry) - credit_of(entry)
                 elif entry.account_num[0] in ("7",):  # Revenue
-                    amount = entry.credit - entry.debit
+                    amount = credit_of(entry) - debit_of(entry)
                 else:  # Balance sheet
-                    amount = entry.debit - entry.credit
+                    amount = debit_of(entry) - credit_of(entry)
 
                 categories[category]["total"] += amount
-                categories[category]["count"] += 1
+                categories[category]["count"] += entry.row_count
                 categories[category]["accounts"].add(entry.account_num)
 
-        # Convert sets to lists
+        # Convert totals to Decimal and sets to lists
         for cat in categories:
+            categories[cat]["total"] = to_decimal(categories[cat]["total"])
             categories[cat]["accounts"] = sorted(categories[cat]["accounts"])
 
         return dict(categories)
@@ -148,7 +158,27 @@ class DetailBuilder:
         Groups accounts under their P&L categories.
         """
         year_entries = [e for e in entries if e.fiscal_year == year]
+        debit_of, credit_of, to_decimal = amount_accessors(year_entries)
+
+        # Aggregate by account within each category
+        account_data = defaultdict(lambda: defaultdict(lambda: {
+            "debit": 0,
+            "credit": 0,
+            "label": "",
+        }))
+
+        for entry in year_entries:
+            category = self.mapper.get_pl_category(entry.account_num)
+            if category:
+                account_data[category][entry.account_num]["debit"] += debit_of(entry)
+                account_data[category][entry.account_num]["credit"] += credit_of(entry)
+                if not account_data[category][entry.account_num]["label"]:
+                    account_data[category][entry.account_num]["label"] = entry.label
 
+        return self.pl_detail_from(account_data, to_decimal)
+
+    def pl_detail_from(self, account_data: Dict, to_decimal) -> List[Dict]:
+        """Detailed P&L from {category: {account: {debit, credit, label}}} totals."""
         # Define P&L structure
         pl_structure = [
             ("Chiffre d'affaires", "revenue"),
@@ -165,25 +195,10 @@ class DetailBuilder:
             ("Produits exceptionnels", "exceptional_income"),
         ]
 
-        # Aggregate by account within each category
-        account_data = defaultdict(lambda: defaultdict(lambda: {
-            "debit": Decimal("0"),
-            "credit": Decimal("0"),
-            "label": "",
-        }))
-
-        for entry in year_entries:
-            category = self.mapper.get_pl_category(entry.account_num)
-            if category:
-                account_data[category][entry.account_num]["debit"] += entry.debit
-                account_data[category][entry.account_num]["credit"] += entry.credit
-                if not account_data[category][entry.account_num]["label"]:
-                    account_data[category][entry.account_num]["label"] = entry.label
-
         # Build result
         result = []
         for label, category in pl_structure:
-            category_total = Decimal("0")
+            category_total = 0
             account_details = []
 
             for account, data in sorted(account_data.get(category, {}).items()):
@@ -197,13 +212,13 @@ class DetailBuilder:
                 account_details.append({
                     "account": account,
                     "label": data["label"],
-                    "amount": amount,
+                    "amount": to_decimal(amount),
                 })
 
             result.append({
                 "category_label": label,
                 "category": category,
-                "total": category_total,
+                "total": to_decimal(category_total) if account_details else Decimal("0"),
                 "accounts": account_details,
             })
 
@@ -250,7 +265,27 @@ class DetailBuilder:
         Groups accounts under their balance sheet categories.
         """
         year_entries = [e for e in entries if e.effective_year <= year]
+        debit_of, credit_of, to_decimal = amount_accessors(year_entries)
 
+        # Aggregate by account within each category
+        account_data = defaultdict(lambda: defaultdict(lambda: {
+            "debit": 0,
+            "credit": 0,
+            "label": "",
+        }))
+
+        for entry in year_entries:
+            category = self.mapper.get_balance_category(entry.account_num)
+            if category:
+                account_data[category][entry.account_num]["debit"] += debit_of(entry)
+                account_data[category][entry.account_num]["credit"] += credit_of(entry)
+                if not account_data[category][entry.account_num]["label"]:
+                    account_data[category][entry.account_num]["label"] = entry.label
+
+        return self.balance_detail_from(account_data, to_decimal)
+
+    def balance_detail_from(self, account_data: Dict, to_decimal) -> List[Dict]:
+        """Detailed balance sheet from {category: {account: {debit, credit, label}}} totals."""
         # Define balance sheet structure
         balance_structure = [
             ("ACTIF", None),
@@ -267,21 +302,6 @@ class DetailBuilder:
             ("Autres dettes", "other_payables"),
         ]
 
-        # Aggregate by account within each category
-        account_data = defaultdict(lambda: defaultdict(lambda: {
-            "debit": Decimal("0"),
-            "credit": Decimal("0"),
-            "label": "",
-        }))
-
-        for entry in year_entries:
-            category = self.mapper.get_balance_category(entry.account_num)
-            if category:
-                account_data[category][entry.account_num]["debit"] += entry.debit
-                account_data[category][entry.account_num]["credit"] += entry.credit
-                if not account_data[category][entry.account_num]["label"]:
-                    account_data[category][entry.account_num]["label"] = entry.label
-
         # Build result
         result = []
         for label, category in balance_structure:
@@ -296,7 +316,7 @@ class DetailBuilder:
                 })
                 continue
 
-            category_total = Decimal("0")
+            category_total = 0
             account_details = []
 
             for account, data in sorted(account_data.get(category, {}).items()):
@@ -310,13 +330,13 @@ class DetailBuilder:
                 account_details.append({
                     "account": account,
                     "label": data["label"],
-                    "amount": amount,
+                    "amount": to_decimal(amount),
                 })
 
             result.append({
                 "category_label": label,
                 "category": category,
-                "total": category_total,
+                "total": to_decimal(category_total) if account_details else Decimal("0"),
                 "accounts": account_details,
                 "is_section": False,
             })
@@ -333,19 +353,27 @@ class DetailBuilder:
 
         Returns accounts sorted by total debit+credit volume.
         """
+        debit_of, credit_of, to_decimal = amount_accessors(entries)
+
         # Aggregate by account across all years
         account_totals = defaultdict(lambda: {
-            "total_debit": Decimal("0"),
-            "total_credit": Decimal("0"),
+            "total_debit": 0,
+            "total_credit": 0,
             "label": "",
         })
 
         for entry in entries:
-            account_totals[entry.account_num]["total_debit"] += entry.debit
-            account_totals[entry.account_num]["total_credit"] += entry.credit
+            account_totals[entry.account_num]["total_debit"] += debit_of(entry)
+            account_totals[entry.account_num]["total_credit"] += credit_of(entry)
             if not account_totals[entry.account_num]["label"]:
                 account_totals[entry.account_num]["label"] = entry.label
 
+        return self.top_accounts_all_years_from(account_totals, to_decimal, top_n)
+
+    def top_accounts_all_years_from(
+        self, account_totals: Dict, to_decimal, top_n: int = 10
+    ) -> List[Dict]:
+        """Top accounts from {account: {total_debit, total_credit, label}} totals."""
         # Sort by total volume (debit + credit)
         sorted_accounts = sorted(
             account_totals.items(),
@@ -357,9 +385,9 @@ class DetailBuilder:
             {
                 "account_num": acc,
                 "label": data["label"],
-                "total_debit": data["total_debit"],
-                "total_credit": data["total_credit"],
-                "volume": data["total_debit"] + data["total_credit"],
+                "total_debit": to_decimal(data["total_debit"]),
+                "total_credit": to_decimal(data["total_credit"]),
+                "volume": to_decimal(data["total_debit"] + data["total_credit"]),
                 "category": self.mapper.get_category(acc) or "Non classé",
             }
             for acc, data in sorted_accounts
@@ -373,24 +401,30 @@ class DetailBuilder:
 
         Returns: {category: {debit, credit, balance}}
         """
+        debit_of, credit_of, to_decimal = amount_accessors(entries)
         categories = defaultdict(lambda: {
-            "debit": Decimal("0"),
-            "credit": Decimal("0"),
+            "debit": 0,
+            "credit": 0,
         })
 
         for entry in entries:
             category = self.mapper.get_category(entry.account_num)
             if category:
-                categories[category]["debit"] += entry.debit
-                categories[category]["credit"] += entry.credit
+                categories[category]["debit"] += debit_of(entry)
+                categories[category]["credit"] += credit_of(entry)
+
+        return self.category_breakdown_all_years_from(categories, to_decimal)
 
+    @staticmethod
+    def category_breakdown_all_years_from(categories: Dict, to_decimal) -> Dict[str, Dict]:
+        """Category breakdown from {category: {debit, credit}} totals."""
         # Add balance calculation
         result = {}
         for category, data in categories.items():
             result[category] = {
-                "debit": data["debit"],
-                "credit": data["credit"],
-                "balance": data["debit"] - data["credit"],
+                "debit": to_decimal(data["debit"]),
+                "credit": to_decimal(data["credit"]),
+                "balance": to_decimal(data["debit"] - data["credit"]),
             }
 
         return result
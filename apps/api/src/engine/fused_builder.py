@@ -0,0 +1,250 @@
+"""Single-pass builder of the statements, monthly and detail views of /api/process."""
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from decimal import Decimal
+from typing import Dict, List, Optional, Tuple
+
+from src.mapper.account_mapper import AccountMapper
+from src.models.cube import AccountCube
+from src.models.entry import Amount, JournalEntry, amount_accessors, cents_to_decimal
+from src.models.financials import BalanceSheet, ProfitLoss, TracedValue
+
+from .balance_builder import BalanceMovements
+from .detail_builder import DetailBuilder
+from .monthly_builder import MonthlyBuilder
+from .pl_builder import PLBuilder
+
+# Totals of one (fiscal year, effective year, month, account) cell, and of
+# groups of cells: [debit, credit, label, index of the entry giving the label].
+# The label is the first non-empty one, as in the builders.
+Cell = list
+
+
+def _merge(group: Dict[str, Cell], account: str, cell: Cell) -> None:
+    """Add a cell to an account's totals, keeping the earliest label."""
+    row = group.get(account)
+    if row is None:
+        group[account] = list(cell)
+        return
+    row[0] += cell[0]
+    row[1] += cell[1]
+    if cell[2] and (not row[2] or cell[3] < row[3]):
+        row[2], row[3] = cell[2], cell[3]
+
+
+def _accounts(
+    group: Dict[str, Cell], debit: str = "debit", credit: str = "credit"
+) -> Dict[str, Dict]:
+    """Account totals in the shape the builders aggregate them."""
+    return {
+        account: {debit: row[0], credit: row[1], "label": row[2]}
+        for account, row in group.items()
+    }
+
+
+@dataclass
+class FusedResult:
+    """Everything FusedBuilder.build() computed.
+
+    ``pl_list`` and ``balance_list`` are None unless statements were built;
+    monthly and detail fields are empty unless views were built.
+    """
+    years: List[int]                                  # fiscal years of the entries
+    pl_list: Optional[List[ProfitLoss]] = None
+    balance_list: Optional[List[BalanceSheet]] = None
+    monthly_revenue: Dict[int, Dict[int, Decimal]] = field(default_factory=dict)
+    monthly_costs: Dict[int, Dict[int, Decimal]] = field(default_factory=dict)
+    detail_data: Dict[str, object] = field(default_factory=dict)
+
+
+class FusedBuilder:
+    """Build what /api/process needs from one pass over the entries.
+
+    Running PLBuilder (one scan per year), BalanceBuilder, the
+    MonthlyBuilder methods and the DetailBuilder views separately reads
+    every entry 10+ times. Here each entry is read once: it feeds the P&L
+    and balance totals and traces of its effective year, and one
+    (fiscal year, effective year, month, account) cell from which the
+    monthly and detail views are then derived. Accounts are categorized
+    once each. Results are formatted by the builders themselves and are
+    the same as theirs.
+
+    Given the AccountCube of the entries, the views are derived from its
+    cells instead, and the entries are only read for the statements.
+    """
+
+    def __init__(self, mapper: AccountMapper):
+        self.mapper = mapper
+        self.detail_builder = DetailBuilder(mapper)
+
+    def build(
+        self,
+        entries: List[JournalEntry],
+        statements: bool = True,
+        views: bool = True,
+        top_n: int = 20,
+        cube: Optional[AccountCube] = None,
+    ) -> FusedResult:
+        """Aggregate ``entries`` in a single pass.
+
+        Args:
+            entries: Journal entries (Decimal or cents)
+            statements: Build P&L and balance sheets (with per-entry traces),
+                        as PLBuilder / BalanceBuilder.build_multi_year()
+            views: Build monthly revenue and costs and the detail views
+                   (account summary, top accounts, category breakdown, and
+                   P&L / balance detail of the latest year)
+            top_n: Number of top accounts
+            cube: AccountCube of ``entries`` to build the views from; the
+                  entries are then not read at all unless ``statements``
+        """
+        mapper = self.mapper
+        # account -> (category, P&L category, balance category, debit positive, income)
+        info: Dict[str, Tuple] = {}
+
+        def categorize(account: str) -> Tuple:
+            known = info[account] = (
+                mapper.get_category(account),
+                mapper.get_pl_category(account),
+                mapper.get_balance_category(account),
+                mapper.is_debit_positive(account),
+                account[:1] == "7",
+            )
+            return known
+
+        fiscal_years = set()
+        effective_years = set()
+        cells: Dict[Tuple[int, int, int, str], Cell] = {}
+        entry_views = views and cube is None
+        if statements or entry_views:
+            debit_of, credit_of, to_decimal = amount_accessors(entries)
+            pl_totals: Dict[int, Dict[str, Amount]] = defaultdict(lambda: defaultdict(int))
+            pl_traces: Dict[int, Dict[str, TracedValue]] = defaultdict(
+                lambda: defaultdict(TracedValue)
+            )
+            balance_movements = BalanceMovements(to_decimal)
+
+            for index, entry in enumerate(entries):
+                account = entry.account_num
+                known = info.get(account)
+                if known is None:
+                    known = categorize(account)
+                _, pl_category, balance_category, debit_positive, income = known
+                debit = debit_of(entry)
+                credit = credit_of(entry)
+                fiscal_years.add(entry.fiscal_year)
+
+                if statements:
+                    year = entry.effective_year
+                    effective_years.add(year)
+                    if pl_category:
+                        # For P&L: Credit increases income (7x), Debit increases expenses (6x)
+                        amount = credit - debit if income else debit - credit
+                        pl_totals[year][pl_category] += amount
+                        pl_traces[year][pl_category].entries.append(
+                            (entry.date.isoformat(), account, entry.label, to_decimal(amount))
+                        )
+                    if balance_category:
+                        # Assets: debit is positive, liabilities: credit is positive
+                        amount = debit - credit if debit_positive else credit - debit
+                        balance_movements.add(year, balance_category, amount, (
+                            entry.date.isoformat(), account, entry.label, to_decimal(amount)
+                        ))
+
+                if entry_views:
+                    key = (entry.fiscal_year, entry.effective_year, entry.date.month, account)
+                    cell = cells.get(key)
+                    if cell is None:
+                        cell = cells[key] = [0, 0, "", index]
+                    cell[0] += debit
+                    cell[1] += credit
+                    if not cell[2] and entry.label:
+                        cell[2], cell[3] = entry.label, index
+
+        result = FusedResult(years=cube.years if cube is not None else sorted(fiscal_years))
+        if statements:
+            years = sorted(effective_years)
+            result.pl_list = [
+                PLBuilder.from_totals(year, pl_totals[year], pl_traces[year], to_decimal)
+                for year in years
+            ]
+            result.balance_list = balance_movements.cumulate(years)
+        if views:
+            if cube is not None:
+                to_decimal = cents_to_decimal if cube.cents else _identity
+                for (account, effective_year, fiscal_year, month), debit, credit, _, first_seq, \
+                        label_seq, label in cube.iter_cells():
+                    if account not in info:
+                        categorize(account)
+                    cells[fiscal_year, effective_year, month, account] = [
+                        debit, credit, label, first_seq if label_seq is None else label_seq
+                    ]
+            self._views(result, cells, info, to_decimal, top_n)
+        return result
+
+    def _views(
+        self,
+        result: FusedResult,
+        cells: Dict[Tuple[int, int, int, str], Cell],
+        info: Dict[str, Tuple],
+        to_decimal,
+        top_n: int,
+    ) -> None:
+        """Derive the monthly and detail views from the cells."""
+        latest_year = result.years[-1] if result.years else None
+        cost_categories = MonthlyBuilder.COST_CATEGORIES
+        revenue = defaultdict(lambda: defaultdict(int))
+        costs = defaultdict(lambda: defaultdict(int))
+        summary: Dict[int, Dict[str, Cell]] = defaultdict(dict)
+        volumes: Dict[str, Cell] = {}
+        categories: Dict[str, Dict[str, Amount]] = {}
+        pl_detail: Dict[str, Dict[str, Cell]] = defaultdict(dict)
+        balance_detail: Dict[str, Dict[str, Cell]] = defaultdict(dict)
+
+        # Cells are in the order of their first entry, so groups are too
+        for (fiscal_year, effective_year, month, account), cell in cells.items():
+            category, pl_category, balance_category = info[account][:3]
+            debit, credit = cell[0], cell[1]
+            if pl_category == "revenue":
+                revenue[fiscal_year][month] += credit - debit
+            elif pl_category in cost_categories:
+                costs[fiscal_year][month] += debit - credit
+
+            _merge(summary[fiscal_year], account, cell)
+            _merge(volumes, account, cell)
+            if category:
+                totals = categories.setdefault(category, {"debit": 0, "credit": 0})
+                totals["debit"] += debit
+                totals["credit"] += credit
+            if pl_category and fiscal_year == latest_year:
+                _merge(pl_detail[pl_category], account, cell)
+            if balance_category and latest_year is not None and effective_year <= latest_year:
+                _merge(balance_detail[balance_category], account, cell)
+
+        result.monthly_revenue = MonthlyBuilder._to_decimal(revenue, to_decimal)
+        result.monthly_costs = MonthlyBuilder._to_decimal(costs, to_decimal)
+
+        details = self.detail_builder
+        result.detail_data = {
+            "account_summary": details.account_summary_from(
+                {year: _accounts(group) for year, group in summary.items()}, to_decimal
+            ),
+            "top_accounts": details.top_accounts_all_years_from(
+                _accounts(volumes, "total_debit", "total_credit"), to_decimal, top_n
+            ),
+            "category_breakdown": details.category_breakdown_all_years_from(categories, to_decimal),
+        }
+        if latest_year:
+            pl_accounts = {category: _accounts(group) for category, group in pl_detail.items()}
+            balance_accounts = {
+                category: _accounts(group) for category, group in balance_detail.items()
+            }
+            result.detail_data["pl_detail"] = details.pl_detail_from(pl_accounts, to_decimal)
+            result.detail_data["balance_detail"] = details.balance_detail_from(
+                balance_accounts, to_decimal
+            )
+
+
+def _identity(value: Decimal) -> Decimal:
+    return value
@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from src.mapper.account_mapper import AccountMapper
-from src.models.entry import JournalEntry
+from src.models.entry import Amount, JournalEntry, amount_accessors
 
 
 class MonthlyBuilder:
@@ -17,6 +17,10 @@ class MonthlyBuilder:
         9: "Septembre", 10: "Octobre", 11: "Novembre", 12: "Décembre"
     }
 
+    COST_CATEGORIES = frozenset({
+        "purchases", "external_charges", "taxes", "personnel", "other_charges"
+    })
+
     def __init__(self, mapper: AccountMapper):
         self.mapper = mapper
 
@@ -28,7 +32,8 @@ class MonthlyBuilder:
 
         Returns: {year: {month: revenue}}
         """
-        monthly = defaultdict(lambda: defaultdict(Decimal))
+        debit_of, credit_of, to_decimal = amount_accessors(entries)
+        monthly = defaultdict(lambda: defaultdict(int))
 
         for entry in entries:
             category = self.mapper.get_pl_category(entry.account_num)
@@ -36,10 +41,10 @@ class MonthlyBuilder:
                 year = entry.fiscal_year
                 month = entry.date.month
                 # Revenue: credit is positive
-                amount = entry.credit - entry.debit
+                amount = credit_of(entry) - debit_of(entry)
                 monthly[year][month] += amount
 
-        return dict(monthly)
+        return self._to_decimal(monthly, to_decimal)
 
     def build_monthly_costs(
         self, entries: List[JournalEntry]
@@ -49,10 +54,9 @@ class MonthlyBuilder:
 
         Returns: {year: {month: total_costs}}
         """
-        cost_categories = {
-            "purchases", "external_charges", "taxes", "personnel", "other_charges"
-        }
-        monthly = defaultdict(lambda: defaultdict(Decimal))
+        cost_categories = self.COST_CATEGORIES
+        debit_of, credit_of, to_decimal = amount_accessors(entries)
+        monthly = defaultdict(lambda: defaultdict(int))
 
         for entry in entries:
             category = self.mapper.get_pl_category(entry.account_num)
@@ -60,10 +64,22 @@ class MonthlyBuilder:
                 year = entry.fiscal_year
                 month = entry.date.month
                 # Costs: debit is positive
-                amount = entry.debit - entry.credit
+                amount = debit_of(entry) - credit_of(entry)
                 monthly[year][month] += amount
 
-        return dict(monthly)
+        return self._to_decimal(monthly, to_decimal)
+
+    @staticmethod
+    def _to_decimal(
+        monthly: Dict[int, Dict[int, Amount]], to_decimal
+    ) -> Dict[int, Dict[int, Decimal]]:
+        """Convert aggregated {year: {month: total}} amounts to Decimal."""
+        return {
+            year: defaultdict(
+                Decimal, {month: to_decimal(total) for month, total in months.items()}
+            )
+            for year, months in monthly.items()
+        }
 
     def build_monthly_ebitda(
         self, entries: List[JournalEntry]
@@ -73,9 +89,15 @@ class MonthlyBuilder:
 
         Returns: {year: {month: ebitda}}
         """
-        revenue = self.build_monthly_revenue(entries)
-        costs = self.build_monthly_costs(entries)
+        return self.ebitda_from(
+            self.build_monthly_revenue(entries), self.build_monthly_costs(entries)
+        )
 
+    @staticmethod
+    def ebitda_from(
+        revenue: Dict[int, Dict[int, Decimal]], costs: Dict[int, Dict[int, Decimal]]
+    ) -> Dict[int, Dict[int, Decimal]]:
+        """Monthly EBITDA from build_monthly_revenue() and build_monthly_costs() results."""
         monthly_ebitda = defaultdict(lambda: defaultdict(Decimal))
 
         # Get all years
@@ -97,7 +119,11 @@ class MonthlyBuilder:
 
         Returns: {year: {"Q1": revenue, "Q2": revenue, ...}}
         """
-        monthly_rev = self.build_monthly_revenue(entries)
+        return self.quarterly_from(self.build_monthly_revenue(entries))
+
+    @staticmethod
+    def quarterly_from(monthly_rev: Dict[int, Dict[int, Decimal]]) -> Dict[int, Dict[str, Decimal]]:
+        """Quarterly summary from a build_monthly_revenue() result."""
         quarterly = {}
 
         for year, months in monthly_rev.items():
@@ -118,7 +144,13 @@ class MonthlyBuilder:
 
         Returns: {year: {month: cumulative_revenue}}
         """
-        monthly_rev = self.build_monthly_revenue(entries)
+        return self.cumulative_from(self.build_monthly_revenue(entries))
+
+    @staticmethod
+    def cumulative_from(
+        monthly_rev: Dict[int, Dict[int, Decimal]]
+    ) -> Dict[int, Dict[int, Decimal]]:
+        """Cumulative revenue from a build_monthly_revenue() result."""
         cumulative = {}
 
         for year, months in monthly_rev.items():
@@ -138,8 +170,11 @@ class MonthlyBuilder:
 
         Returns: {month: index} where 100 = average month
         """
-        monthly_rev = self.build_monthly_revenue(entries)
+        return self.seasonality_from(self.build_monthly_revenue(entries))
 
+    @staticmethod
+    def seasonality_from(monthly_rev: Dict[int, Dict[int, Decimal]]) -> Dict[int, Decimal]:
+        """Seasonality index from a build_monthly_revenue() result."""
         if not monthly_rev:
             return {m: Decimal("100") for m in range(1, 13)}
 
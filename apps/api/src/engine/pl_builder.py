@@ -5,7 +5,7 @@ from decimal import Decimal
 from typing import Dict, List, Tuple
 
 from src.mapper.account_mapper import AccountMapper
-from src.models.entry import JournalEntry
+from src.models.entry import Amount, JournalEntry, amount_accessors
 from src.models.financials import ProfitLoss, TracedValue
 
 
@@ -20,8 +20,11 @@ class PLBuilder:
         # Filter entries for the year (use effective_year for consistency with balance sheet)
         year_entries = [e for e in entries if e.effective_year == year]
 
+        # Integer cents entries are aggregated as int and converted at the end
+        debit_of, credit_of, to_decimal = amount_accessors(year_entries)
+
         # Aggregate by category + track traces
-        totals: Dict[str, Decimal] = defaultdict(Decimal)
+        totals: Dict[str, Amount] = defaultdict(int)
         traces: Dict[str, TracedValue] = defaultdict(lambda: TracedValue())
 
         for entry in year_entries:
@@ -32,10 +35,10 @@ class PLBuilder:
 
                 if account_class == "7":
                     # Income accounts: credit is positive
-                    amount = entry.credit - entry.debit
+                    amount = credit_of(entry) - debit_of(entry)
                 else:
                     # Expense accounts: debit is positive
-                    amount = entry.debit - entry.credit
+                    amount = debit_of(entry) - credit_of(entry)
 
                 totals[category] += amount
 
@@ -44,9 +47,23 @@ class PLBuilder:
                     entry.date.isoformat(),
                     entry.account_num,
                     entry.label,
-                    amount
+                    to_decimal(amount)
                 )
-                traces[category].add(amount, entry_tuple)
+                traces[category].entries.append(entry_tuple)
+
+        return self.from_totals(year, totals, traces, to_decimal)
+
+    @staticmethod
+    def from_totals(
+        year: int,
+        totals: Dict[str, Amount],
+        traces: Dict[str, TracedValue],
+        to_decimal,
+    ) -> ProfitLoss:
+        """Build a P&L from category totals and traces (totals in the unit of ``to_decimal``)."""
+        totals = {category: to_decimal(total) for category, total in totals.items()}
+        for category, traced_value in traces.items():
+            traced_value.value = totals[category]
 
         # Build ProfitLoss object
         pl = ProfitLoss(
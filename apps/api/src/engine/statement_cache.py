@@ -0,0 +1,126 @@
+"""Per-year P&L and balance sheets that survive adding entries."""
+
+from heapq import merge
+from operator import itemgetter
+from typing import Dict, Iterable, List, Set
+
+from src.mapper.account_mapper import AccountMapper
+from src.models.entry import JournalEntry
+from src.models.financials import BalanceSheet, ProfitLoss
+
+from .balance_builder import BalanceBuilder
+from .pl_builder import PLBuilder
+
+
+class StatementCache:
+    """Keep entries partitioned by effective year and the statements built from them.
+
+    Statements are built on first request and kept until entries are added
+    for their period. Adding entries for year Y invalidates the P&L of Y,
+    and the balance sheets of Y and of every later year, since a balance
+    sheet cumulates all movements up to its year end. Other years are reused.
+
+    Each entry keeps the sequence number of its addition, so statements see
+    the entries in the order they were added (as the builders would on the
+    whole entry list), whatever the order of the years.
+    """
+
+    def __init__(self, mapper: AccountMapper):
+        self.pl_builder = PLBuilder(mapper)
+        self.balance_builder = BalanceBuilder(mapper)
+        self.partitions: Dict[int, List[JournalEntry]] = {}
+        # Sequence numbers of the entries of each partition (increasing)
+        self._sequences: Dict[int, List[int]] = {}
+        self._count = 0
+        self._pl: Dict[int, ProfitLoss] = {}
+        self._balance: Dict[int, BalanceSheet] = {}
+
+    @property
+    def years(self) -> List[int]:
+        """Effective years having entries."""
+        return sorted(self.partitions)
+
+    def add_entries(self, entries: Iterable[JournalEntry]) -> Set[int]:
+        """Partition new entries and invalidate the statements they change.
+
+        Returns:
+            Effective years that received entries
+        """
+        affected = set()
+        for entry in entries:
+            year = entry.effective_year
+            partition = self.partitions.get(year)
+            if partition is None:
+                partition = self.partitions[year] = []
+                self._sequences[year] = []
+            partition.append(entry)
+            self._sequences[year].append(self._count)
+            self._count += 1
+            affected.add(year)
+        self.invalidate(affected)
+        return affected
+
+    def invalidate(self, years: Iterable[int]) -> None:
+        """Drop the P&L of ``years`` and the balance sheets from the earliest on."""
+        years = set(years)
+        if not years:
+            return
+        for year in years:
+            self._pl.pop(year, None)
+        first = min(years)
+        for year in [y for y in self._balance if y >= first]:
+            del self._balance[year]
+
+    def _entries_up_to(self, year: int) -> List[JournalEntry]:
+        """Entries of the effective years up to ``year``, in the order they were added."""
+        runs = [
+            zip(self._sequences[y], partition)
+            for y, partition in self.partitions.items() if y <= year
+        ]
+        return [entry for _, entry in merge(*runs, key=itemgetter(0))]
+
+    @property
+    def complete(self) -> bool:
+        """True if the statements of every year are built and still valid."""
+        return all(year in self._pl and year in self._balance for year in self.partitions)
+
+    def store(self, pl_list: List[ProfitLoss], balance_list: List[BalanceSheet]) -> None:
+        """Keep statements built elsewhere from all the entries added so far
+        (e.g. by FusedBuilder), one per effective year in ``years`` order."""
+        years = self.years
+        if [pl.year for pl in pl_list] != years or [bs.year for bs in balance_list] != years:
+            raise ValueError("Statements do not match the years of the cache")
+        self._pl.update(zip(years, pl_list))
+        self._balance.update(zip(years, balance_list))
+
+    def pl(self, year: int) -> ProfitLoss:
+        """P&L of an effective year, built from its partition only."""
+        pl = self._pl.get(year)
+        if pl is None:
+            pl = self._pl[year] = self.pl_builder.build(self.partitions.get(year, []), year)
+        return pl
+
+    def balance(self, year: int) -> BalanceSheet:
+        """Balance sheet at the end of an effective year."""
+        balance = self._balance.get(year)
+        if balance is None:
+            balance = self.balance_builder.build(self._entries_up_to(year), year)
+            self._balance[year] = balance
+        return balance
+
+    def pl_list(self) -> List[ProfitLoss]:
+        """P&L for all years (same as PLBuilder.build_multi_year on all entries)."""
+        return [self.pl(year) for year in self.years]
+
+    def balance_list(self) -> List[BalanceSheet]:
+        """Balance sheets for all years (same as BalanceBuilder.build_multi_year).
+
+        Missing balance sheets are built together: one pass over the
+        partitions up to the last missing year, cumulated per year.
+        """
+        missing = [year for year in self.years if year not in self._balance]
+        if len(missing) > 1:
+            entries = self._entries_up_to(missing[-1])
+            sheets = self.balance_builder.movements(entries).cumulate(missing)
+            self._balance.update(zip(missing, sheets))
+        return [self.balance(year) for year in self.years]
@@ -1,7 +1,7 @@
 """Template-based Excel writer that uses client Databook template."""
 
 import shutil
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal
 from pathlib import Path
 from typing import List, Optional, Union
@@ -9,7 +9,7 @@ from typing import List, Optional, Union
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
 
-from src.models.entry import JournalEntry
+from src.models.entry import FECDetail, JournalEntry
 
 
 class TemplateWriter:
@@ -143,12 +143,24 @@ class TemplateWriter:
         print(f"  Wrote {len(sorted_entries)} FEC entries to template")
 
     def _write_fec_row(self, ws: Worksheet, row: int, entry: JournalEntry):
-        """Write a single FEC entry to a row with data and formulas."""
+        """Write a single FEC entry to a row with data and formulas.
+
+        Optional columns come from ``entry.details`` when the file was parsed
+        with FECParser(details=True); otherwise they are derived or left empty.
+        """
+        details = entry.details
+        entry_date = int(entry.date.strftime("%Y%m%d"))
+
         # Data columns
         ws.cell(row=row, column=2, value=self._get_journal_code(entry))
         ws.cell(row=row, column=3, value=self._get_journal_lib(entry))
-        ws.cell(row=row, column=4, value=row - self.FEC_DATA_START_ROW + 1)  # EcritureNum
-        ws.cell(row=row, column=5, value=int(entry.date.strftime("%Y%m%d")))  # EcritureDate
+        ecriture_num = details.ecriture_num if details else ""
+        if not ecriture_num:
+            ecriture_num = row - self.FEC_DATA_START_ROW + 1
+        elif ecriture_num.isdigit():
+            ecriture_num = int(ecriture_num)
+        ws.cell(row=row, column=4, value=ecriture_num)  # EcritureNum
+        ws.cell(row=row, column=5, value=entry_date)  # EcritureDate
         ws.cell(row=row, column=6, value=f"FY{str(entry.effective_year)[-2:]}")  # Exercice
         # Columns 7-8 (Date, Mois) are now formulas set below
         # CompteNum - keep as string to match BG sheet text values for XLOOKUP
@@ -159,21 +171,33 @@ class TemplateWriter:
             ws.cell(row=row, column=col, value=formula_template.format(row=row))
 
         # More data columns
-        ws.cell(row=row, column=15, value=entry.label)  # CompteLib
-        ws.cell(row=row, column=16, value="")  # CompAuxNum
-        ws.cell(row=row, column=17, value="")  # CompAuxLib
-        ws.cell(row=row, column=18, value="")  # PieceRef
-        ws.cell(row=row, column=19, value=int(entry.date.strftime("%Y%m%d")))  # PieceDate
+        if details is None:
+            details = FECDetail()
+        ws.cell(row=row, column=15, value=details.compte_lib or entry.label)  # CompteLib
+        ws.cell(row=row, column=16, value=details.comp_aux_num)  # CompAuxNum
+        ws.cell(row=row, column=17, value=details.comp_aux_lib)  # CompAuxLib
+        ws.cell(row=row, column=18, value=details.piece_ref)  # PieceRef
+        piece_date = self._date_value(details.piece_date) or entry_date
+        ws.cell(row=row, column=19, value=piece_date)  # PieceDate
         ws.cell(row=row, column=20, value=entry.label)  # EcritureLib
         ws.cell(row=row, column=21, value=float(entry.debit))  # Debit
         ws.cell(row=row, column=22, value=float(entry.credit))  # Credit
         # Column 23 and 24 are formulas (already set above)
-        ws.cell(row=row, column=25, value="")  # EcritureLet
-        ws.cell(row=row, column=26, value="")  # DateLet
-        ws.cell(row=row, column=27, value=int(entry.date.strftime("%Y%m%d")))  # ValidDate
+        ws.cell(row=row, column=25, value=details.ecriture_let)  # EcritureLet
+        ws.cell(row=row, column=26, value=self._date_value(details.date_let) or "")  # DateLet
+        valid_date = self._date_value(details.valid_date) or entry_date
+        ws.cell(row=row, column=27, value=valid_date)  # ValidDate
+
+    @staticmethod
+    def _date_value(value: Optional[date]) -> Optional[int]:
+        """Date as a YYYYMMDD integer, like the FEC sheet stores dates."""
+        return int(value.strftime("%Y%m%d")) if value else None
 
     def _get_journal_code(self, entry: JournalEntry) -> str:
-        """Determine journal code based on account class."""
+        """Journal code from the file, or derived from the account class."""
+        details = entry.details
+        if details and details.journal_code:
+            return details.journal_code
         account_class = entry.account_num[0] if entry.account_num else ""
         if account_class == "6":
             return "AC"  # Achats/Charges
@@ -183,7 +207,10 @@ class TemplateWriter:
             return "OD"  # Opérations Diverses
 
     def _get_journal_lib(self, entry: JournalEntry) -> str:
-        """Determine journal label based on account class."""
+        """Journal label from the file, or derived from the account class."""
+        details = entry.details
+        if details and details.journal_lib:
+            return details.journal_lib
         account_class = entry.account_num[0] if entry.account_num else ""
         if account_class == "6":
             return "Achats"
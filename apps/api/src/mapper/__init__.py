@@ -1,3 +1,11 @@
-from .account_mapper import AccountMapper
+from .account_mapper import UNMAPPED, AccountCategories, AccountMapper
+from .registry import CompiledMapping, MappingRegistry, mapping_registry
 
-__all__ = ["AccountMapper"]
+__all__ = [
+    "AccountCategories",
+    "AccountMapper",
+    "CompiledMapping",
+    "MappingRegistry",
+    "UNMAPPED",
+    "mapping_registry",
+]
@@ -1,77 +1,133 @@
 """Account mapper - maps PCG account numbers to financial categories."""
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple, Union
 
-import yaml
+import numpy as np
+
+from .registry import DEFAULT_MAPPING_PATH, MappingRegistry, mapping_registry
+
+# Category code of accounts matching no prefix
+UNMAPPED = -1
+
+
+@dataclass
+class AccountCategories:
+    """Categories of an array of account numbers, as NumPy arrays.
+
+    Item i describes the i-th account given to
+    AccountMapper.categorize_many(): its category is
+    ``categories[codes[i]]`` (None if ``codes[i]`` is UNMAPPED). Built on
+    the ``accounts`` dictionary of a ColumnarParseResult, ``take()``
+    broadcasts it to the rows through ``account_codes``.
+    """
+    categories: Tuple[str, ...]  # category of each code
+    codes: np.ndarray            # int16, index into categories or UNMAPPED
+    is_pl: np.ndarray            # bool, P&L category (get_pl_category())
+    is_balance: np.ndarray       # bool, balance sheet category
+    debit_positive: np.ndarray   # bool, is_debit_positive()
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def signs(self) -> np.ndarray:
+        """+1 where debit increases the account, -1 where credit does (int8)."""
+        return np.where(self.debit_positive, 1, -1).astype(np.int8)
+
+    def category(self, index: int) -> Optional[str]:
+        code = int(self.codes[index])
+        return None if code == UNMAPPED else self.categories[code]
+
+    def mask(self, *categories: str) -> np.ndarray:
+        """Items whose category is one of ``categories``."""
+        wanted = [self.categories.index(c) for c in categories if c in self.categories]
+        return np.isin(self.codes, wanted)
+
+    def take(self, indices: np.ndarray) -> "AccountCategories":
+        """Select items, e.g. broadcast per-account results to rows with
+        ``categorize_many(columns.accounts).take(columns.account_codes)``."""
+        return AccountCategories(
+            categories=self.categories,
+            codes=self.codes[indices],
+            is_pl=self.is_pl[indices],
+            is_balance=self.is_balance[indices],
+            debit_positive=self.debit_positive[indices],
+        )
 
 
 class AccountMapper:
     """Map PCG account numbers to financial statement categories."""
 
-    def __init__(self, config_path: Optional[Union[str, Path]] = None):
-        """Initialize mapper with config file."""
+    PL_CATEGORIES = frozenset({
+        "revenue", "other_revenue", "purchases", "external_charges",
+        "taxes", "personnel", "other_charges", "depreciation",
+        "financial_expense", "financial_income",
+        "exceptional_expense", "exceptional_income", "income_tax"
+    })
+    ASSET_CATEGORIES = frozenset({
+        "fixed_assets", "inventory", "receivables", "other_receivables", "cash"
+    })
+    LIABILITY_CATEGORIES = frozenset({
+        "equity", "provisions", "financial_debt", "payables", "other_payables"
+    })
+    BALANCE_CATEGORIES = ASSET_CATEGORIES | LIABILITY_CATEGORIES
+
+    # Maximum number of distinct account numbers memoized (a FEC has at
+    # most a few thousand accounts; beyond this, lookups walk the trie)
+    CATEGORY_CACHE_SIZE = 100_000
+
+    def __init__(
+        self,
+        config_path: Optional[Union[str, Path]] = None,
+        registry: Optional[MappingRegistry] = None,
+    ):
+        """Initialize mapper with config file.
+
+        The file is compiled once per process by the mapping registry
+        (default: ``mapping_registry``); mappers only own their memo tables.
+        """
         if config_path is None:
             # Use default config
-            config_path = Path(__file__).parent.parent.parent / "config" / "default_mapping.yml"
+            config_path = DEFAULT_MAPPING_PATH
 
         self.config_path = Path(config_path)
-        self.mapping: Dict[str, List[str]] = {}
-        self._load_config()
-
-    def _load_config(self):
-        """Load mapping configuration from YAML."""
-        with open(self.config_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
-        # Build prefix -> category mapping
-        self.mapping = {}
-        for category, prefixes in config.items():
-            if isinstance(prefixes, list):
-                for item in prefixes:
-                    if isinstance(item, dict) and "prefix" in item:
-                        prefix = str(item["prefix"])
-                        self.mapping[prefix] = category
+        if registry is None:
+            registry = mapping_registry
+        self._compiled = registry.get(self.config_path)
+        self.mapping: Mapping[str, str] = self._compiled.mapping
+        self._match = self._compiled.match
+        self._categories: Dict[str, Optional[str]] = {}
+        self._debit_positive: Dict[str, bool] = {}
 
     def get_category(self, account_num: str) -> Optional[str]:
         """
         Get financial category for an account number.
 
-        Returns the most specific match (longest prefix).
+        Returns the most specific match (longest prefix). Results are
+        memoized per account number, so each distinct account walks the
+        prefix trie once.
         """
-        account = str(account_num).strip()
-
-        # Try progressively shorter prefixes
-        best_match = None
-        best_length = 0
+        try:
+            return self._categories[account_num]
+        except KeyError:
+            pass
 
-        for prefix, category in self.mapping.items():
-            if account.startswith(prefix) and len(prefix) > best_length:
-                best_match = category
-                best_length = len(prefix)
-
-        return best_match
+        category = self._match(str(account_num).strip())
+        if len(self._categories) < self.CATEGORY_CACHE_SIZE:
+            self._categories[account_num] = category
+        return category
 
     def get_pl_category(self, account_num: str) -> Optional[str]:
         """Get P&L category (classe 6 and 7 only)."""
         category = self.get_category(account_num)
-        pl_categories = {
-            "revenue", "other_revenue", "purchases", "external_charges",
-            "taxes", "personnel", "other_charges", "depreciation",
-            "financial_expense", "financial_income",
-            "exceptional_expense", "exceptional_income", "income_tax"
-        }
-        return category if category in pl_categories else None
+        return category if category in self.PL_CATEGORIES else None
 
     def get_balance_category(self, account_num: str) -> Optional[str]:
         """Get balance sheet category (classe 1-5)."""
         category = self.get_category(account_num)
-        balance_categories = {
-            "fixed_assets", "inventory", "receivables", "other_receivables",
-            "cash", "equity", "provisions", "financial_debt",
-            "payables", "other_payables"
-        }
-        return category if category in balance_categories else None
+        return category if category in self.BALANCE_CATEGORIES else None
 
     def is_debit_positive(self, account_num: str) -> bool:
         """
@@ -80,28 +136,56 @@ class AccountMapper:
         Assets and expenses: debit is positive
         Liabilities and income: credit is positive
         """
+        try:
+            return self._debit_positive[account_num]
+        except KeyError:
+            pass
+
         account = str(account_num).strip()
         if not account:
             return True
 
-        category = self.get_balance_category(account)
-        if category:
-            asset_categories = {
-                "fixed_assets", "inventory", "receivables", "other_receivables", "cash"
-            }
-            liability_categories = {
-                "equity", "provisions", "financial_debt", "payables", "other_payables"
-            }
-            if category in asset_categories:
-                return True
-            if category in liability_categories:
-                return False
-
-        first_digit = account[0]
-
-        # Classes 2, 3, 4, 5, 6 (Assets and Expenses): debit positive
-        # Classes 1, 7 (Liabilities/Equity and Income): credit positive
-        return first_digit in ("2", "3", "4", "5", "6")
+        category = self.get_category(account_num)
+        if category in self.ASSET_CATEGORIES:
+            positive = True
+        elif category in self.LIABILITY_CATEGORIES:
+            positive = False
+        else:
+            # Classes 2, 3, 4, 5, 6 (Assets and Expenses): debit positive
+            # Classes 1, 7 (Liabilities/Equity and Income): credit positive
+            positive = account[0] in ("2", "3", "4", "5", "6")
+
+        if len(self._debit_positive) < self.CATEGORY_CACHE_SIZE:
+            self._debit_positive[account_num] = positive
+        return positive
+
+    def categorize_many(self, accounts: Iterable[str]) -> AccountCategories:
+        """Categorize many account numbers in one call.
+
+        Meant for the distinct accounts of an entry table: each account is
+        looked up once (through the memo tables), then P&L / balance flags
+        are derived per category code with NumPy.
+        """
+        categories = self._compiled.categories
+        index = {category: code for code, category in enumerate(categories)}
+        codes: List[int] = []
+        debit_positive: List[bool] = []
+        for account in accounts:
+            category = self.get_category(account)
+            codes.append(UNMAPPED if category is None else index[category])
+            debit_positive.append(self.is_debit_positive(account))
+
+        codes_array = np.array(codes, dtype=np.int16)
+        # Per-code tables; their last item is for UNMAPPED (index -1)
+        pl_table = np.array([c in self.PL_CATEGORIES for c in categories] + [False])
+        balance_table = np.array([c in self.BALANCE_CATEGORIES for c in categories] + [False])
+        return AccountCategories(
+            categories=categories,
+            codes=codes_array,
+            is_pl=pl_table[codes_array],
+            is_balance=balance_table[codes_array],
+            debit_positive=np.array(debit_positive, dtype=bool),
+        )
 
     def __repr__(self) -> str:
         return f"AccountMapper({len(self.mapping)} prefixes)"
@@ -0,0 +1,172 @@
+"""Process-wide registry of compiled account mapping files."""
+
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Dict, Mapping, Optional, Tuple, Union
+
+import yaml
+
+if TYPE_CHECKING:
+    from .account_mapper import AccountMapper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAPPING_PATH = Path(__file__).parent.parent.parent / "config" / "default_mapping.yml"
+
+
+@dataclass(frozen=True)
+class CompiledMapping:
+    """A mapping file compiled once for prefix lookups.
+
+    Instances are shared by every AccountMapper built from the same file
+    content and must not be modified. ``trie`` maps a character to its
+    child node; the category of the prefix ending at a node is stored
+    under the ``None`` key.
+    """
+    path: Path
+    digest: str                  # SHA-256 of the file content
+    mapping: Mapping[str, str]   # prefix -> category (read-only)
+    trie: Dict[Any, Any]
+    categories: Tuple[str, ...]  # distinct categories, sorted
+
+    def match(self, account: str) -> Optional[str]:
+        """Category of the longest prefix of ``account``, if any."""
+        best_match = None
+        node = self.trie
+        for char in account:
+            node = node.get(char)
+            if node is None:
+                break
+            best_match = node.get(None, best_match)
+        return best_match
+
+
+def compile_mapping(path: Union[str, Path], data: bytes) -> CompiledMapping:
+    """Compile the YAML content of a mapping file.
+
+    The file lists prefixes per category; the most specific prefix wins at
+    lookup time whatever the order of the file.
+    """
+    config = yaml.safe_load(data) or {}
+
+    # Build prefix -> category mapping
+    mapping = {}
+    for category, prefixes in config.items():
+        if isinstance(prefixes, list):
+            for item in prefixes:
+                if isinstance(item, dict) and "prefix" in item:
+                    prefix = str(item["prefix"])
+                    mapping[prefix] = category
+
+    trie: Dict[Any, Any] = {}
+    for prefix, category in mapping.items():
+        if not prefix:
+            continue  # an empty prefix never matches
+        node = trie
+        for char in prefix:
+            node = node.setdefault(char, {})
+        node[None] = category
+
+    return CompiledMapping(
+        path=Path(path),
+        digest=hashlib.sha256(data).hexdigest(),
+        mapping=MappingProxyType(mapping),
+        trie=trie,
+        categories=tuple(sorted(set(mapping.values()))),
+    )
+
+
+class MappingRegistry:
+    """Compile each mapping file once and share it across requests.
+
+    Files are keyed by resolved path. A file is re-read only when its
+    mtime, size or inode changes, and recompiled only when its content
+    hash changes too, so touching a file keeps the compiled mapping. Files
+    with the same content share one CompiledMapping. Mappers already built
+    keep the mapping they were built with; the next get() sees the edit.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # path -> (stat signature, digest)
+        self._files: Dict[Path, Tuple[Tuple[int, int, int], str]] = {}
+        self._compiled: Dict[str, CompiledMapping] = {}
+        # digest -> AccountMapper shared by mapper()
+        self._mappers: Dict[str, "AccountMapper"] = {}
+
+    def get(self, path: Optional[Union[str, Path]] = None) -> CompiledMapping:
+        """Compiled mapping of ``path`` (default: config/default_mapping.yml).
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        path = Path(path or DEFAULT_MAPPING_PATH).resolve()
+        stat = os.stat(path)
+        signature = (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+        with self._lock:
+            known = self._files.get(path)
+            if known is not None and known[0] == signature:
+                return self._compiled[known[1]]
+
+            with open(path, "rb") as f:
+                data = f.read()
+            digest = hashlib.sha256(data).hexdigest()
+            compiled = self._compiled.get(digest)
+            if compiled is None:
+                compiled = self._compiled[digest] = compile_mapping(path, data)
+                logger.info(f"Compiled account mapping {path} ({len(compiled.mapping)} prefixes)")
+
+            self._files[path] = (signature, digest)
+            if known is not None and known[1] != digest:
+                self._forget(known[1])
+            return compiled
+
+    def mapper(self, path: Optional[Union[str, Path]] = None) -> "AccountMapper":
+        """AccountMapper of ``path`` shared by all callers of this registry.
+
+        Its memo tables are kept across requests, so each account number is
+        categorized once per process. A new mapper is made when the file
+        content changes. Memo tables are only ever filled, so the mapper
+        can be used from several threads.
+
+        Raises:
+            OSError: If the file cannot be read
+            yaml.YAMLError: If the file is not valid YAML
+        """
+        from .account_mapper import AccountMapper
+
+        digest = self.get(path).digest
+        with self._lock:
+            mapper = self._mappers.get(digest)
+        if mapper is None:
+            mapper = AccountMapper(path, registry=self)
+            with self._lock:
+                mapper = self._mappers.setdefault(mapper._compiled.digest, mapper)
+        return mapper
+
+    def _forget(self, digest: str) -> None:
+        """Drop a compiled mapping (and its mapper) no file refers to anymore."""
+        if all(d != digest for _, d in self._files.values()):
+            self._compiled.pop(digest, None)
+            self._mappers.pop(digest, None)
+
+    def clear(self) -> None:
+        """Forget all compiled mappings."""
+        with self._lock:
+            self._files.clear()
+            self._compiled.clear()
+            self._mappers.clear()
+
+    def __len__(self) -> int:
+        return len(self._compiled)
+
+
+# Registry used by AccountMapper unless another one is given
+mapping_registry = MappingRegistry()
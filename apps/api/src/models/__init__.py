@@ -1,4 +1,17 @@
-from .entry import JournalEntry
-from .financials import ProfitLoss, BalanceSheet, KPIs
+from .cube import AccountCube
+from .entry import (
+    AggregatedCentsJournalEntry,
+    AggregatedJournalEntry,
+    CentsJournalEntry,
+    DetailedCentsJournalEntry,
+    DetailedJournalEntry,
+    FECDetail,
+    JournalEntry,
+)
+from .financials import BalanceSheet, KPIs, ProfitLoss
 
-__all__ = ["JournalEntry", "ProfitLoss", "BalanceSheet", "KPIs"]
+__all__ = [
+    "JournalEntry", "CentsJournalEntry", "DetailedJournalEntry", "DetailedCentsJournalEntry",
+    "AggregatedJournalEntry", "AggregatedCentsJournalEntry", "FECDetail",
+    "AccountCube", "ProfitLoss", "BalanceSheet", "KPIs",
+]
@@ -0,0 +1,201 @@
+"""Pre-aggregated FEC amounts by account and period."""
+
+from datetime import date
+from decimal import Decimal
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .entry import (
+    AggregatedCentsJournalEntry,
+    AggregatedJournalEntry,
+    Amount,
+    CentsJournalEntry,
+    JournalEntry,
+    cents_to_decimal,
+)
+
+# (account_num, effective_year, fiscal_year, month)
+CellKey = Tuple[str, int, int, int]
+
+
+class AccountCube:
+    """Debit/credit sums and row counts by account, year and month.
+
+    Cells are keyed by (account, effective year, fiscal year, month): the
+    P&L and balance views group by effective year, the monthly and detail
+    views by the year of the entry date, so both are kept. Amounts are
+    integer cents when every entry added is a CentsJournalEntry, Decimal
+    otherwise.
+
+    Each cell also keeps the position of its first entry and the first
+    non-empty label of its entries with the position of that entry, so
+    to_entries() can reproduce key order and "first label seen" lookups
+    exactly.
+    """
+
+    def __init__(self):
+        # key -> [debit, credit, row_count, first_seq, label_seq, label]
+        self._cells: Dict[CellKey, list] = {}
+        self._cents = True
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return len(self._cells)
+
+    @property
+    def row_count(self) -> int:
+        """Number of entries aggregated."""
+        return self._rows
+
+    @property
+    def cents(self) -> bool:
+        """True if amounts are stored as integer cents."""
+        return self._cents
+
+    @property
+    def years(self) -> List[int]:
+        """Unique fiscal years (entry date years) in the cube."""
+        return sorted({key[2] for key in self._cells})
+
+    def add(self, entry: JournalEntry) -> None:
+        """Aggregate one entry."""
+        if self._cents:
+            if isinstance(entry, CentsJournalEntry):
+                debit, credit = entry.debit_cents, entry.credit_cents
+            else:
+                self._to_decimal_amounts()
+                debit, credit = entry.debit, entry.credit
+        else:
+            debit, credit = entry.debit, entry.credit
+
+        key = (entry.account_num, entry.effective_year, entry.date.year, entry.date.month)
+        cell = self._cells.get(key)
+        if cell is None:
+            self._cells[key] = [debit, credit, 1, self._rows, self._rows, entry.label] \
+                if entry.label else [debit, credit, 1, self._rows, None, ""]
+        else:
+            cell[0] += debit
+            cell[1] += credit
+            cell[2] += 1
+            if cell[4] is None and entry.label:
+                cell[4] = self._rows
+                cell[5] = entry.label
+        self._rows += 1
+
+    def add_all(self, entries: Iterable[JournalEntry]) -> Iterator[JournalEntry]:
+        """Aggregate entries as they are iterated, yielding them unchanged."""
+        for entry in entries:
+            self.add(entry)
+            yield entry
+
+    def merge(self, other: "AccountCube") -> None:
+        """Add the cells of ``other``, as if its entries came after ours."""
+        if self._cents and not other._cents:
+            self._to_decimal_amounts()
+        convert = cents_to_decimal if other._cents and not self._cents else None
+
+        for key, (debit, credit, count, first_seq, label_seq, label) in other._cells.items():
+            if convert is not None:
+                debit, credit = convert(debit), convert(credit)
+            if label_seq is not None:
+                label_seq += self._rows
+            cell = self._cells.get(key)
+            if cell is None:
+                self._cells[key] = [debit, credit, count, first_seq + self._rows, label_seq, label]
+            else:
+                cell[0] += debit
+                cell[1] += credit
+                cell[2] += count
+                if cell[4] is None and label_seq is not None:
+                    cell[4] = label_seq
+                    cell[5] = label
+        self._rows += other._rows
+
+    def filter_years(self, years: Iterable[int]) -> "AccountCube":
+        """Cube restricted to the given fiscal years (entry date years)."""
+        years = set(years)
+        cube = AccountCube()
+        cube._cents = self._cents
+        cube._rows = self._rows
+        cube._cells = {key: list(cell) for key, cell in self._cells.items() if key[2] in years}
+        return cube
+
+    def totals(
+        self,
+        account: Optional[str] = None,
+        effective_year: Optional[int] = None,
+        fiscal_year: Optional[int] = None,
+        month: Optional[int] = None,
+    ) -> Tuple[Decimal, Decimal, int]:
+        """Sum (debit, credit, row_count) over the cells matching the filters."""
+        debit, credit, count = 0, 0, 0
+        for (acc, eff, fy, mon), cell in self._cells.items():
+            if ((account is None or acc == account)
+                    and (effective_year is None or eff == effective_year)
+                    and (fiscal_year is None or fy == fiscal_year)
+                    and (month is None or mon == month)):
+                debit += cell[0]
+                credit += cell[1]
+                count += cell[2]
+        return self._decimal(debit), self._decimal(credit), count
+
+    def iter_cells(self) -> Iterator[Tuple[CellKey, Amount, Amount, int, int, Optional[int], str]]:
+        """Cells as (key, debit, credit, row_count, first_seq, label_seq, label).
+
+        Ordered by the position of their first entry. ``label_seq`` is the
+        position of the entry giving ``label`` (None for a cell with no label).
+        Amounts are stored as in the cube (see ``cents``).
+        """
+        for key, cell in sorted(self._cells.items(), key=lambda item: item[1][3]):
+            yield (key, *cell)
+
+    def to_entries(self) -> List[JournalEntry]:
+        """One journal entry per cell, usable by the summing builders.
+
+        Each entry is dated the 1st of its month, carries the cell sums
+        and sets ``row_count`` to the number of entries it stands for.
+        Entries are ordered by the position of their cell's first entry, so
+        keys are first seen in the same order as on the raw entries. A cell
+        whose first entry has no label is followed, at the position of its
+        first label, by a zero-amount entry with ``row_count`` 0 carrying
+        that label, so "first label seen" lookups match too.
+        Per-entry views (traces, journal extracts) need the raw entries.
+        """
+        zero = 0 if self._cents else Decimal("0")
+        rows = []
+        for key, (debit, credit, count, first_seq, label_seq, label) in self._cells.items():
+            if label_seq is None or label_seq == first_seq:
+                rows.append((first_seq, key, debit, credit, count, label))
+            else:
+                rows.append((first_seq, key, debit, credit, count, ""))
+                rows.append((label_seq, key, zero, zero, 0, label))
+        rows.sort(key=lambda row: row[0])
+
+        entries: List[JournalEntry] = []
+        for _, (account, effective_year, fiscal_year, month), debit, credit, count, label in rows:
+            entry_date = date(fiscal_year, month, 1)
+            if self._cents:
+                entry = AggregatedCentsJournalEntry(
+                    date=entry_date, account_num=account, label=label,
+                    debit_cents=debit, credit_cents=credit, source_year=effective_year,
+                )
+            else:
+                entry = AggregatedJournalEntry(
+                    date=entry_date, account_num=account, label=label,
+                    debit=debit, credit=credit, source_year=effective_year,
+                )
+            entry.row_count = count
+            entries.append(entry)
+        return entries
+
+    def _decimal(self, amount: Amount) -> Decimal:
+        return cents_to_decimal(amount) if self._cents else Decimal(amount)
+
+    def _to_decimal_amounts(self) -> None:
+        """Switch storage from cents to Decimal (mixed entry types)."""
+        for cell in self._cells.values():
+            cell[0] = cents_to_decimal(cell[0])
+            cell[1] = cents_to_decimal(cell[1])
+        self._cents = False
+
+    def __repr__(self) -> str:
+        return f"AccountCube({len(self._cells)} cells, {self._rows} entries)"
@@ -1,12 +1,49 @@
 from dataclasses import dataclass, field
 from datetime import date
 from decimal import Decimal
-from typing import Optional
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from src.parser.details import FECDetails
 
 
 @dataclass
+class FECDetail:
+    """Optional standard FEC columns of an entry (see JournalEntry.details).
+
+    Columns missing from the file are empty strings or None.
+    """
+
+    journal_code: str = ""
+    journal_lib: str = ""
+    ecriture_num: str = ""
+    compte_lib: str = ""
+    comp_aux_num: str = ""
+    comp_aux_lib: str = ""
+    piece_ref: str = ""
+    piece_date: Optional[date] = None
+    ecriture_let: str = ""
+    date_let: Optional[date] = None
+    valid_date: Optional[date] = None
+    montant_devise: Optional[Decimal] = None
+    idevise: str = ""
+
+
+# Shared int object per year: every entry of a year references the same one
+_YEARS: Dict[int, int] = {}
+
+
+@dataclass(slots=True)
 class JournalEntry:
-    """Represents a single FEC journal entry."""
+    """Represents a single FEC journal entry.
+
+    Entries use ``__slots__`` (no per-instance ``__dict__``), and
+    ``fiscal_year``, ``effective_year`` and ``account_class`` are plain
+    attributes computed once at creation: ``date``, ``account_num`` and
+    ``source_year`` must not be changed afterwards (build a new entry).
+    """
 
     date: date
     account_num: str
@@ -17,27 +54,174 @@ class JournalEntry:
     """Year extracted from FEC filename (e.g., 844118190FEC20241231.txt -> 2024).
     Used for correct balance sheet cumulation. If None, falls back to fiscal_year."""
 
+    fiscal_year: int = field(init=False, repr=False, compare=False)
+    """Calendar year of the entry date."""
+
+    effective_year: int = field(init=False, repr=False, compare=False)
+    """Year to use for balance sheet grouping.
+    Prefers source_year (from filename) over fiscal_year (from entry date).
+    This is critical for correct cumulative balance calculation."""
+
+    account_class: str = field(init=False, repr=False, compare=False)
+    """First digit of account number (PCG class)."""
+
+    # Number of FEC rows this entry stands for: a class constant, only the
+    # Aggregated* entries of AccountCube.to_entries() store their own
+    row_count = 1
+
+    def __post_init__(self):
+        year = self.date.year
+        year = _YEARS.setdefault(year, year)
+        self.fiscal_year = year
+        self.effective_year = self.source_year if self.source_year is not None else year
+        self.account_class = self.account_num[0] if self.account_num else ""
+
     @property
     def amount(self) -> Decimal:
         """Net amount (debit - credit)."""
         return self.debit - self.credit
 
     @property
-    def account_class(self) -> str:
-        """First digit of account number (PCG class)."""
-        return self.account_num[0] if self.account_num else ""
+    def details(self) -> Optional[FECDetail]:
+        """Optional FEC columns (JournalCode, PieceRef...), built on access.
+        None unless the entry was parsed with FECParser(details=True)."""
+        # Only the Detailed* subclasses have the _details_ref slot
+        ref = getattr(self, "_details_ref", None)
+        if ref is None:
+            return None
+        store, row = ref
+        return store.row(row)
+
+    def __repr__(self) -> str:
+        return f"JournalEntry({self.date}, {self.account_num}, {self.amount})"
+
+
+@lru_cache(maxsize=65536)
+def cents_to_decimal(cents: int) -> Decimal:
+    """Convert an amount in integer cents to a 2-decimal Decimal (12345 -> 123.45)."""
+    return Decimal(cents).scaleb(-2)
+
+
+class CentsJournalEntry(JournalEntry):
+    """JournalEntry storing debit and credit as integer cents.
+
+    Produced by FECParser(amount_mode="cents"). ``debit`` and ``credit`` are
+    still exposed as Decimal for compatibility; builders aggregate
+    ``debit_cents`` and ``credit_cents`` directly and only convert totals.
+    The Decimals have 2 places, like those FECParser gives JournalEntry.
+    """
+
+    __slots__ = ()
+
+    # The cents live in the inherited ``debit``/``credit`` slots, reached
+    # through their slot descriptors; ``debit``/``credit`` are properties here
+    debit_cents = JournalEntry.debit
+    credit_cents = JournalEntry.credit
+
+    def __init__(
+        self,
+        date: date,
+        account_num: str,
+        label: str,
+        debit_cents: int,
+        credit_cents: int,
+        source_year: Optional[int] = None,
+    ):
+        self.date = date
+        self.account_num = account_num
+        self.label = label
+        self.debit_cents = debit_cents
+        self.credit_cents = credit_cents
+        self.source_year = source_year
+        self.__post_init__()
+
+    # Pickled state, by attribute name (the default would read the slots
+    # through the Decimal properties)
+    _STATE = (
+        "date", "account_num", "label", "debit_cents", "credit_cents", "source_year",
+        "fiscal_year", "effective_year", "account_class",
+    )
+
+    def __getstate__(self) -> tuple:
+        return tuple(getattr(self, name) for name in self._STATE)
+
+    def __setstate__(self, state: tuple) -> None:
+        for name, value in zip(self._STATE, state):
+            setattr(self, name, value)
 
     @property
-    def fiscal_year(self) -> int:
-        """Extract fiscal year from entry date."""
-        return self.date.year
+    def debit(self) -> Decimal:
+        return cents_to_decimal(self.debit_cents)
 
     @property
-    def effective_year(self) -> int:
-        """Year to use for balance sheet grouping.
-        Prefers source_year (from filename) over fiscal_year (from entry date).
-        This is critical for correct cumulative balance calculation."""
-        return self.source_year if self.source_year is not None else self.date.year
+    def credit(self) -> Decimal:
+        return cents_to_decimal(self.credit_cents)
 
-    def __repr__(self) -> str:
-        return f"JournalEntry({self.date}, {self.account_num}, {self.amount})"
+    @property
+    def amount(self) -> Decimal:
+        """Net amount (debit - credit)."""
+        return cents_to_decimal(self.debit_cents - self.credit_cents)
+
+
+class DetailedJournalEntry(JournalEntry):
+    """JournalEntry linked to its row of the FECParser(details=True) side-store.
+
+    The link lives in this subclass so that other entries do not carry an
+    unused slot.
+    """
+
+    __slots__ = ("_details_ref",)
+
+    _details_ref: Tuple["FECDetails", int]
+
+
+class DetailedCentsJournalEntry(CentsJournalEntry):
+    """CentsJournalEntry linked to its row of the details side-store."""
+
+    __slots__ = ("_details_ref",)
+
+    _details_ref: Tuple["FECDetails", int]
+
+    _STATE = CentsJournalEntry._STATE + ("_details_ref",)
+
+
+class AggregatedJournalEntry(JournalEntry):
+    """JournalEntry standing for ``row_count`` FEC rows (AccountCube.to_entries())."""
+
+    __slots__ = ("row_count",)
+
+    row_count: int
+
+
+class AggregatedCentsJournalEntry(CentsJournalEntry):
+    """CentsJournalEntry standing for ``row_count`` FEC rows."""
+
+    __slots__ = ("row_count",)
+
+    row_count: int
+
+    _STATE = CentsJournalEntry._STATE + ("row_count",)
+
+
+Amount = Union[int, Decimal]
+
+# Reads the debit or credit of an entry, as cents or Decimal
+AmountGetter = Callable[[JournalEntry], Amount]
+
+
+def amount_accessors(
+    entries: Iterable[JournalEntry],
+) -> Tuple[AmountGetter, AmountGetter, Callable[[Amount], Decimal]]:
+    """Get (debit, credit, to_decimal) accessors suited to a list of entries.
+
+    If every entry is a CentsJournalEntry, the accessors read integer cents
+    and ``to_decimal`` converts an aggregated total back to Decimal.
+    Otherwise they read the Decimal fields and ``to_decimal`` is the identity.
+    """
+    if all(isinstance(e, CentsJournalEntry) for e in entries):
+        return attrgetter("debit_cents"), attrgetter("credit_cents"), cents_to_decimal
+    return attrgetter("debit"), attrgetter("credit"), _identity
+
+
+def _identity(value: Decimal) -> Decimal:
+    return value
@@ -1,3 +1,10 @@
+from .cache import ParseCache
+from .columnar import ColumnarParseResult
+from .details import FECDetails
 from .fec_parser import FECParser, ParseError, ParseResult
+from .probe import FECProbe
 
-__all__ = ["FECParser", "ParseError", "ParseResult"]
+__all__ = [
+    "FECParser", "ParseError", "ParseResult", "ColumnarParseResult", "ParseCache", "FECDetails",
+    "FECProbe",
+]
@@ -0,0 +1,218 @@
+"""Bulk ingestion of well-formed FEC files with the pandas CSV reader."""
+
+import csv
+from typing import TYPE_CHECKING, Callable, Dict, List
+
+import numpy as np
+import pandas as pd
+
+from .columnar import EPOCH_ORDINAL, ColumnarParseResult
+from .fec_parser import LONE_CR
+
+if TYPE_CHECKING:
+    from .fec_parser import FECParser
+
+# Rows converted per pandas chunk (bounds the memory held by string columns)
+BULK_CHUNK_ROWS = 500_000
+
+# Bytes scanned at a time by check_layout()
+LAYOUT_BLOCK_SIZE = 8 * 1024 * 1024
+
+# Plain amounts ("1234,56", "-12.50", "100"), as FECParser.CENTS_PATTERN
+CENTS_REGEX = r"^(-?)([0-9]+)(?:[.,]([0-9]{2}))?$"
+
+# Largest integer part whose amount in cents fits in int64
+MAX_CENTS_UNITS = (2**63 - 1 - 99) // 100
+
+
+class BulkFormatError(ValueError):
+    """The file is not regular enough for the bulk reader (parse it row by row)."""
+
+
+def check_layout(file_path: str, start: int, delimiter: str, min_fields: int) -> None:
+    """Check the data lines of a file before handing it to the bulk reader.
+
+    Every non-empty line must have at least ``min_fields`` fields and the
+    data must hold no quote character and no CR line break. Fields are counted on the raw bytes
+    with NumPy, a block at a time.
+
+    Raises:
+        BulkFormatError: If a line is short, or a quote or CR line break
+                         is found
+    """
+    sep = ord(delimiter)
+    carry = 0       # delimiters of the line continuing from the previous block
+    carry_len = 0   # bytes of that line
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        while True:
+            data = f.read(LAYOUT_BLOCK_SIZE)
+            if not data:
+                break
+            block = np.frombuffer(data, dtype=np.uint8)
+            if (block == ord('"')).any():
+                raise BulkFormatError("quoted fields")
+            if LONE_CR.search(data):
+                raise BulkFormatError("CR line breaks")
+
+            ends = np.flatnonzero(block == ord("\n"))
+            seps = np.flatnonzero(block == sep)
+            if len(ends):
+                # Delimiters and bytes of each line ending in this block
+                counts = np.diff(np.searchsorted(seps, ends), prepend=0)
+                counts[0] += carry
+                lengths = np.diff(ends, prepend=-1) - 1
+                lengths[0] += carry_len
+                # Empty lines ("\n", "\r\n") are skipped by both readers
+                has_cr = (ends > 0) & (block[ends - 1] == ord("\r"))
+                if ((lengths - has_cr > 0) & (counts + 1 < min_fields)).any():
+                    raise BulkFormatError("short rows")
+                carry = len(seps) - int(np.searchsorted(seps, ends[-1]))
+                carry_len = len(block) - int(ends[-1]) - 1
+            else:
+                carry += len(seps)
+                carry_len += len(block)
+
+    if carry_len > 0 and carry + 1 < min_fields:
+        raise BulkFormatError("short rows")
+
+
+class _Encoder:
+    """Convert a column chunk by chunk, once per distinct raw value.
+
+    Values are factorized per chunk; ``convert`` only sees raw values not
+    seen before. Codes follow the order of first appearance of the
+    converted values, like ColumnarEncoder.
+    """
+
+    def __init__(self, convert: Callable[[str], object], dictionary: bool):
+        self._convert = convert
+        self._dictionary = dictionary
+        self._raw: Dict[str, int] = {}
+        self._index: Dict[object, int] = {}
+
+    @property
+    def values(self) -> List:
+        return list(self._index)
+
+    def encode(self, column: pd.Series) -> np.ndarray:
+        codes, uniques = pd.factorize(column.to_numpy(dtype=object))
+        raw, index, convert = self._raw, self._index, self._convert
+        mapped = np.empty(len(uniques), dtype=np.int64)
+        for i, value in enumerate(uniques.tolist()):
+            out = raw.get(value)
+            if out is None:
+                converted = convert(value)
+                if self._dictionary:
+                    converted = index.setdefault(converted, len(index))
+                out = raw[value] = converted
+            mapped[i] = out
+        return mapped[codes]
+
+
+def _amount_cents(parser: "FECParser", column: pd.Series, name: str) -> np.ndarray:
+    """Convert an amount column to cents, column-at-a-time.
+
+    Plain amounts are converted with one vectorized regex over the distinct
+    values; others (thousands separators...) go through
+    FECParser._parse_amount_cents() so results are identical.
+    """
+    codes, uniques = pd.factorize(column.to_numpy(dtype=object))
+    values = pd.Series(uniques, dtype=object).str.strip()
+    parts = values.str.extract(CENTS_REGEX)
+    plain = parts[1].notna().to_numpy()
+
+    cents = np.zeros(len(uniques), dtype=np.int64)
+    try:
+        units = parts[1][plain].astype(np.int64).to_numpy()
+        decimals = parts[2][plain].fillna("0").astype(np.int64).to_numpy()
+    except (OverflowError, ValueError) as e:
+        raise BulkFormatError(f"{name} out of range: {e}")
+    if (units > MAX_CENTS_UNITS).any():
+        raise BulkFormatError(f"{name} out of range")
+    signed = np.where(parts[0][plain].to_numpy() == "-", -1, 1)
+    cents[plain] = signed * (units * 100 + decimals)
+
+    for i in np.flatnonzero(~plain):
+        try:
+            cents[i] = parser._parse_amount_cents(uniques[i], name)
+        except (OverflowError, ValueError) as e:
+            raise BulkFormatError(f"invalid {name}: {e}")
+    return cents[codes]
+
+
+def read_bulk(parser: "FECParser", col_map: dict, header_end: int) -> ColumnarParseResult:
+    """Read the data rows of ``parser.file_path`` into columns with pandas.
+
+    The file must use ``parser.encoding`` and ``parser.delimiter`` (already
+    detected) and its header must end at byte ``header_end``.
+
+    Raises:
+        BulkFormatError: If any row would be an error or be read differently
+                         by the row-by-row parser
+    """
+    file_path = str(parser.file_path)
+    columns = ("date", "account", "label", "debit", "credit")
+    used = [col_map[name] for name in columns]
+    check_layout(file_path, header_end, parser.delimiter, max(used) + 1)
+
+    def date_day(raw: str) -> int:
+        try:
+            return parser._parse_date(raw.strip()).toordinal() - EPOCH_ORDINAL
+        except ValueError as e:
+            raise BulkFormatError(str(e))
+
+    def account(raw: str) -> str:
+        value = raw.strip()
+        if not value:
+            raise BulkFormatError("empty account number")
+        return value
+
+    dates = _Encoder(date_day, dictionary=False)
+    accounts = _Encoder(account, dictionary=True)
+    labels = _Encoder(str.strip, dictionary=True)
+    chunks: Dict[str, List[np.ndarray]] = {name: [] for name in columns}
+
+    try:
+        reader = pd.read_csv(
+            file_path,
+            sep=parser.delimiter,
+            encoding=parser.encoding,
+            header=None,
+            skiprows=1,
+            usecols=used,
+            dtype=object,
+            na_filter=False,
+            quoting=csv.QUOTE_NONE,
+            skip_blank_lines=True,
+            engine="c",
+            chunksize=BULK_CHUNK_ROWS,
+        )
+        with reader:
+            for chunk in reader:
+                chunks["date"].append(dates.encode(chunk[col_map["date"]]))
+                chunks["account"].append(accounts.encode(chunk[col_map["account"]]))
+                chunks["label"].append(labels.encode(chunk[col_map["label"]]))
+                chunks["debit"].append(_amount_cents(parser, chunk[col_map["debit"]], "debit"))
+                chunks["credit"].append(_amount_cents(parser, chunk[col_map["credit"]], "credit"))
+    except pd.errors.EmptyDataError:
+        pass
+    except (pd.errors.ParserError, UnicodeDecodeError) as e:
+        raise BulkFormatError(f"{type(e).__name__}: {e}")
+
+    def joined(name: str, dtype) -> np.ndarray:
+        parts = chunks[name]
+        return np.concatenate(parts).astype(dtype) if parts else np.zeros(0, dtype=dtype)
+
+    result = ColumnarParseResult(
+        days=joined("date", np.int32),
+        account_codes=joined("account", np.int32),
+        label_codes=joined("label", np.int32),
+        debit_cents=joined("debit", np.int64),
+        credit_cents=joined("credit", np.int64),
+        accounts=accounts.values,
+        labels=labels.values,
+        source_year=parser.source_year,
+    )
+    result.total_rows = len(result)
+    return result
@@ -0,0 +1,144 @@
+"""Content-addressed on-disk cache of parsed FEC files."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+from .columnar import ColumnarParseResult
+from .fec_parser import PARSER_VERSION, ParseError
+
+logger = logging.getLogger(__name__)
+
+# Cache directory name under UPLOAD_TEMP_DIR (skipped by session cleanup)
+PARSE_CACHE_DIRNAME = "cache"
+
+COLUMNS = ("days", "account_codes", "label_codes", "debit_cents", "credit_cents")
+
+
+class ParseCache:
+    """Store parsed FEC files keyed by the SHA-256 of their raw bytes.
+
+    Each entry is a ``.npz`` file holding the ColumnarParseResult arrays and a
+    JSON metadata blob (dictionaries, errors, encoding...). The key includes
+    PARSER_VERSION, so bumping it invalidates all entries. When the cache grows
+    beyond ``max_bytes``, least recently used entries are evicted (a hit
+    refreshes the file's mtime).
+    """
+
+    HASH_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, cache_dir: Union[str, Path], max_bytes: int):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @classmethod
+    def hash_file(cls, file_path: Union[str, Path]) -> str:
+        """SHA-256 hex digest of a file's raw bytes."""
+        digest = hashlib.sha256()
+        with open(file_path, "rb") as f:
+            while chunk := f.read(cls.HASH_CHUNK_SIZE):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.v{PARSER_VERSION}.npz"
+
+    def load(self, digest: str) -> Optional[Tuple[ColumnarParseResult, dict]]:
+        """Load a cached parse result.
+
+        Returns:
+            (columns, metadata) or None on a miss. ``columns.source_year`` is
+            not stored (it comes from the file name, not the content).
+        """
+        path = self._path(digest)
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in COLUMNS}
+                meta = json.loads(data["meta"].tobytes().decode("utf-8"))
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            logger.warning(f"Discarding unreadable parse cache entry {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+
+        columns = ColumnarParseResult(
+            **arrays,
+            accounts=meta.pop("accounts"),
+            labels=meta.pop("labels"),
+            errors=[ParseError(*error) for error in meta.pop("errors")],
+            warnings=meta.pop("warnings"),
+            total_rows=meta.pop("total_rows"),
+            error_count=meta.pop("error_count"),
+            error_counts=meta.pop("error_counts"),
+        )
+        logger.debug(f"Parse cache hit: {path.name}")
+        return columns, meta
+
+    def store(self, digest: str, columns: ColumnarParseResult, meta: dict) -> None:
+        """Write a parse result, then evict old entries if over max_bytes.
+
+        Args:
+            digest: hash_file() digest of the source file
+            columns: Parsed columns (with errors, warnings and total_rows)
+            meta: Extra JSON-serializable metadata returned by load()
+        """
+        meta = dict(
+            meta,
+            accounts=columns.accounts,
+            labels=columns.labels,
+            errors=[[e.row, e.column, e.value, e.message] for e in columns.errors],
+            warnings=columns.warnings,
+            total_rows=columns.total_rows,
+            error_count=columns.error_count,
+            error_counts=columns.error_counts,
+        )
+        arrays = {name: getattr(columns, name) for name in COLUMNS}
+        arrays["meta"] = np.frombuffer(json.dumps(meta).encode("utf-8"), dtype=np.uint8)
+
+        # Write to a temporary file and rename, so readers never see a partial entry
+        fd, tmp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(tmp_name, self._path(digest))
+        except OSError as e:
+            logger.warning(f"Could not write parse cache entry: {e}")
+            Path(tmp_name).unlink(missing_ok=True)
+            return
+
+        self._evict()
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the cache fits max_bytes."""
+        files = []
+        for path in self.cache_dir.glob("*.npz"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            logger.debug(f"Evicted parse cache entry {path.name}")
+
+
+def create_parse_cache(temp_dir: Union[str, Path], max_bytes: int) -> Optional[ParseCache]:
+    """Create the parse cache under ``temp_dir``, or None if max_bytes <= 0."""
+    if max_bytes <= 0:
+        return None
+    return ParseCache(Path(temp_dir) / PARSE_CACHE_DIRNAME, max_bytes)
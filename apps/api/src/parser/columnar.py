@@ -0,0 +1,237 @@
+"""Columnar (NumPy) representation of a parsed FEC file."""
+
+from array import array
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.models.entry import CentsJournalEntry, JournalEntry, cents_to_decimal
+
+from .fec_parser import MAX_CENTS, ParseError
+
+# Day numbers are counted from the Unix epoch, like numpy's datetime64[D]
+EPOCH_ORDINAL = date(1970, 1, 1).toordinal()
+
+
+@dataclass
+class ColumnarParseResult:
+    """Result of parsing a FEC file as NumPy columns instead of entry objects.
+
+    Row i of the file is ``days[i]``, ``accounts[account_codes[i]]``,
+    ``labels[label_codes[i]]``, ``debit_cents[i]`` and ``credit_cents[i]``.
+    Account numbers and labels are dictionary-encoded: the code arrays index
+    into ``accounts`` / ``labels``, which hold each distinct value once.
+    """
+    days: np.ndarray             # int32, days since 1970-01-01
+    account_codes: np.ndarray    # int32, index into accounts
+    label_codes: np.ndarray      # int32, index into labels
+    debit_cents: np.ndarray      # int64
+    credit_cents: np.ndarray     # int64
+    accounts: List[str] = field(default_factory=list)
+    labels: List[str] = field(default_factory=list)
+    source_year: Optional[int] = None
+    errors: List[ParseError] = field(default_factory=list)   # sample, see ParseResult
+    warnings: List[str] = field(default_factory=list)
+    total_rows: int = 0
+    error_count: int = 0
+    error_counts: Dict[str, int] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.days)
+
+    @property
+    def success_rate(self) -> float:
+        """Percentage of rows successfully parsed."""
+        if self.total_rows == 0:
+            return 0.0
+        return (self.total_rows - self.error_count) / self.total_rows * 100
+
+    @property
+    def has_errors(self) -> bool:
+        """Check if there are any parsing errors."""
+        return self.error_count > 0
+
+    @property
+    def dates(self) -> np.ndarray:
+        """Entry dates as datetime64[D]."""
+        return self.days.astype("datetime64[D]")
+
+    @property
+    def fiscal_years(self) -> np.ndarray:
+        """Calendar year of each entry date (JournalEntry.fiscal_year)."""
+        return self.dates.astype("datetime64[Y]").astype(np.int32) + 1970
+
+    @property
+    def effective_years(self) -> np.ndarray:
+        """Balance sheet year of each entry (JournalEntry.effective_year)."""
+        if self.source_year is None:
+            return self.fiscal_years
+        return np.full(len(self), self.source_year, dtype=np.int32)
+
+    @property
+    def months(self) -> np.ndarray:
+        """Month (1-12) of each entry date."""
+        return self.dates.astype("datetime64[M]").astype(np.int32) % 12 + 1
+
+    @property
+    def amount_cents(self) -> np.ndarray:
+        """Net amount (debit - credit) of each entry, in cents."""
+        return self.debit_cents - self.credit_cents
+
+    @property
+    def years(self) -> List[int]:
+        """Unique fiscal years in the data."""
+        return [int(y) for y in np.unique(self.fiscal_years)]
+
+    def account_totals(self, year: Optional[int] = None) -> Dict[str, Tuple[int, int]]:
+        """Sum debit and credit cents per account number.
+
+        Args:
+            year: Only include entries of this fiscal year (all if None)
+
+        Returns:
+            Dict mapping account number to (debit_cents, credit_cents),
+            for accounts having at least one matching entry.
+        """
+        codes = self.account_codes
+        debit, credit = self.debit_cents, self.credit_cents
+        if year is not None:
+            mask = self.fiscal_years == year
+            codes, debit, credit = codes[mask], debit[mask], credit[mask]
+
+        # np.add.at keeps int64 arithmetic exact (bincount would go through float64)
+        debit_sums = np.zeros(len(self.accounts), dtype=np.int64)
+        credit_sums = np.zeros(len(self.accounts), dtype=np.int64)
+        np.add.at(debit_sums, codes, debit)
+        np.add.at(credit_sums, codes, credit)
+
+        return {
+            self.accounts[code]: (int(debit_sums[code]), int(credit_sums[code]))
+            for code in np.unique(codes)
+        }
+
+    def to_entries(self, amount_mode: str = "cents") -> List[JournalEntry]:
+        """Materialize the rows as journal entries.
+
+        Args:
+            amount_mode: "cents" for CentsJournalEntry objects, or "decimal"
+                         for JournalEntry objects with 2-decimal amounts
+        """
+        epoch = EPOCH_ORDINAL
+        dates: Dict[int, date] = {}
+        entries = []
+        for day, account, label, debit, credit in zip(
+            self.days.tolist(),
+            self.account_codes.tolist(),
+            self.label_codes.tolist(),
+            self.debit_cents.tolist(),
+            self.credit_cents.tolist(),
+        ):
+            entry_date = dates.get(day)
+            if entry_date is None:
+                entry_date = dates[day] = date.fromordinal(day + epoch)
+            if amount_mode == "cents":
+                entries.append(CentsJournalEntry(
+                    date=entry_date,
+                    account_num=self.accounts[account],
+                    label=self.labels[label],
+                    debit_cents=debit,
+                    credit_cents=credit,
+                    source_year=self.source_year,
+                ))
+            else:
+                entries.append(JournalEntry(
+                    date=entry_date,
+                    account_num=self.accounts[account],
+                    label=self.labels[label],
+                    debit=cents_to_decimal(debit),
+                    credit=cents_to_decimal(credit),
+                    source_year=self.source_year,
+                ))
+        return entries
+
+    @classmethod
+    def from_entries(
+        cls,
+        entries: Iterable[JournalEntry],
+        source_year: Optional[int] = None,
+    ) -> "ColumnarParseResult":
+        """Build columns from journal entries (Decimal or cents).
+
+        Raises:
+            ValueError: If an amount has more than 2 decimal places or does
+                        not fit in int64 cents
+        """
+        encoder = ColumnarEncoder()
+        for entry in entries:
+            encoder.append(entry)
+        return encoder.build(source_year=source_year)
+
+
+class ColumnarEncoder:
+    """Append journal entries into growable typed buffers.
+
+    Used by FECParser.parse_columnar() so that only the compact columns are
+    kept in memory, not one object per row.
+    """
+
+    def __init__(self):
+        self._days = array("i")
+        self._account_codes = array("i")
+        self._label_codes = array("i")
+        self._debit = array("q")
+        self._credit = array("q")
+        self._accounts: Dict[str, int] = {}
+        self._labels: Dict[str, int] = {}
+        self._day_numbers: Dict[date, int] = {}
+
+    def append(self, entry: JournalEntry) -> None:
+        """Encode one entry as a new row."""
+        day = self._day_numbers.get(entry.date)
+        if day is None:
+            day = self._day_numbers[entry.date] = entry.date.toordinal() - EPOCH_ORDINAL
+
+        account = self._accounts.get(entry.account_num)
+        if account is None:
+            account = self._accounts[entry.account_num] = len(self._accounts)
+
+        label = self._labels.get(entry.label)
+        if label is None:
+            label = self._labels[entry.label] = len(self._labels)
+
+        if isinstance(entry, CentsJournalEntry):
+            debit, credit = entry.debit_cents, entry.credit_cents
+        else:
+            debit, credit = _to_cents(entry.debit), _to_cents(entry.credit)
+
+        self._days.append(day)
+        self._account_codes.append(account)
+        self._label_codes.append(label)
+        self._debit.append(debit)
+        self._credit.append(credit)
+
+    def build(self, source_year: Optional[int] = None) -> ColumnarParseResult:
+        """Freeze the buffers into a ColumnarParseResult."""
+        return ColumnarParseResult(
+            days=np.frombuffer(self._days, dtype=np.int32).copy(),
+            account_codes=np.frombuffer(self._account_codes, dtype=np.int32).copy(),
+            label_codes=np.frombuffer(self._label_codes, dtype=np.int32).copy(),
+            debit_cents=np.frombuffer(self._debit, dtype=np.int64).copy(),
+            credit_cents=np.frombuffer(self._credit, dtype=np.int64).copy(),
+            accounts=list(self._accounts),
+            labels=list(self._labels),
+            source_year=source_year,
+        )
+
+
+def _to_cents(amount) -> int:
+    """Convert a Decimal amount to integer cents, rejecting sub-cent values
+    and amounts that do not fit in int64."""
+    cents = amount * 100
+    if not cents.is_finite() or not -MAX_CENTS <= cents <= MAX_CENTS:
+        raise ValueError(f"Amount {amount} is out of range for cents")
+    if cents != cents.to_integral_value():
+        raise ValueError(f"Amount {amount} has more than 2 decimal places")
+    return int(cents)
@@ -0,0 +1,128 @@
+"""Streaming decompression of compressed FEC files (.gz, .zip, .zst)."""
+
+import gzip
+import shutil
+import tempfile
+import zipfile
+import zlib
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Union
+
+# zstandard is optional - only needed for .zst files
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Errors raised by the decompressors on truncated or corrupt data
+DECOMPRESSION_ERRORS: tuple = (EOFError, zlib.error, zipfile.BadZipFile)
+if zstandard is not None:
+    DECOMPRESSION_ERRORS += (zstandard.ZstdError,)
+
+# File suffix -> compression format
+COMPRESSED_SUFFIXES = {
+    ".gz": "gzip",
+    ".zip": "zip",
+    ".zst": "zstd",
+}
+
+
+class LimitedReader:
+    """Decompressed stream wrapper raising ValueError on bad or oversized data.
+
+    Truncated or corrupt compressed data is reported as ValueError whatever
+    the format. With ``max_bytes`` set, reads never ask the wrapped stream
+    for more than one byte past the limit, so a decompression bomb is
+    stopped before it is inflated.
+    """
+
+    def __init__(self, stream: BinaryIO, max_bytes: Optional[int] = None):
+        self._stream = stream
+        self.max_bytes = max_bytes
+        self._remaining = max_bytes
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0:
+            chunks = []
+            while chunk := self.read(1024 * 1024):
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+        if self._remaining is not None:
+            size = min(size, self._remaining + 1)
+        try:
+            data = self._stream.read(size)
+        except DECOMPRESSION_ERRORS as e:
+            raise ValueError(f"Invalid compressed data: {e}")
+        if self._remaining is None:
+            return data
+        self._remaining -= len(data)
+        if self._remaining < 0:
+            raise ValueError(f"Decompressed data exceeds the limit of {self.max_bytes} bytes")
+        return data
+
+    def seekable(self) -> bool:
+        return False
+
+
+def compression_of(file_path: Union[str, Path]) -> Optional[str]:
+    """Compression format of a file from its suffix, or None if plain."""
+    return COMPRESSED_SUFFIXES.get(Path(file_path).suffix.lower())
+
+
+def inner_suffix(file_path: Union[str, Path]) -> str:
+    """Suffix of the uncompressed file (``FEC.txt.gz`` -> ``.txt``)."""
+    path = Path(file_path)
+    if compression_of(path) is not None:
+        path = Path(path.stem)
+    return path.suffix.lower()
+
+
+@contextmanager
+def open_decompressed(
+    raw: BinaryIO, compression: str, max_bytes: Optional[int] = None
+) -> Iterator[BinaryIO]:
+    """Wrap a compressed binary stream in a stream of its decompressed bytes.
+
+    gzip and zstd are decompressed as ``raw`` is read, so ``raw`` may be a
+    non-seekable stream. A zip archive must hold exactly one file; since its
+    directory is at the end, a non-seekable ``raw`` is first spooled to a
+    temporary file (the compressed bytes only).
+
+    Args:
+        max_bytes: Limit of the decompressed size; reading past it raises
+                   ValueError (see LimitedReader)
+
+    Raises:
+        ValueError: If the format is unsupported, the archive is invalid,
+                    or (while read) the data is truncated, corrupt or
+                    inflates past ``max_bytes``
+    """
+    with ExitStack() as stack:
+        if compression == "gzip":
+            stream = stack.enter_context(gzip.GzipFile(fileobj=raw, mode="rb"))
+        elif compression == "zstd":
+            if zstandard is None:
+                raise ValueError("Reading .zst files requires the zstandard package")
+            reader = zstandard.ZstdDecompressor().stream_reader(raw, closefd=False)
+            stream = stack.enter_context(reader)
+        elif compression == "zip":
+            if not raw.seekable():
+                spool = stack.enter_context(tempfile.TemporaryFile())
+                shutil.copyfileobj(raw, spool)
+                raw = spool
+            try:
+                archive = stack.enter_context(zipfile.ZipFile(raw))
+            except zipfile.BadZipFile as e:
+                raise ValueError(f"Invalid zip archive: {e}")
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            if len(members) != 1:
+                raise ValueError(
+                    f"Zip archive must contain exactly one FEC file, found {len(members)}"
+                )
+            stream = stack.enter_context(archive.open(members[0]))
+        else:
+            raise ValueError(f"Unsupported compression: {compression}")
+
+        yield LimitedReader(stream, max_bytes)
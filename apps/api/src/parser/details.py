@@ -0,0 +1,101 @@
+"""Side-store for the optional FEC columns (JournalCode, PieceRef...)."""
+
+from array import array
+from dataclasses import fields
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+from src.models.entry import FECDetail
+
+from .fec_parser import FECParser
+
+DATE_FIELDS = {"piece_date", "date_let", "valid_date"}
+AMOUNT_FIELDS = {"montant_devise"}
+
+
+class FECDetails:
+    """Dictionary-encoded columns holding the optional FEC fields of a file.
+
+    Built by FECParser(details=True) while parsing: row i holds the fields
+    of the i-th parsed entry. Each column stores one int32 code per row and
+    each distinct raw string once; columns absent from the file store
+    nothing. FECDetail objects and typed values (dates, Decimal) are only
+    built when row() or column() is called.
+    """
+
+    def __init__(self, col_map: Dict[str, Optional[int]], date_formats: Sequence[str]):
+        """
+        Args:
+            col_map: Column index of each FECDetail field (None if absent)
+            date_formats: Formats tried when converting date fields
+        """
+        self._indices = {name: idx for name, idx in col_map.items() if idx is not None}
+        self._date_formats = list(date_formats)
+        self._codes = {name: array("i") for name in self._indices}
+        self._values: Dict[str, List[str]] = {name: [] for name in self._indices}
+        self._lookup: Dict[str, Dict[str, int]] = {name: {} for name in self._indices}
+        self._converted: Dict[str, Dict[int, Any]] = {name: {} for name in self._indices}
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    @property
+    def columns(self) -> List[str]:
+        """FECDetail fields present in the file."""
+        return list(self._indices)
+
+    def append(self, row: List[str]) -> None:
+        """Encode the optional fields of one parsed CSV row."""
+        for name, idx in self._indices.items():
+            value = row[idx].strip() if idx < len(row) else ""
+            lookup = self._lookup[name]
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(lookup)
+                self._values[name].append(value)
+            self._codes[name].append(code)
+        self._rows += 1
+
+    def row(self, index: int) -> FECDetail:
+        """Materialize the optional fields of row ``index``."""
+        if not 0 <= index < self._rows:
+            raise IndexError(f"Row {index} out of range ({self._rows} rows)")
+        return FECDetail(**{
+            name: self._value(name, self._codes[name][index]) for name in self._indices
+        })
+
+    def column(self, name: str) -> List[Any]:
+        """Materialize one field for every row (typed like FECDetail)."""
+        if name not in {f.name for f in fields(FECDetail)}:
+            raise KeyError(f"Unknown FEC detail column: {name}")
+        if name not in self._indices:
+            return [getattr(FECDetail(), name)] * self._rows
+        return [self._value(name, code) for code in self._codes[name]]
+
+    def _value(self, name: str, code: int) -> Any:
+        """Typed value of a column code (converted once per distinct value)."""
+        raw = self._values[name][code]
+        if name not in DATE_FIELDS and name not in AMOUNT_FIELDS:
+            return raw
+
+        converted = self._converted[name]
+        if code not in converted:
+            converted[code] = self._convert(name, raw)
+        return converted[code]
+
+    def _convert(self, name: str, raw: str) -> Any:
+        """Convert a raw date or amount; None if empty or invalid."""
+        if not raw:
+            return None
+        if name in AMOUNT_FIELDS:
+            try:
+                return FECParser._parse_amount(raw, name)
+            except ValueError:
+                return None
+        for fmt in self._date_formats:
+            try:
+                return datetime.strptime(raw, fmt).date()
+            except ValueError:
+                continue
+        return None
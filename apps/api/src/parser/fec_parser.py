@@ -1,19 +1,79 @@
 """FEC file parser - handles French accounting export files."""
 
+import codecs
 import csv
 import logging
+import math
+import mmap
+import os
+import random
 import re
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from decimal import Decimal, InvalidOperation
-from io import StringIO
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Union
-
-from src.models.entry import JournalEntry
+from typing import (
+    TYPE_CHECKING,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from src.models.cube import AccountCube
+from src.models.entry import (
+    CentsJournalEntry,
+    DetailedCentsJournalEntry,
+    DetailedJournalEntry,
+    JournalEntry,
+)
+
+from .compression import compression_of, open_decompressed
+from .stream import HashingReader
+
+if TYPE_CHECKING:
+    from .cache import ParseCache
+    from .columnar import ColumnarParseResult
+    from .details import FECDetails
+    from .probe import FECProbe
 
 logger = logging.getLogger(__name__)
 
+# Bump when parsed output changes for the same input (invalidates ParseCache)
+PARSER_VERSION = 3
+
+# ParseResult keeps the first ERROR_SAMPLE_HEAD errors and a sample of the
+# others, ERROR_SAMPLE_SIZE in total; all errors are counted
+ERROR_SAMPLE_HEAD = 50
+ERROR_SAMPLE_SIZE = 100
+
+# Largest amount in cents held by the int64 columns of cents mode
+MAX_CENTS = 2**63 - 1
+
+# Scale of parsed amounts: FEC amounts have 2 decimal places
+CENT = Decimal("0.01")
+ZERO_AMOUNT = Decimal("0.00")
+
+# Split decoded text after each LF, and after each CR not starting a CRLF
+# (a CR ending the text is kept: it may be followed by the next chunk's LF)
+LINE_BREAK = re.compile(r"(?<=\n)|(?<=\r)(?=[^\n])")
+
+# A CR line break (old Mac files), which the byte-level readers do not split on
+LONE_CR = re.compile(rb"\r(?!\n)")
+
+
+def _error_priority(row: int) -> int:
+    """Pseudo-random but deterministic sampling priority of an error row."""
+    return (row * 2654435761) & 0xFFFFFFFF
+
 
 @dataclass
 class ParseError:
@@ -27,25 +87,91 @@ class ParseError:
         return f"Row {self.row}, column '{self.column}': {self.message} (value: '{self.value}')"
 
 
+class RowError(ValueError):
+    """A row could not be parsed; ``column`` is the field that failed."""
+
+    def __init__(self, message: str, column: str):
+        super().__init__(message)
+        self.column = column
+
+
 @dataclass
 class ParseResult:
-    """Result of parsing a FEC file with entries and any errors."""
+    """Result of parsing a FEC file with entries and any errors.
+
+    ``errors`` is a bounded sample: the first ERROR_SAMPLE_HEAD errors, then
+    a deterministic sample of the later ones (in row order), so a file full
+    of bad rows does not hold one ParseError per row. ``error_count`` and
+    ``error_counts`` (by column) count every error.
+    """
     entries: List[JournalEntry] = field(default_factory=list)
     errors: List[ParseError] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     total_rows: int = 0
+    error_count: int = 0
+    error_counts: Dict[str, int] = field(default_factory=dict)
+
+    def __post_init__(self):
+        # Errors given directly (e.g. rebuilt from the cache) are all counted
+        if self.errors and not self.error_count:
+            self.error_count = len(self.errors)
+        self._sample_max: Optional[int] = None
 
     @property
     def success_rate(self) -> float:
         """Percentage of rows successfully parsed."""
         if self.total_rows == 0:
             return 0.0
-        return (self.total_rows - len(self.errors)) / self.total_rows * 100
+        return (self.total_rows - self.error_count) / self.total_rows * 100
 
     @property
     def has_errors(self) -> bool:
         """Check if there are any parsing errors."""
-        return len(self.errors) > 0
+        return self.error_count > 0
+
+    def add_error(self, row: int, column: str, message: str, value: Callable[[], str]) -> None:
+        """Count an error and keep it if it belongs to the sample.
+
+        ``value`` builds the offending row text; it is only called for kept
+        errors.
+        """
+        self.error_counts[column] = self.error_counts.get(column, 0) + 1
+        if self._samples(row, self.error_count):
+            error = ParseError(row=row, column=column, value=value(), message=message)
+            self._keep(error)
+            logger.debug(f"Parse error: {error}")
+        self.error_count += 1
+
+    def merge_errors(self, part: "ParseResult") -> None:
+        """Add the errors of the parse of the next part of the same file.
+
+        Keeps the same sample as a single parse of both parts would.
+        """
+        for i, error in enumerate(part.errors):
+            # A part's first errors are exact; its later ones are >= HEAD anyway
+            if self._samples(error.row, self.error_count + i):
+                self._keep(error)
+        self.error_count += part.error_count
+        for column, count in part.error_counts.items():
+            self.error_counts[column] = self.error_counts.get(column, 0) + count
+
+    def _samples(self, row: int, index: int) -> bool:
+        """Whether the ``index``-th error (on ``row``) enters the sample."""
+        if index < ERROR_SAMPLE_HEAD or len(self.errors) < ERROR_SAMPLE_SIZE:
+            return True
+        if self._sample_max is None:
+            self._sample_max = max(
+                range(ERROR_SAMPLE_HEAD, len(self.errors)),
+                key=lambda i: _error_priority(self.errors[i].row),
+            )
+        return _error_priority(row) < _error_priority(self.errors[self._sample_max].row)
+
+    def _keep(self, error: ParseError) -> None:
+        """Add a sampled error, evicting the lowest priority later error if full."""
+        if len(self.errors) >= ERROR_SAMPLE_SIZE:
+            del self.errors[self._sample_max]
+            self._sample_max = None
+        self.errors.append(error)
 
 
 class FECParser:
@@ -58,19 +184,88 @@ class FECParser:
     DEBIT_COLUMNS = {"debit", "montantdebit"}
     CREDIT_COLUMNS = {"credit", "montantcredit"}
 
+    # Optional standard FEC columns kept with details=True (FECDetail fields)
+    DETAIL_COLUMNS = {
+        "journalcode": "journal_code",
+        "journallib": "journal_lib",
+        "ecriturenum": "ecriture_num",
+        "comptelib": "compte_lib",
+        "compauxnum": "comp_aux_num",
+        "compauxlib": "comp_aux_lib",
+        "pieceref": "piece_ref",
+        "piecedate": "piece_date",
+        "ecriturelet": "ecriture_let",
+        "datelet": "date_let",
+        "validdate": "valid_date",
+        "montantdevise": "montant_devise",
+        "idevise": "idevise",
+    }
+
+    # Accepted EcritureDate formats, in search order
+    DATE_FORMATS = [
+        "%Y-%m-%d",  # 2024-01-15
+        "%d/%m/%Y",  # 15/01/2024
+        "%d-%m-%Y",  # 15-01-2024
+        "%Y%m%d",    # 20240115
+    ]
+
+    # Maximum number of distinct date strings memoized per file
+    DATE_CACHE_SIZE = 100_000
+
+    # Maximum number of distinct labels interned per file (accounts are
+    # always interned: a FEC has at most a few thousand of them)
+    LABEL_INTERN_SIZE = 100_000
+
     # Encoding detection order
     ENCODINGS = ["utf-8", "utf-8-sig", "iso-8859-1", "cp1252", "latin-1"]
 
+    # Encoding detection sample: head, tail and a few random windows (64 KB each)
+    ENCODING_SAMPLE_SIZE = 64 * 1024
+    ENCODING_SAMPLE_WINDOWS = 4
+
     # Pattern to extract year from FEC filename (e.g., 844118190FEC20241231.txt)
     FEC_YEAR_PATTERN = re.compile(r"FEC(\d{4})")
 
     # Default error threshold (percentage of rows that can fail before raising)
     DEFAULT_ERROR_THRESHOLD = 5.0
 
+    # Early abort: after EARLY_ABORT_MIN_ROWS rows, stop once the error rate
+    # is above the threshold with EARLY_ABORT_Z confidence (3.29 is 99.95%
+    # one-sided, Wilson score interval) and the errors read so far exceed
+    # the threshold over EARLY_ABORT_ROWS_SLACK times the estimated row
+    # count of the file (errors cluster, so the head is not a fair sample)
+    EARLY_ABORT_MIN_ROWS = 1000
+    EARLY_ABORT_Z = 3.29
+    EARLY_ABORT_ROWS_SLACK = 2
+
+    # Size of the binary chunks read from disk while streaming (1 MB)
+    READ_CHUNK_SIZE = 1024 * 1024
+
+    # Files smaller than this are parsed sequentially by parse_parallel()
+    PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+
+    # Byte ranges handed out per worker by parse_parallel() (load balancing)
+    PARALLEL_RANGES_PER_WORKER = 4
+
+    # Amount representations: Decimal (default) or integer cents
+    AMOUNT_MODES = ("decimal", "cents")
+
+    # Parse paths selectable by parse_with_mode() (PARSE_MODE setting)
+    PARSE_MODES = ("csv", "mmap", "parallel", "bulk")
+
+    # Fast path for plain amounts such as "1234,56", "-12.50" or "100"
+    CENTS_PATTERN = re.compile(r"(-?)([0-9]+)(?:[.,]([0-9]{2}))?")
+
     def __init__(
         self,
         file_path: Union[str, Path],
         error_threshold: float = DEFAULT_ERROR_THRESHOLD,
+        amount_mode: str = "decimal",
+        cache: Optional["ParseCache"] = None,
+        details: bool = False,
+        aggregate: bool = False,
+        early_abort: bool = True,
+        max_decompressed_bytes: Optional[int] = None,
     ):
         """
         Initialize FEC parser.
@@ -79,14 +274,53 @@ class FECParser:
             file_path: Path to the FEC file
             error_threshold: Maximum percentage of rows that can fail parsing
                            before raising an error (default: 5.0%)
+            amount_mode: "decimal" for Decimal amounts, or "cents" to store
+                         amounts as integer cents (CentsJournalEntry)
+            cache: Optional ParseCache; parse_with_result() then reuses the
+                   result of a previous parse of a file with the same bytes
+            details: Also keep the optional FEC columns (JournalCode,
+                     PieceRef...) in a side-store, see ``details``. Files are
+                     then always parsed by the csv path, without the cache.
+                     The store holds every parsed row, including with
+                     iter_entries().
+            aggregate: Also sum entries into an AccountCube while parsing,
+                       see ``cube``
+            early_abort: Stop parsing as soon as the rows read so far show,
+                         with high confidence, an error rate above
+                         ``error_threshold`` (instead of checking at the
+                         end); only for uncompressed files read from disk
+            max_decompressed_bytes: Reject compressed files (ValueError)
+                                    whose data inflates past this size
         """
+        if amount_mode not in self.AMOUNT_MODES:
+            raise ValueError(
+                f"Invalid amount_mode '{amount_mode}'. Expected one of {self.AMOUNT_MODES}"
+            )
+
         self.file_path = Path(file_path)
         self.entries: List[JournalEntry] = []
         self._encoding: Optional[str] = None
         self._delimiter: Optional[str] = None
         self._source_year: Optional[int] = self._extract_source_year()
+        self._compression: Optional[str] = compression_of(self.file_path)
+        self._max_decompressed_bytes = max_decompressed_bytes
         self._error_threshold = error_threshold
+        self._early_abort = early_abort
+        self._estimated_rows: Optional[float] = None  # row count for early abort
+        self._amount_mode = amount_mode
+        self._cache = cache if not details else None
+        self._keep_details = details
+        self._details: Optional["FECDetails"] = None
+        # Entry types built by _parse_row() (only Detailed* link to details)
+        self._entry_type = DetailedJournalEntry if details else JournalEntry
+        self._cents_entry_type = DetailedCentsJournalEntry if details else CentsJournalEntry
+        self._aggregate = aggregate
+        self._cube: Optional[AccountCube] = None
         self._parse_result: Optional[ParseResult] = None
+        self._date_format: Optional[str] = None
+        self._date_cache: Dict[str, date] = {}
+        self._accounts: Dict[str, str] = {}
+        self._labels: Dict[str, str] = {}
 
     def _extract_source_year(self) -> Optional[int]:
         """Extract source year from FEC filename.
@@ -107,6 +341,31 @@ class FECParser:
         """The source year extracted from the FEC filename."""
         return self._source_year
 
+    @property
+    def compression(self) -> Optional[str]:
+        """Compression format from the file suffix ("gzip", "zip", "zstd"), or None."""
+        return self._compression
+
+    def probe(self, sample_rows: int = 10) -> "FECProbe":
+        """Inspect the file without parsing it (see FECProbe).
+
+        Only the head, the tail and a few evenly spaced windows of the file
+        are read (the decompressed head for compressed files), so the time
+        does not grow with the file size. Sets ``encoding``,
+        ``delimiter`` and ``date_format``.
+
+        Args:
+            sample_rows: Number of leading rows returned in FECProbe.sample
+
+        Raises:
+            ValueError: If the file cannot be decoded or lacks a required column
+        """
+        from .probe import probe_file
+
+        self._date_format = None
+        self._date_cache = {}
+        return probe_file(self, sample_rows)
+
     def parse(self) -> List[JournalEntry]:
         """Parse FEC file and return list of JournalEntry objects.
 
@@ -118,51 +377,732 @@ class FECParser:
     def parse_with_result(self) -> ParseResult:
         """Parse FEC file and return detailed ParseResult with errors.
 
+        With a cache, the file is hashed first and a cached result is
+        loaded instead of parsing when one exists.
+
         Returns:
             ParseResult containing entries, errors, warnings, and stats.
 
         Raises:
             ValueError: If error rate exceeds threshold.
         """
-        content = self._read_file()
-        self._delimiter = self._detect_delimiter(content)
-        self._parse_result = self._parse_content(content)
-        self.entries = self._parse_result.entries
+        self._start_cube()
+        digest = None
+        if self._cache is not None:
+            digest = self._cache.hash_file(self.file_path)
+            result = self._load_cached(digest)
+            if result is not None:
+                return result
+
+        result = ParseResult()
+        self._parse_result = result
+        result.entries.extend(self._aggregated(self._iter_parse(result)))
+        self.entries = result.entries
+
+        self._check_error_threshold(result)
+        if digest is not None:
+            self._store_cached(digest, result)
+        return result
+
+    def parse_with_mode(self, mode: str = "csv") -> ParseResult:
+        """Parse FEC file with one of PARSE_MODES and return a ParseResult.
+
+        "csv" is parse_with_result(); "mmap", "parallel" and "bulk" go
+        through parse_mmap(), parse_parallel() and parse_bulk(), whose
+        columns are turned into entries. All give the same entries, errors
+        and cube, and use the cache like parse_with_result() does. "bulk"
+        requires ``amount_mode="cents"``: it rejects amounts with more than
+        2 decimals, which decimal mode accepts.
+
+        Raises:
+            ValueError: If the mode is unknown, or error rate exceeds threshold.
+        """
+        if mode not in self.PARSE_MODES:
+            raise ValueError(f"Invalid parse mode '{mode}'. Expected one of {self.PARSE_MODES}")
+        if mode == "bulk" and self._amount_mode != "cents":
+            raise ValueError("Parse mode 'bulk' requires amount_mode 'cents'")
+        if mode == "csv":
+            return self.parse_with_result()
+
+        self._start_cube()
+        digest = None
+        if self._cache is not None:
+            digest = self._cache.hash_file(self.file_path)
+            result = self._load_cached(digest)
+            if result is not None:
+                return result
+
+        # Their fallbacks to parse_with_result() must not hash the file again
+        cache, self._cache = self._cache, None
+        try:
+            if mode == "mmap":
+                result = self.parse_mmap()
+            elif mode == "parallel":
+                result = self.parse_parallel()
+            else:
+                result = self._parse_bulk_result()
+        finally:
+            self._cache = cache
+
+        if digest is not None:
+            self._store_cached(digest, result)
+        return result
+
+    def _parse_bulk_result(self) -> ParseResult:
+        """parse_bulk() as a ParseResult of entries (parse_with_mode("bulk"))."""
+        aggregate, self._aggregate = self._aggregate, False
+        try:
+            columns = self.parse_bulk()
+        finally:
+            self._aggregate = aggregate
+
+        self._start_cube()
+        result = ParseResult(
+            entries=list(self._aggregated(columns.to_entries(self._amount_mode))),
+            errors=columns.errors,
+            warnings=columns.warnings,
+            total_rows=columns.total_rows,
+            error_count=columns.error_count,
+            error_counts=columns.error_counts,
+        )
+        self._parse_result = result
+        self.entries = result.entries
+        return result
+
+    def _load_cached(self, digest: str) -> Optional[ParseResult]:
+        """Rebuild a ParseResult from the cache, or None on a miss."""
+        cached = self._cache.load(digest)
+        if cached is None:
+            return None
+
+        columns, meta = cached
+        columns.source_year = self._source_year
+        self._encoding = meta["encoding"]
+        self._delimiter = meta["delimiter"]
+        self._date_format = meta["date_format"]
+
+        result = ParseResult(
+            entries=list(self._aggregated(columns.to_entries(self._amount_mode))),
+            errors=columns.errors,
+            warnings=columns.warnings,
+            total_rows=columns.total_rows,
+            error_count=columns.error_count,
+            error_counts=columns.error_counts,
+        )
+        self._parse_result = result
+        self.entries = result.entries
+
+        self._check_error_threshold(result)
+        return result
+
+    def _store_cached(self, digest: str, result: ParseResult) -> None:
+        """Save a successful parse to the cache."""
+        from .columnar import ColumnarParseResult
+
+        try:
+            columns = ColumnarParseResult.from_entries(result.entries)
+        except (ValueError, OverflowError) as e:
+            # Sub-cent or huge amounts (decimal mode) cannot be stored as cents
+            logger.info(f"Not caching {self.file_path.name}: {e}")
+            return
+
+        columns.errors = result.errors
+        columns.warnings = result.warnings
+        columns.total_rows = result.total_rows
+        columns.error_count = result.error_count
+        columns.error_counts = result.error_counts
+        self._cache.store(digest, columns, {
+            "encoding": self._encoding,
+            "delimiter": self._delimiter,
+            "date_format": self._date_format,
+        })
+
+    def iter_entries(
+        self, batch_size: Optional[int] = None
+    ) -> Iterator[Union[JournalEntry, List[JournalEntry]]]:
+        """Parse FEC file incrementally, yielding entries as rows are decoded.
+
+        The file is read in fixed-size chunks and entries are not retained,
+        so memory stays constant regardless of file size. Once the generator
+        is exhausted, ``parse_result`` holds the row count, errors and
+        warnings (with an empty ``entries`` list).
+
+        With ``details=True`` this no longer holds: the ``details`` side-store
+        keeps the optional columns of every row read (one int32 code per
+        column and row, plus each distinct value), so memory grows with the
+        file even when yielded entries are dropped.
+
+        Args:
+            batch_size: If set, yield lists of up to ``batch_size`` entries
+                        instead of individual entries.
+
+        Raises:
+            ValueError: If error rate exceeds threshold (checked at end of file).
+        """
+        if batch_size is not None and batch_size < 1:
+            raise ValueError(f"batch_size must be positive, got {batch_size}")
+
+        result = ParseResult()
+        self._parse_result = result
+        self._start_cube()
+
+        if batch_size is None:
+            yield from self._aggregated(self._iter_parse(result))
+        else:
+            batch: List[JournalEntry] = []
+            for entry in self._aggregated(self._iter_parse(result)):
+                batch.append(entry)
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        self._check_error_threshold(result)
+
+    def parse_columnar(self) -> "ColumnarParseResult":
+        """Parse FEC file into NumPy columns (see ColumnarParseResult).
+
+        Rows are encoded as they are parsed, so no JournalEntry list is kept.
+        Amounts are always stored as integer cents, whatever ``amount_mode``:
+        amounts with more than 2 decimals are reported as row errors.
+        ``parse_result`` holds the row count, errors and warnings.
+
+        Raises:
+            ValueError: If error rate exceeds threshold.
+        """
+        from .columnar import ColumnarEncoder
+
+        result = ParseResult()
+        self._parse_result = result
+        encoder = ColumnarEncoder()
+        self._start_cube()
+
+        amount_mode, self._amount_mode = self._amount_mode, "cents"
+        try:
+            for entry in self._aggregated(self._iter_parse(result)):
+                encoder.append(entry)
+        finally:
+            self._amount_mode = amount_mode
+
+        self._check_error_threshold(result)
+
+        columns = encoder.build(source_year=self._source_year)
+        columns.errors = result.errors
+        columns.warnings = result.warnings
+        columns.total_rows = result.total_rows
+        columns.error_count = result.error_count
+        columns.error_counts = result.error_counts
+        return columns
+
+    def parse_bulk(self) -> "ColumnarParseResult":
+        """Parse FEC file into NumPy columns with the pandas CSV reader.
+
+        The five used columns are read in chunks by the pandas C tokenizer
+        and converted column-at-a-time: dates, accounts and labels once per
+        distinct value, plain amounts with one vectorized pass. The result
+        is identical to parse_columnar() (amounts in cents).
+
+        Only files with no error rows are read this way. A pre-scan of the
+        bytes rejects quoted fields and short rows; any value the row
+        parser would reject stops the bulk read. The file is then parsed
+        again by parse_columnar(), which reports row errors as usual. Also
+        falls back for empty and compressed files, files with CR line breaks
+        and with ``details=True``.
+
+        Raises:
+            ValueError: If error rate exceeds threshold.
+        """
+        from .bulk import BulkFormatError, read_bulk
+
+        if (self.file_path.stat().st_size == 0 or self._compression is not None
+                or self._keep_details):
+            return self.parse_columnar()
+
+        self._encoding = self._detect_encoding()
+        self._date_format = None
+        self._date_cache = {}
+
+        with open(self.file_path, "rb") as f:
+            header = f.readline()
+        if LONE_CR.search(header):
+            return self.parse_columnar()
+        header_text = header.decode(self._encoding)
+        self._delimiter = self._detect_delimiter(header_text)
+        raw_headers = next(csv.reader([header_text], delimiter=self._delimiter))
+        col_map = self._map_columns([h.strip().lower() for h in raw_headers])
+
+        try:
+            columns = read_bulk(self, col_map, len(header))
+        except BulkFormatError as e:
+            logger.debug(f"{self.file_path.name}: bulk read stopped ({e}), parsing row by row")
+            return self.parse_columnar()
+
+        result = ParseResult(total_rows=columns.total_rows)
+        self._parse_result = result
+        self._start_cube()
+        if self._cube is not None:
+            for entry in columns.to_entries():
+                self._cube.add(entry)
+        return columns
+
+    def parse_mmap(self) -> ParseResult:
+        """Parse FEC file from a read-only memory map of its bytes.
+
+        Lines are tokenized in place and only the five used fields of each
+        row are decoded, so no decoded copy of the file is built and
+        concurrent parses of the same file share the OS page cache instead
+        of each holding the contents on its heap. Entries and errors are
+        identical to parse_with_result().
+
+        Falls back to parse_with_result() for empty and compressed files,
+        with ``details=True``, for files containing quote characters (quoted
+        fields need the csv module) or CR line breaks (rows are split on LF
+        only) and for files that do not decode entirely with the detected
+        encoding (the csv path fails over chunk by chunk, which decoding only
+        the used fields cannot reproduce).
+
+        Raises:
+            ValueError: If error rate exceeds threshold.
+        """
+        if (self.file_path.stat().st_size == 0 or self._compression is not None
+                or self._keep_details):
+            return self.parse_with_result()
+
+        self._encoding = self._detect_encoding()
+        self._date_format = None
+        self._date_cache = {}
+        self._accounts = {}
+        self._labels = {}
+
+        result = ParseResult()
+        with open(self.file_path, "rb") as f, \
+                mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if mm.find(b'"') != -1:
+                logger.debug(f"{self.file_path.name} contains quoted fields, parsing with csv")
+                return self.parse_with_result()
+            if LONE_CR.search(mm):
+                logger.debug(f"{self.file_path.name} has CR line breaks, parsing with csv")
+                return self.parse_with_result()
+            if not self._range_decodes(mm, (0, len(mm))):
+                logger.debug(f"{self.file_path.name} is not all {self._encoding}, parsing with csv")
+                return self.parse_with_result()
+
+            header_end = mm.find(b"\n") + 1 or len(mm)
+            header_text = mm[:header_end].decode(self._encoding)
+            self._delimiter = self._detect_delimiter(header_text)
+            raw_headers = next(csv.reader([header_text], delimiter=self._delimiter))
+            col_map = self._map_columns([h.strip().lower() for h in raw_headers])
+
+            self._start_cube()
+            result.entries.extend(self._aggregated(
+                self._iter_mmap_rows(mm, (header_end, len(mm)), col_map, result, start_row=2)
+            ))
+
+        self._parse_result = result
+        self.entries = result.entries
+
+        self._check_error_threshold(result)
+        return result
+
+    def parse_stream(self, stream: BinaryIO) -> ParseResult:
+        """Parse FEC data from a binary stream as it is produced.
+
+        Rows are parsed as soon as their bytes can be read, so a file can be
+        parsed while it is still being uploaded (see GrowingFile). The
+        encoding is detected from the first ENCODING_SAMPLE_SIZE bytes only;
+        later bytes that do not decode trigger the usual failover.
+        ``file_path`` only provides the name (source year, compression
+        format, messages). Compressed data is decompressed as it is read.
+
+        With a cache, the bytes are hashed while they are read and the
+        result is stored under the same key as parse_with_result() uses.
+
+        Raises:
+            ValueError: If error rate exceeds threshold.
+        """
+        hashing = HashingReader(stream) if self._cache is not None else None
+
+        result = ParseResult()
+        self._parse_result = result
+        self._start_cube()
+        result.entries.extend(self._aggregated(self._iter_parse_stream(hashing or stream, result)))
+        self.entries = result.entries
+
+        self._check_error_threshold(result)
+        if hashing is not None:
+            # Decompressors may stop before trailing bytes; hash the whole input
+            while hashing.read(self.READ_CHUNK_SIZE):
+                pass
+            self._store_cached(hashing.digest.hexdigest(), result)
+        return result
+
+    def parse_cached(self, digest: str) -> Optional[ParseResult]:
+        """Load the cached result of a file whose SHA-256 is ``digest``.
+
+        For callers that hash the bytes while receiving them, so the cache
+        can be checked without reading the file again. Returns None without
+        a cache or on a miss.
+
+        Raises:
+            ValueError: If error rate exceeds threshold.
+        """
+        if self._cache is None:
+            return None
+        self._start_cube()
+        return self._load_cached(digest)
+
+    def parse_parallel(self, workers: Optional[int] = None) -> ParseResult:
+        """Parse FEC file on several cores and return a ParseResult.
+
+        The data section is split into byte ranges aligned on line boundaries.
+        Each range is parsed in a process pool and the results are merged in
+        file order, so entries and ParseError row numbers are identical to
+        parse_with_result().
+
+        Falls back to the sequential parse for small and compressed files,
+        with ``details=True``, for files containing quote characters (a
+        quoted field may span several lines, so a line boundary is not
+        guaranteed to be a record boundary), with CR line breaks and for
+        files that do not decode entirely with the detected encoding.
+
+        Args:
+            workers: Number of worker processes (default: CPU count)
+
+        Raises:
+            ValueError: If error rate exceeds threshold.
+        """
+        workers = workers or os.cpu_count() or 1
+        size = self.file_path.stat().st_size
+        if (workers < 2 or size < self.PARALLEL_MIN_BYTES or self._compression is not None
+                or self._keep_details):
+            return self.parse_with_result()
+
+        self._encoding = self._detect_encoding()
+        with open(self.file_path, "rb") as f:
+            header = f.readline()
+            if LONE_CR.search(header):
+                logger.debug(f"{self.file_path.name} has CR line breaks, parsing sequentially")
+                return self.parse_with_result()
+            header_text = header.decode(self._encoding)
+            self._delimiter = self._detect_delimiter(header_text)
+            raw_headers = next(csv.reader([header_text], delimiter=self._delimiter))
+            col_map = self._map_columns([h.strip().lower() for h in raw_headers])
+
+            ranges = self._split_byte_ranges(
+                f, f.tell(), size, workers * self.PARALLEL_RANGES_PER_WORKER
+            )
+            start_rows = self._range_start_rows(f, ranges)
+
+        if start_rows is None:
+            logger.debug(
+                f"{self.file_path.name} contains quoted fields or CR line breaks, "
+                "parsing sequentially"
+            )
+            return self.parse_with_result()
+
+        result = ParseResult()
+        self._accounts = {}
+        self._labels = {}
+        self._start_cube()
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            parts = pool.map(
+                _parse_byte_range,
+                [str(self.file_path)] * len(ranges),
+                [self._encoding] * len(ranges),
+                [self._delimiter] * len(ranges),
+                [col_map] * len(ranges),
+                ranges,
+                start_rows,
+                [self._amount_mode] * len(ranges),
+            )
+            # pool.map yields in submission order, i.e. file order
+            for part in parts:
+                if part is None:
+                    pool.shutdown(cancel_futures=True)
+                    logger.debug(
+                        f"{self.file_path.name} is not all {self._encoding}, parsing sequentially"
+                    )
+                    return self.parse_with_result()
+                # Workers intern per range; share strings across ranges too
+                for entry in part.entries:
+                    entry.account_num = self._intern_account(entry.account_num)
+                    entry.label = self._intern_label(entry.label)
+                result.entries.extend(self._aggregated(part.entries))
+                result.merge_errors(part)
+                result.total_rows += part.total_rows
+                try:
+                    self._check_early_abort(result)
+                except ValueError:
+                    pool.shutdown(cancel_futures=True)
+                    raise
+
+        self._parse_result = result
+        self.entries = result.entries
+
+        self._check_error_threshold(result)
+        return result
+
+    def _split_byte_ranges(
+        self, f: BinaryIO, start: int, size: int, count: int
+    ) -> List[Tuple[int, int]]:
+        """Split [start, size) into about ``count`` ranges ending on a newline."""
+        step = max((size - start) // count, 1)
+        ranges = []
+        pos = start
+        while pos < size:
+            end = pos + step
+            if end >= size:
+                end = size
+            else:
+                # Extend the range to the end of the line it falls into
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((pos, end))
+            pos = end
+        return ranges
+
+    def _range_start_rows(
+        self, f: BinaryIO, ranges: List[Tuple[int, int]]
+    ) -> Optional[List[int]]:
+        """Compute the file row number of the first record in each range.
+
+        Returns None if the data contains a quote character or a CR line
+        break (a CR ending a block counts as one, a harmless false positive).
+        """
+        start_rows = []
+        row = 2  # Row 1 is the header
+        for start, end in ranges:
+            start_rows.append(row)
+            f.seek(start)
+            remaining = end - start
+            while remaining > 0:
+                block = f.read(min(self.READ_CHUNK_SIZE, remaining))
+                if b'"' in block or LONE_CR.search(block):
+                    return None
+                row += block.count(b"\n")
+                remaining -= len(block)
+        return start_rows
+
+    def _start_cube(self) -> None:
+        """Reset the aggregate cube for a new parse (aggregate=True only)."""
+        self._cube = AccountCube() if self._aggregate else None
+
+    def _aggregated(self, entries: Iterable[JournalEntry]) -> Iterable[JournalEntry]:
+        """Feed ``entries`` to the cube as they are iterated, if aggregating."""
+        if self._cube is None:
+            return entries
+        return self._cube.add_all(entries)
+
+    @property
+    def cube(self) -> Optional[AccountCube]:
+        """Amounts of the last parse by account, year and month.
+
+        Built while parsing with ``aggregate=True`` (None otherwise), also by
+        iter_entries(), which keeps no entries.
+        """
+        return self._cube
 
-        # Check error threshold
-        if self._parse_result.total_rows > 0:
-            error_rate = 100 - self._parse_result.success_rate
+    def _check_error_threshold(self, result: ParseResult) -> None:
+        """Raise if the error rate of a finished parse exceeds the threshold."""
+        if result.total_rows > 0:
+            error_rate = 100 - result.success_rate
             if error_rate > self._error_threshold:
                 raise ValueError(
                     f"Parse error rate ({error_rate:.1f}%) exceeds threshold "
-                    f"({self._error_threshold}%). {len(self._parse_result.errors)} "
-                    f"of {self._parse_result.total_rows} rows failed to parse. "
-                    f"First error: {self._parse_result.errors[0] if self._parse_result.errors else 'N/A'}"
+                    f"({self._error_threshold}%). {result.error_count} "
+                    f"of {result.total_rows} rows failed to parse "
+                    f"(by column: {result.error_counts}). "
+                    f"First error: {result.errors[0] if result.errors else 'N/A'}"
                 )
 
         # Log warnings for any errors below threshold
-        if self._parse_result.has_errors:
+        if result.has_errors:
             logger.warning(
-                f"Parsed {self.file_path.name}: {len(self._parse_result.entries)} entries, "
-                f"{len(self._parse_result.errors)} errors ({100 - self._parse_result.success_rate:.1f}%)"
+                f"Parsed {self.file_path.name}: {result.total_rows - result.error_count} entries, "
+                f"{result.error_count} errors ({100 - result.success_rate:.1f}%)"
             )
 
-        return self._parse_result
+    def _check_early_abort(self, result: ParseResult) -> None:
+        """Raise if the rows read so far show an error rate above the threshold.
+
+        After EARLY_ABORT_MIN_ROWS rows, the lower bound of the Wilson score
+        interval of the error rate must be above the threshold. Errors
+        cluster in FEC files (rows are sorted by journal and date), so the
+        errors read so far must also exceed the threshold over
+        EARLY_ABORT_ROWS_SLACK times the estimated row count of the file:
+        a valid file with its few bad rows at the start is not rejected.
+        Nothing is checked when the row count is unknown (compressed data,
+        streams).
+        """
+        n = result.total_rows
+        estimated_rows = self._estimated_rows
+        if not self._early_abort or estimated_rows is None or n < self.EARLY_ABORT_MIN_ROWS:
+            return
+        errors = result.error_count
+        if errors * 100 <= self._error_threshold * estimated_rows * self.EARLY_ABORT_ROWS_SLACK:
+            return
+        p = errors / n
+        z2 = self.EARLY_ABORT_Z ** 2
+        margin = self.EARLY_ABORT_Z * math.sqrt(p * (1 - p) / n + z2 / (4 * n * n))
+        lower = (p + z2 / (2 * n) - margin) / (1 + z2 / n)
+        if lower * 100 > self._error_threshold:
+            raise ValueError(
+                f"Parse error rate ({p * 100:.1f}%) exceeds threshold "
+                f"({self._error_threshold}%). {errors} of the first {n} rows "
+                f"failed to parse (by column: {result.error_counts}), of about "
+                f"{int(estimated_rows)} in the file; parsing stopped early. "
+                f"First error: {result.errors[0] if result.errors else 'N/A'}"
+            )
 
     @property
     def parse_result(self) -> Optional[ParseResult]:
         """Get the last parse result, if available."""
         return self._parse_result
 
-    def _read_file(self) -> str:
-        """Read file with encoding detection."""
+    def _detect_encoding(self) -> str:
+        """Detect file encoding from a bounded byte sample.
+
+        Only the head, the tail and ENCODING_SAMPLE_WINDOWS random windows of
+        the file are decoded with each candidate. Bytes outside the sample
+        that do not decode are handled by the failover in _iter_lines(), so
+        the file itself is decoded exactly once. The row count of the file
+        used by early abort is estimated from the newlines of the samples.
+        """
+        samples = self._read_encoding_samples()
+        sampled = sum(len(sample) for sample, _ in samples)
+        if sampled:
+            newlines = sum(sample.count(b"\n") for sample, _ in samples)
+            self._estimated_rows = self.file_path.stat().st_size * newlines / sampled
+        return self._pick_encoding(samples)
+
+    def _pick_encoding(self, samples: List[Tuple[bytes, Tuple[bool, bool]]]) -> str:
+        """Return the first of ENCODINGS that decodes every sample."""
         for encoding in self.ENCODINGS:
+            if all(self._sample_decodes(sample, encoding, cut) for sample, cut in samples):
+                return encoding
+        raise ValueError(f"Could not decode file {self.file_path} with any known encoding")
+
+    def _read_encoding_samples(self) -> List[Tuple[bytes, Tuple[bool, bool]]]:
+        """Read the head, tail and random windows used for encoding detection.
+
+        Returns (sample, (cut_start, cut_end)) pairs; the flags tell whether
+        the sample may start or end in the middle of a character. Small files
+        are returned whole as a single sample.
+        """
+        size = self.file_path.stat().st_size
+        window = self.ENCODING_SAMPLE_SIZE
+        with open(self.file_path, "rb") as f:
+            if size <= window * (self.ENCODING_SAMPLE_WINDOWS + 2):
+                return [(f.read(), (False, False))]
+
+            samples = [(f.read(window), (False, True))]
+            f.seek(size - window)
+            samples.append((f.read(window), (True, False)))
+
+            # Seed on the file size so detection is deterministic for a file
+            rng = random.Random(size)
+            for offset in sorted(
+                rng.randrange(window, size - 2 * window)
+                for _ in range(self.ENCODING_SAMPLE_WINDOWS)
+            ):
+                f.seek(offset)
+                samples.append((f.read(window), (True, True)))
+        return samples
+
+    @staticmethod
+    def _sample_decodes(sample: bytes, encoding: str, cut: Tuple[bool, bool]) -> bool:
+        """Check that a sample decodes, tolerating characters cut at its edges."""
+        cut_start, cut_end = cut
+        if cut_start:
+            # Skip UTF-8 continuation bytes of a character cut at the start
+            start = 0
+            while start < 3 and start < len(sample) and 0x80 <= sample[start] <= 0xBF:
+                start += 1
+            sample = sample[start:]
+        decoder = codecs.getincrementaldecoder(encoding)()
+        try:
+            decoder.decode(sample, final=not cut_end)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def _range_decodes(self, mm: mmap.mmap, byte_range: Tuple[int, int]) -> bool:
+        """Check that a byte range of a memory map decodes with ``encoding``."""
+        decoder = codecs.getincrementaldecoder(self._encoding)()
+        start, end = byte_range
+        try:
+            for pos in range(start, end, self.READ_CHUNK_SIZE):
+                decoder.decode(mm[pos:min(pos + self.READ_CHUNK_SIZE, end)])
+            decoder.decode(b"", final=True)
+        except UnicodeDecodeError:
+            return False
+        return True
+
+    def _iter_lines(self, f: BinaryIO, result: ParseResult, head: bytes = b"") -> Iterator[str]:
+        """Decode a binary stream into lines, with universal newlines.
+
+        Lines end with their LF, CRLF or lone CR, which csv.reader accepts
+        as line terminators like with ``open(newline="")``.
+
+        Decodes incrementally with the detected encoding. If a chunk fails
+        to decode (bytes the detection sample did not cover), decoding fails
+        over to the next candidate in ENCODINGS for the rest of the stream,
+        a warning is recorded on ``result`` and ``encoding`` is updated.
+
+        Args:
+            head: Bytes already read from ``f``, decoded before the rest
+        """
+        decoder = codecs.getincrementaldecoder(self._encoding)()
+        pending = ""
+        offset = 0
+        while True:
+            chunk = head or f.read(self.READ_CHUNK_SIZE)
+            head = b""
+            final = not chunk
+            buffered = decoder.getstate()[0]
             try:
-                content = self.file_path.read_text(encoding=encoding)
-                self._encoding = encoding
-                return content
+                text = decoder.decode(chunk, final)
+            except UnicodeDecodeError:
+                decoder, text = self._failover_decode(buffered + chunk, final, offset, result)
+            offset += len(chunk)
+
+            if text:
+                text = pending + text
+                if text.count("\r") == text.count("\r\n"):
+                    lines = text.split("\n")
+                    pending = lines.pop()
+                    for line in lines:
+                        yield line + "\n"
+                else:
+                    lines = LINE_BREAK.split(text)
+                    pending = lines.pop()
+                    yield from lines
+            if final:
+                break
+        if pending:
+            yield pending
+
+    def _failover_decode(
+        self, data: bytes, final: bool, offset: int, result: ParseResult
+    ) -> Tuple[codecs.IncrementalDecoder, str]:
+        """Decode ``data`` with the next encoding that accepts it."""
+        failed = self._encoding
+        for encoding in self.ENCODINGS[self.ENCODINGS.index(failed) + 1:]:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                text = decoder.decode(data, final)
             except UnicodeDecodeError:
                 continue
+            self._encoding = encoding
+            message = (
+                f"{self.file_path.name}: could not decode as {failed} near byte {offset}, "
+                f"decoding the rest of the file as {encoding}"
+            )
+            result.warnings.append(message)
+            logger.warning(message)
+            return decoder, text
         raise ValueError(f"Could not decode file {self.file_path} with any known encoding")
 
     def _detect_delimiter(self, content: str) -> str:
@@ -185,32 +1125,92 @@ class FECParser:
         # Default to semicolon (French standard)
         return ";"
 
-    def _parse_content(self, content: str) -> ParseResult:
-        """Parse CSV content into JournalEntry objects.
+    def _iter_parse(self, result: ParseResult) -> Iterator[JournalEntry]:
+        """Stream the file through csv.reader and yield JournalEntry objects.
 
-        Uses StringIO to properly handle multiline quoted fields.
+        Row counts and errors are recorded on ``result`` as rows are read;
+        entries are only yielded, never stored.
+        """
+        with open(self.file_path, "rb") as f:
+            if self._compression is not None:
+                yield from self._iter_parse_stream(f, result)
+            else:
+                self._encoding = self._detect_encoding()
+                yield from self._iter_stream_rows(f, result)
 
-        Returns:
-            ParseResult with entries, errors, and stats.
+    def _iter_parse_stream(self, raw: BinaryIO, result: ParseResult) -> Iterator[JournalEntry]:
+        """Parse a stream read once from the start, decompressing it if needed.
+
+        The encoding is detected from the head of the (decompressed) data.
         """
-        result = ParseResult()
+        self._estimated_rows = None
+        with ExitStack() as stack:
+            f = raw
+            if self._compression is not None:
+                f = stack.enter_context(
+                    open_decompressed(raw, self._compression, self._max_decompressed_bytes)
+                )
 
-        # Use StringIO for proper CSV parsing (handles multiline quoted fields)
-        reader = csv.reader(StringIO(content), delimiter=self._delimiter)
+            head = b""
+            while len(head) < self.ENCODING_SAMPLE_SIZE:
+                chunk = f.read(self.ENCODING_SAMPLE_SIZE - len(head))
+                if not chunk:
+                    break
+                head += chunk
+            at_eof = len(head) < self.ENCODING_SAMPLE_SIZE
+            self._encoding = self._pick_encoding([(head, (False, not at_eof))])
+
+            yield from self._iter_stream_rows(f, result, head)
+
+    def _iter_stream_rows(
+        self, f: BinaryIO, result: ParseResult, head: bytes = b""
+    ) -> Iterator[JournalEntry]:
+        """Parse an open binary stream with the already detected encoding."""
+        self._date_format = None
+        self._date_cache = {}
+        self._accounts = {}
+        self._labels = {}
+        self._details = None
+
+        # Lines keep their terminator, like the csv module expects
+        # (quoted fields may still span several lines)
+        lines = self._iter_lines(f, result, head)
+        first_line = next(lines, "")
+        self._delimiter = self._detect_delimiter(first_line)
+        if not first_line:
+            return
+
+        reader = csv.reader(chain([first_line], lines), delimiter=self._delimiter)
 
         # Parse header
-        try:
-            raw_headers = next(reader)
-        except StopIteration:
-            return result
-
+        raw_headers = next(reader)
         headers = [h.strip().lower() for h in raw_headers]
 
         # Map columns
         col_map = self._map_columns(headers)
+        if self._keep_details:
+            from .details import FECDetails
+            self._details = FECDetails(self._map_detail_columns(headers), self.DATE_FORMATS)
+
+        yield from self._iter_rows(reader, col_map, result, start_row=2)
+
+    def _iter_rows(
+        self,
+        reader: Iterator[List[str]],
+        col_map: dict,
+        result: ParseResult,
+        start_row: int,
+    ) -> Iterator[JournalEntry]:
+        """Parse CSV data rows, recording counts and errors on ``result``.
 
-        # Parse data rows
-        for row_num, row in enumerate(reader, start=2):
+        Args:
+            reader: csv.reader positioned on the first data row
+            col_map: Column indices from _map_columns()
+            result: ParseResult receiving total_rows and errors
+            start_row: File row number of the first record read
+        """
+        details = self._details
+        for row_num, row in enumerate(reader, start=start_row):
             if not row or all(not cell.strip() for cell in row):
                 continue  # Skip empty rows
 
@@ -219,19 +1219,81 @@ class FECParser:
             try:
                 entry = self._parse_row(row, col_map, row_num)
                 if entry:
-                    result.entries.append(entry)
+                    if details is not None:
+                        entry._details_ref = (details, len(details))
+                        details.append(row)
+                    yield entry
             except ValueError as e:
-                # Extract column info from error message if possible
-                error = ParseError(
-                    row=row_num,
-                    column="unknown",
-                    value=str(row)[:100],
-                    message=str(e),
+                result.add_error(
+                    row_num, getattr(e, "column", "unknown"), str(e),
+                    lambda row=row: str(row)[:100],
                 )
-                result.errors.append(error)
-                logger.debug(f"Parse error: {error}")
+                self._check_early_abort(result)
 
-        return result
+    def _iter_mmap_rows(
+        self,
+        mm: mmap.mmap,
+        byte_range: Tuple[int, int],
+        col_map: dict,
+        result: ParseResult,
+        start_row: int,
+        check_abort: bool = True,
+    ) -> Iterator[JournalEntry]:
+        """Parse the unquoted data rows of a memory-mapped byte range.
+
+        Same contract as _iter_rows(), but fields are split on the raw bytes
+        (the delimiter is ASCII and all ENCODINGS are ASCII-compatible) and
+        only the used columns are decoded. A full row is decoded only to
+        report an error. Callers must check with _range_decodes() that the
+        range decodes first: there is no failover here, and a byte that does
+        not decode in an unused column would otherwise go unnoticed.
+        """
+        columns = ("date", "account", "label", "debit", "credit")
+        used = [col_map[name] for name in columns]
+        used_map = {name: i for i, name in enumerate(columns)}
+        width = max(used) + 1
+        delimiter = self._delimiter.encode("ascii")
+        text_delimiter = self._delimiter
+
+        pos, end = byte_range
+        row_num = start_row - 1
+        while pos < end:
+            row_num += 1
+            line_start = pos
+            line_end = mm.find(b"\n", pos, end)
+            if line_end == -1:
+                line_end = pos = end
+            else:
+                pos = line_end + 1
+
+            line = mm[line_start:line_end]
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            fields = line.split(delimiter)
+            if not any(map(bytes.strip, fields)):
+                continue  # Skip empty rows
+
+            result.total_rows += 1
+
+            try:
+                if len(fields) < width:
+                    # Short row: let _parse_row report the missing column
+                    row = line.decode(self._encoding).split(text_delimiter)
+                    row_map = col_map
+                else:
+                    row = [fields[i].decode(self._encoding) for i in used]
+                    row_map = used_map
+
+                entry = self._parse_row(row, row_map, row_num)
+                if entry:
+                    yield entry
+            except ValueError as e:
+                result.add_error(
+                    row_num, getattr(e, "column", "unknown"), str(e),
+                    lambda line=line: str(line.decode(self._encoding).split(text_delimiter))[:100],
+                )
+                if check_abort:
+                    self._check_early_abort(result)
 
     def _map_columns(self, headers: List[str]) -> dict:
         """Map header names to column indices."""
@@ -262,26 +1324,58 @@ class FECParser:
 
         return col_map
 
+    def _map_detail_columns(self, headers: List[str]) -> Dict[str, Optional[int]]:
+        """Map FECDetail field names to column indices (None if absent)."""
+        col_map: Dict[str, Optional[int]] = dict.fromkeys(self.DETAIL_COLUMNS.values())
+        for idx, header in enumerate(headers):
+            name = self.DETAIL_COLUMNS.get(header)
+            if name is not None:
+                col_map[name] = idx
+        return col_map
+
     def _parse_row(self, row: List[str], col_map: dict, row_num: int) -> Optional[JournalEntry]:
-        """Parse a single row into a JournalEntry."""
+        """Parse a single row into a JournalEntry.
+
+        Raises:
+            RowError: If a field is missing or invalid (``column`` names it)
+        """
+        column = "date"
         try:
             # Parse date
             date_str = row[col_map["date"]].strip()
             entry_date = self._parse_date(date_str)
 
             # Parse account
+            column = "account"
             account = row[col_map["account"]].strip()
             if not account:
                 raise ValueError("Empty account number")
+            account = self._intern_account(account)
 
             # Parse label
-            label = row[col_map["label"]].strip()
+            column = "label"
+            label = self._intern_label(row[col_map["label"]].strip())
 
             # Parse amounts with column names for better error messages
+            if self._amount_mode == "cents":
+                column = "debit"
+                debit_cents = self._parse_amount_cents(row[col_map["debit"]], "debit")
+                column = "credit"
+                return self._cents_entry_type(
+                    date=entry_date,
+                    account_num=account,
+                    label=label,
+                    debit_cents=debit_cents,
+                    credit_cents=self._parse_amount_cents(row[col_map["credit"]], "credit"),
+                    source_year=self._source_year,
+                )
+
+            column = "debit"
             debit = self._parse_amount(row[col_map["debit"]], "debit")
+            column = "credit"
             credit = self._parse_amount(row[col_map["credit"]], "credit")
 
-            return JournalEntry(
+            return self._entry_type(
                 date=entry_date,
                 account_num=account,
                 label=label,
@@ -291,26 +1385,76 @@ class FECParser:
             )
 
         except (IndexError, ValueError) as e:
-            raise ValueError(f"Error parsing row {row_num}: {e}")
-
-    def _parse_date(self, date_str: str) -> datetime:
-        """Parse date string in various formats."""
-        formats = [
-            "%Y-%m-%d",  # 2024-01-15
-            "%d/%m/%Y",  # 15/01/2024
-            "%d-%m-%Y",  # 15-01-2024
-            "%Y%m%d",    # 20240115
-        ]
-
-        for fmt in formats:
+            raise RowError(f"Error parsing row {row_num}: {e}", column)
+
+    def _parse_date(self, date_str: str) -> date:
+        """Parse date string in various formats.
+
+        Conversions are memoized for the file (a FEC has few distinct dates).
+        The first format that matches is locked in and tried first; the
+        other DATE_FORMATS are only searched when it misses.
+        """
+        cached = self._date_cache.get(date_str)
+        if cached is not None:
+            return cached
+
+        parsed = None
+        if self._date_format is not None:
             try:
-                return datetime.strptime(date_str, fmt).date()
+                parsed = datetime.strptime(date_str, self._date_format).date()
             except ValueError:
-                continue
+                pass
+
+        if parsed is None:
+            for fmt in self.DATE_FORMATS:
+                try:
+                    parsed = datetime.strptime(date_str, fmt).date()
+                except ValueError:
+                    continue
+                if self._date_format is None:
+                    self._date_format = fmt
+                    logger.debug(f"{self.file_path.name}: date format locked to {fmt}")
+                break
+            else:
+                raise ValueError(f"Could not parse date: {date_str}")
+
+        if len(self._date_cache) < self.DATE_CACHE_SIZE:
+            self._date_cache[date_str] = parsed
+        return parsed
+
+    def _intern_account(self, account: str) -> str:
+        """Return the shared string object for an account number.
+
+        Entries of the same account then hold one string object, and
+        account-keyed dict lookups in the builders match on identity.
+        """
+        return self._accounts.setdefault(account, account)
+
+    def _intern_label(self, label: str) -> str:
+        """Return the shared string object for a label (bounded per file)."""
+        shared = self._labels.get(label)
+        if shared is not None:
+            return shared
+        if len(self._labels) < self.LABEL_INTERN_SIZE:
+            self._labels[label] = label
+        return label
+
+    @property
+    def details(self) -> Optional["FECDetails"]:
+        """Optional FEC columns of the last parse, one row per entry in order.
+
+        Only kept with ``details=True`` (None otherwise). Each entry also
+        reaches its row through ``JournalEntry.details``.
+        """
+        return self._details
 
-        raise ValueError(f"Could not parse date: {date_str}")
+    @property
+    def date_format(self) -> Optional[str]:
+        """Date format detected from the first rows (None before parsing)."""
+        return self._date_format
 
-    def _parse_amount(self, amount_str: str, column_name: str = "amount") -> Decimal:
+    @staticmethod
+    def _parse_amount(amount_str: str, column_name: str = "amount") -> Decimal:
         """Parse amount string to Decimal.
 
         Args:
@@ -318,13 +1462,16 @@ class FECParser:
             column_name: Name of the column (for error messages)
 
         Returns:
-            Parsed Decimal value
+            Parsed Decimal value, with at least 2 decimal places ("100" and
+            "1,5" give Decimal("100.00") and Decimal("1.50"); any zero gives
+            Decimal("0.00")), so amounts are the same Decimals as in cents mode
 
         Raises:
-            ValueError: If the amount cannot be parsed
+            ValueError: If the amount cannot be parsed or is too large to
+                        have 2 decimal places
         """
         if not amount_str or not amount_str.strip():
-            return Decimal("0")
+            return ZERO_AMOUNT
 
         # Clean the string
         cleaned = amount_str.strip()
@@ -341,10 +1488,50 @@ class FECParser:
         cleaned = cleaned.replace(" ", "").replace("\u00a0", "")
 
         try:
-            return Decimal(cleaned)
+            value = Decimal(cleaned)
         except InvalidOperation:
             raise ValueError(f"Invalid {column_name} value: '{original}'")
 
+        if not value:
+            return ZERO_AMOUNT  # Also "-0" and "0,000"
+        if value.is_finite() and value.as_tuple().exponent > -2:
+            try:
+                value = value.quantize(CENT)
+            except InvalidOperation:
+                raise ValueError(f"{column_name} value out of range: '{original}'")
+        return value
+
+    def _parse_amount_cents(self, amount_str: str, column_name: str = "amount") -> int:
+        """Parse amount string to integer cents.
+
+        Plain amounts with 0 or 2 decimals are converted without building a
+        Decimal; any other format goes through _parse_amount() so accepted
+        inputs and values are the same as in decimal mode, except amounts
+        beyond MAX_CENTS (the int64 columns of parse_columnar and the cache).
+
+        Raises:
+            ValueError: If the amount cannot be parsed, has more than
+                        2 decimal places or is out of range
+        """
+        cleaned = amount_str.strip()
+        if not cleaned:
+            return 0
+
+        match = self.CENTS_PATTERN.fullmatch(cleaned)
+        if match:
+            sign, units, decimals = match.groups()
+            cents = int(units) * 100 + (int(decimals) if decimals else 0)
+            if sign:
+                cents = -cents
+        else:
+            value = self._parse_amount(amount_str, column_name) * 100
+            if not value.is_finite() or value != value.to_integral_value():
+                raise ValueError(f"Invalid {column_name} value for cents mode: '{cleaned}'")
+            cents = int(value)
+        if not -MAX_CENTS <= cents <= MAX_CENTS:
+            raise ValueError(f"{column_name} value out of range: '{cleaned}'")
+        return cents
+
     @property
     def years(self) -> List[int]:
         """Get unique fiscal years in the data."""
@@ -366,3 +1553,36 @@ class FECParser:
 
     def __repr__(self) -> str:
         return f"FECParser({self.file_path.name}, {len(self.entries)} entries)"
+
+
+def _parse_byte_range(
+    file_path: str,
+    encoding: str,
+    delimiter: str,
+    col_map: dict,
+    byte_range: Tuple[int, int],
+    start_row: int,
+    amount_mode: str,
+) -> Optional[ParseResult]:
+    """Parse one line-aligned byte range of a FEC file (parse_parallel worker).
+
+    The file is memory-mapped, so workers share the OS page cache instead of
+    each reading its range into a private buffer.
+
+    Returns the partial ParseResult, or None if the range does not decode
+    with ``encoding``; the file must then be parsed sequentially (which
+    fails over to another encoding).
+    """
+    parser = FECParser(file_path, amount_mode=amount_mode)
+    parser._encoding = encoding
+    parser._delimiter = delimiter
+
+    result = ParseResult()
+    with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if not parser._range_decodes(mm, byte_range):
+            return None
+        # Early abort is decided by the parent on the rows merged so far
+        result.entries.extend(
+            parser._iter_mmap_rows(mm, byte_range, col_map, result, start_row, check_abort=False)
+        )
+    return result
@@ -0,0 +1,123 @@
+"""Parse several FEC files at once in a process pool."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterable, List, Optional, Union
+
+from src.models.cube import AccountCube
+from src.models.entry import JournalEntry
+
+from .fec_parser import FECParser, ParseResult
+
+if TYPE_CHECKING:
+    from .cache import ParseCache
+
+
+@dataclass
+class FileParse:
+    """Outcome of parsing one file of a batch.
+
+    ``error`` is set, and ``result`` is None, if the file could not be
+    parsed (unreadable, undecodable, missing columns, too many bad rows).
+    """
+    file_path: str
+    result: Optional[ParseResult] = None
+    cube: Optional[AccountCube] = None
+    encoding: Optional[str] = None
+    delimiter: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    @property
+    def entries(self) -> List[JournalEntry]:
+        return self.result.entries if self.result is not None else []
+
+    @property
+    def years(self) -> List[int]:
+        """Fiscal years of the parsed entries."""
+        return sorted(set(e.fiscal_year for e in self.entries))
+
+
+def _parse_file(
+    file_path: str,
+    amount_mode: str,
+    cache: Optional["ParseCache"],
+    aggregate: bool,
+    max_decompressed_bytes: Optional[int],
+    mode: str,
+) -> FileParse:
+    """Parse one file (parse_files() worker); failures are returned, not raised."""
+    parser = FECParser(
+        file_path, amount_mode=amount_mode, cache=cache, aggregate=aggregate,
+        max_decompressed_bytes=max_decompressed_bytes,
+    )
+    try:
+        result = parser.parse_with_mode(mode)
+    except (OSError, ValueError) as e:
+        return FileParse(file_path=file_path, error=str(e))
+    return FileParse(
+        file_path=file_path,
+        result=result,
+        cube=parser.cube,
+        encoding=parser.encoding,
+        delimiter=parser.delimiter,
+    )
+
+
+def parse_files(
+    file_paths: Iterable[Union[str, Path]],
+    max_workers: Optional[int] = None,
+    amount_mode: str = "decimal",
+    cache: Optional["ParseCache"] = None,
+    aggregate: bool = False,
+    max_decompressed_bytes: Optional[int] = None,
+    mode: str = "csv",
+) -> List[FileParse]:
+    """Parse FEC files concurrently, one file per worker process.
+
+    Each file goes through FECParser.parse_with_mode(mode) (and the cache).
+    In "parallel" mode every file already uses all cores, so files are
+    parsed one after the other.
+    Outcomes are returned in the order of ``file_paths`` whatever the order
+    in which workers finish. A file that fails does not stop the others:
+    its FileParse carries the error instead.
+
+    Args:
+        file_paths: Files to parse
+        max_workers: Maximum number of worker processes (default: CPU
+                     count); with one worker or one file, files are parsed
+                     in this process
+        amount_mode: FECParser amount mode
+        cache: Optional ParseCache shared by the workers
+        aggregate: Also build each file's AccountCube (FileParse.cube)
+        max_decompressed_bytes: FECParser limit of decompressed sizes
+        mode: FECParser parse mode (see FECParser.PARSE_MODES)
+    """
+    paths = [str(path) for path in file_paths]
+    workers = min(max_workers or os.cpu_count() or 1, len(paths))
+    if workers < 2 or mode == "parallel":
+        return [
+            _parse_file(path, amount_mode, cache, aggregate, max_decompressed_bytes, mode)
+            for path in paths
+        ]
+
+    outcomes = []
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _parse_file, path, amount_mode, cache, aggregate, max_decompressed_bytes, mode
+            )
+            for path in paths
+        ]
+        for path, future in zip(paths, futures):
+            try:
+                outcomes.append(future.result())
+            except Exception as e:
+                # The worker itself failed (e.g. killed): report it for this file only
+                outcomes.append(FileParse(file_path=path, error=f"{type(e).__name__}: {e}"))
+    return outcomes
@@ -0,0 +1,160 @@
+"""Quick inspection of a FEC file (format, years, size) without parsing it."""
+
+import csv
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+
+from .compression import open_decompressed
+
+if TYPE_CHECKING:
+    from .fec_parser import FECParser
+
+# Data rows returned in FECProbe.sample
+PROBE_SAMPLE_ROWS = 10
+
+# Evenly spaced windows read between the head and the tail (each of
+# FECParser.ENCODING_SAMPLE_SIZE bytes): a year spanning more than
+# 1 / PROBE_WINDOWS of the file is always sampled
+PROBE_WINDOWS = 8
+
+
+@dataclass
+class FECProbe:
+    """What a FEC file looks like, from a bounded sample of its bytes.
+
+    Unless ``exact`` is set (the whole file was read), ``years`` only holds
+    the years of the sampled rows and ``estimated_rows`` extrapolates the
+    average sampled line length to the file size. FEC files are written in
+    date order, so the head and the tail give the first and last years and
+    the evenly spaced windows the years in between.
+    """
+    file_name: str
+    size: int
+    compression: Optional[str]
+    encoding: str
+    delimiter: str
+    headers: List[str]
+    columns: Dict[str, int]              # used columns, see FECParser._map_columns()
+    date_format: Optional[str]
+    source_year: Optional[int]
+    years: List[int]                     # fiscal years of the sampled rows
+    estimated_rows: Optional[int]        # None for compressed files read partly
+    exact: bool
+    sampled_rows: int = 0
+    sample_errors: int = 0
+    sample: List[Dict[str, Any]] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _complete_lines(data: bytes, cut: Tuple[bool, bool]) -> bytes:
+    """Drop the partial lines at the cut edges of a sample."""
+    cut_start, cut_end = cut
+    if cut_start:
+        data = data[data.find(b"\n") + 1:] if b"\n" in data else b""
+    if cut_end:
+        data = data[:data.rfind(b"\n") + 1]
+    return data
+
+
+def _read_samples(parser: "FECParser") -> Tuple[List[Tuple[bytes, Tuple[bool, bool]]], bool]:
+    """Byte samples of the file and whether they cover all of it."""
+    size = parser.file_path.stat().st_size
+    window = parser.ENCODING_SAMPLE_SIZE
+    if parser.compression is None:
+        with open(parser.file_path, "rb") as f:
+            if size <= window * (PROBE_WINDOWS + 2):
+                return [(f.read(), (False, False))], True
+
+            samples = [(f.read(window), (False, True))]
+            step = (size - 2 * window) // (PROBE_WINDOWS + 1)
+            for i in range(1, PROBE_WINDOWS + 1):
+                f.seek(window + i * step - window // 2)
+                samples.append((f.read(window), (True, True)))
+            f.seek(size - window)
+            samples.append((f.read(window), (True, False)))
+        return samples, False
+
+    # No random access into compressed data: decompress the head only
+    with open(parser.file_path, "rb") as raw, open_decompressed(raw, parser.compression) as f:
+        head = f.read(window)
+        exact = not f.read(1)
+    return [(head, (False, not exact))], exact
+
+
+def probe_file(parser: "FECParser", sample_rows: int = PROBE_SAMPLE_ROWS) -> FECProbe:
+    """Inspect ``parser.file_path`` from its head, tail and a few windows.
+
+    At most PROBE_WINDOWS + 2 windows are read, so the cost does not depend
+    on the file size. The encoding is picked from these samples. Sampled
+    rows are parsed like any row; rows that fail are only counted.
+
+    Raises:
+        ValueError: If the file cannot be decoded or lacks a required column
+    """
+    samples, exact = _read_samples(parser)
+    encoding = parser._pick_encoding(samples)
+    parser._encoding = encoding
+
+    head, head_cut = samples[0]
+    header_end = head.find(b"\n") + 1 or len(head)
+    header_text = head[:header_end].decode(encoding, errors="replace")
+    parser._delimiter = parser._detect_delimiter(header_text)
+    headers = [h.strip() for h in next(csv.reader([header_text], delimiter=parser._delimiter), [])]
+    col_map = parser._map_columns([h.lower() for h in headers])
+
+    years = set()
+    sample = []
+    rows = errors = 0
+    line_bytes = 0
+    for index, (data, cut) in enumerate(samples):
+        if index == 0:
+            data, cut = data[header_end:], (False, head_cut[1])
+        lines = _complete_lines(data, cut)
+        line_bytes += len(lines)
+        text = lines.decode(encoding, errors="replace").splitlines()
+        for row in csv.reader(text, delimiter=parser._delimiter):
+            if not row or all(not cell.strip() for cell in row):
+                continue
+            rows += 1
+            try:
+                entry = parser._parse_row(row, col_map, rows)
+            except ValueError:
+                errors += 1
+                continue
+            years.add(entry.fiscal_year)
+            if index == 0 and len(sample) < sample_rows:
+                sample.append({
+                    "date": entry.date.isoformat(),
+                    "account": entry.account_num,
+                    "label": entry.label,
+                    "debit": str(entry.debit),
+                    "credit": str(entry.credit),
+                })
+
+    size = parser.file_path.stat().st_size
+    if exact:
+        estimated_rows = rows
+    elif parser.compression is not None or not rows:
+        estimated_rows = None
+    else:
+        estimated_rows = round((size - header_end) / (line_bytes / rows))
+
+    return FECProbe(
+        file_name=parser.file_path.name,
+        size=size,
+        compression=parser.compression,
+        encoding=encoding,
+        delimiter=parser._delimiter,
+        headers=headers,
+        columns=col_map,
+        date_format=parser.date_format,
+        source_year=parser.source_year,
+        years=sorted(years),
+        estimated_rows=estimated_rows,
+        exact=exact,
+        sampled_rows=rows,
+        sample_errors=errors,
+        sample=sample,
+    )
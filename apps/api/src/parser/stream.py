@@ -0,0 +1,130 @@
+"""Read a file on disk while another thread is still writing it."""
+
+import hashlib
+import threading
+from pathlib import Path
+from typing import BinaryIO, Optional, Union
+
+
+class GrowingFile:
+    """A file written chunk by chunk that can be read concurrently.
+
+    The writer appends with write() and finishes with close() (or abort() on
+    failure). Readers from reader() see the bytes as soon as they are
+    written and block when they catch up with the writer, so the file can be
+    parsed while it is being received. Data goes through the file on disk,
+    not through an in-memory buffer.
+
+    Args:
+        timeout: Seconds a reader waits for new bytes before raising
+                 TimeoutError (None waits forever)
+    """
+
+    def __init__(self, file_path: Union[str, Path], timeout: Optional[float] = None):
+        self.file_path = Path(file_path)
+        self.timeout = timeout
+        self._file = open(self.file_path, "wb")
+        self._size = 0
+        self._closed = False
+        self._error: Optional[BaseException] = None
+        self._cond = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """Number of bytes written so far."""
+        return self._size
+
+    def write(self, data: bytes) -> None:
+        """Append ``data`` and wake up waiting readers."""
+        self._file.write(data)
+        self._file.flush()
+        with self._cond:
+            self._size += len(data)
+            self._cond.notify_all()
+
+    def close(self) -> None:
+        """Mark the file complete: readers get EOF once they reach the end."""
+        self._file.close()
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    def abort(self, error: Optional[BaseException] = None) -> None:
+        """Stop writing; pending and later reads raise ``error``."""
+        self._file.close()
+        with self._cond:
+            self._error = error or IOError(f"Writing {self.file_path.name} was aborted")
+            self._closed = True
+            self._cond.notify_all()
+
+    def reader(self) -> "GrowingFileReader":
+        """Open a new reader positioned at the start of the file."""
+        return GrowingFileReader(self)
+
+    def _wait(self, position: int) -> int:
+        """Block until bytes past ``position`` exist; return the readable size."""
+        with self._cond:
+            if not self._cond.wait_for(
+                lambda: self._size > position or self._closed, self.timeout
+            ):
+                raise TimeoutError(
+                    f"No data written to {self.file_path.name} for {self.timeout}s"
+                )
+            if self._error is not None:
+                raise self._error
+            return self._size
+
+
+class GrowingFileReader:
+    """Binary reader of a GrowingFile (see GrowingFile.reader())."""
+
+    def __init__(self, source: GrowingFile):
+        self._source = source
+        self._file = open(source.file_path, "rb")
+        self._position = 0
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to ``size`` bytes, blocking until some are available.
+
+        Returns fewer bytes than requested when the reader catches up with
+        the writer, and b"" only at the end of a closed file. A negative
+        ``size`` reads until the file is closed.
+        """
+        if size < 0:
+            chunks = []
+            while chunk := self.read(1024 * 1024):
+                chunks.append(chunk)
+            return b"".join(chunks)
+
+        available = self._source._wait(self._position) - self._position
+        data = self._file.read(min(size, available))
+        self._position += len(data)
+        return data
+
+    def seekable(self) -> bool:
+        return False
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "GrowingFileReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class HashingReader:
+    """Binary stream wrapper computing the SHA-256 of the bytes read through it."""
+
+    def __init__(self, stream: BinaryIO):
+        self._stream = stream
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._stream.read(size)
+        self.digest.update(data)
+        return data
+
+    def seekable(self) -> bool:
+        return False
@@ -11,6 +11,30 @@ from decimal import Decimal
 
 from config.settings import settings
 from src.exceptions import ValidationError
+from src.parser.compression import COMPRESSED_SUFFIXES, compression_of, inner_suffix
+
+
+def validate_fec_extension(file_path: Path) -> tuple[bool, str]:
+    """
+    Check that a FEC file has an allowed extension.
+
+    Lets uploads be rejected before their content is received. Compressed
+    files (.gz, .zip, .zst) are accepted when the name inside has an allowed
+    extension or none (``FEC.txt.gz``, ``FEC.zip``).
+
+    Returns:
+        Tuple of (is_valid, error_message)
+    """
+    suffix = inner_suffix(file_path)
+    if suffix == "" and compression_of(file_path) is not None:
+        return True, ""
+    if suffix not in settings.ALLOWED_EXTENSIONS:
+        compressed = ", ".join(COMPRESSED_SUFFIXES)
+        return False, (
+            f"Invalid file type: {suffix}. Allowed: {settings.ALLOWED_EXTENSIONS}, "
+            f"optionally compressed ({compressed})"
+        )
+    return True, ""
 
 
 def validate_fec_file(file_path: Path, file_size: int) -> tuple[bool, str]:
@@ -32,8 +56,9 @@ def validate_fec_file(file_path: Path, file_size: int) -> tuple[bool, str]:
         If valid, error_message is empty string
     """
     # Check extension
-    if file_path.suffix.lower() not in settings.ALLOWED_EXTENSIONS:
-        return False, f"Invalid file type: {file_path.suffix}. Allowed: {settings.ALLOWED_EXTENSIONS}"
+    is_valid, error = validate_fec_extension(file_path)
+    if not is_valid:
+        return False, error
 
     # Check maximum size
     if file_size > settings.MAX_FILE_SIZE:
@@ -243,3 +243,342 @@ class TestAPIPerformance:
             assert len(responses) == 3
         except Exception:
             pass
+
+
+class TestAPISessionAddFiles:
+    """Tests for adding files to an existing session."""
+
+    @pytest.fixture
+    def headers(self):
+        from config.settings import settings
+        return {"X-API-Key": settings.API_KEY}
+
+    @pytest.fixture
+    def fec_content(self):
+        return (
+            "EcritureDate\tCompteNum\tEcritureLib\tDebit\tCredit\n"
+            "20240115\t706000\tSales\t0,00\t1000,00\n"
+            "20240115\t512000\tBank\t1000,00\t0,00\n"
+        )
+
+    def _files(self, name, content):
+        return [("files", (name, content.encode("utf-8"), "text/plain"))]
+
+    def test_add_file_to_session(self, api_client, headers, fec_content):
+        """Added entries are merged and only their years are recomputed."""
+        response = api_client.post(
+            "/api/upload", files=self._files("first.txt", fec_content), headers=headers
+        )
+        session_id = response.json()["session_id"]
+        total = response.json()["total_entries"]
+
+        response = api_client.post(
+            f"/api/session/{session_id}/files",
+            files=self._files("second.txt", fec_content),
+            headers=headers,
+        )
+        assert response.status_code == 200
+        body = response.json()
+        assert body["total_entries"] == 2 * total
+        assert body["affected_years"] == [2024]
+        assert body["reprocessed"] is False
+
+        # Same file name again is rejected
+        response = api_client.post(
+            f"/api/session/{session_id}/files",
+            files=self._files("second.txt", fec_content),
+            headers=headers,
+        )
+        assert response.status_code == 409
+        api_client.delete(f"/api/session/{session_id}", headers=headers)
+
+    def test_repeat_upload_hits_cache(
+        self, api_client, headers, fec_content, tmp_path, monkeypatch
+    ):
+        """A second upload of the same bytes is loaded from the parse cache."""
+        import api
+        from src.parser import ParseCache
+
+        cache = ParseCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        monkeypatch.setattr(api, "PARSE_CACHE", cache)
+        loads = []
+        load = cache.load
+        monkeypatch.setattr(cache, "load", lambda digest: loads.append(load(digest)) or loads[-1])
+        stores = []
+        store = cache.store
+        monkeypatch.setattr(cache, "store", lambda *args: stores.append(store(*args)))
+
+        totals = []
+        for name in ("first.txt", "again.txt"):
+            response = api_client.post(
+                "/api/upload", files=self._files(name, fec_content), headers=headers
+            )
+            assert response.status_code == 200
+            totals.append(response.json()["total_entries"])
+            api_client.delete(f"/api/session/{response.json()['session_id']}", headers=headers)
+
+        assert totals[0] == totals[1] == 2
+        assert [hit is not None for hit in loads] == [False, True]
+        assert len(stores) == 1
+
+    def test_concurrent_uploads_do_not_deadlock(self, fec_content, tmp_path, monkeypatch):
+        """Streamed parses waiting for bytes never starve the cache lookups."""
+        import asyncio
+        from concurrent.futures import ThreadPoolExecutor
+
+        from starlette.datastructures import UploadFile
+
+        import api
+        from src.parser import FECParser, ParseCache
+
+        cache = ParseCache(tmp_path / "cache", max_bytes=10 * 1024 * 1024)
+        FECParser(self._write(tmp_path / "seed.txt", fec_content), cache=cache).parse()
+        monkeypatch.setattr(api, "PARSE_CACHE", cache)
+        monkeypatch.setattr(api, "UPLOAD_CHUNK_SIZE", 16)
+        monkeypatch.setattr(api, "STREAM_PARSE_EXECUTOR", ThreadPoolExecutor(2))
+
+        async def upload(i):
+            file = UploadFile(BytesIO(fec_content.encode("utf-8")), filename=f"up{i}.txt")
+            return await api.receive_and_parse(file, tmp_path / f"up{i}.txt")
+
+        async def main():
+            # As many uploads as default threads: each one's cache lookup
+            # needs a default thread while the others' parses are running
+            asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(2))
+            return await asyncio.wait_for(asyncio.gather(*(upload(i) for i in range(4))), 30)
+
+        parsers = asyncio.run(main())
+        assert [len(p.entries) for p in parsers] == [2, 2, 2, 2]
+
+    @staticmethod
+    def _write(path, content):
+        path.write_text(content, encoding="utf-8")
+        return path
+
+    def test_upload_decompression_limit(self, api_client, headers, fec_content, monkeypatch):
+        """A compressed upload inflating past MAX_DECOMPRESSED_SIZE is a 400."""
+        import gzip
+
+        from config.settings import settings
+
+        monkeypatch.setattr(settings, "MAX_DECOMPRESSED_SIZE", len(fec_content) - 1)
+        data = gzip.compress(fec_content.encode("utf-8"))
+        files = [("files", ("bomb.txt.gz", data, "application/gzip"))]
+        response = api_client.post("/api/upload", files=files, headers=headers)
+        assert response.status_code == 400
+        assert "exceeds the limit" in response.json()["detail"]
+
+    def test_add_invalid_file(self, api_client, headers, fec_content):
+        """An invalid FEC is a 400 and leaves the session unchanged."""
+        response = api_client.post(
+            "/api/upload", files=self._files("first.txt", fec_content), headers=headers
+        )
+        session_id = response.json()["session_id"]
+        bad_fec = "Date;Compte;Libelle\n" + "20240101;411000;Client\n" * 10
+
+        response = api_client.post(
+            f"/api/session/{session_id}/files",
+            files=self._files("bad.txt", bad_fec),
+            headers=headers,
+        )
+        assert response.status_code == 400
+        assert "bad.txt" in response.json()["detail"]
+
+        # The bad file can be fixed and sent again under the same name
+        response = api_client.post(
+            f"/api/session/{session_id}/files",
+            files=self._files("bad.txt", fec_content),
+            headers=headers,
+        )
+        assert response.status_code == 200
+        assert response.json()["total_entries"] == 4
+        api_client.delete(f"/api/session/{session_id}", headers=headers)
+
+    def test_add_earlier_year_keeps_entry_order(self, api_client, headers):
+        """A year uploaded after a later one gives the statements of the whole entry list."""
+        import api
+        from src.engine.balance_builder import BalanceBuilder
+        from src.mapper.account_mapper import AccountMapper
+
+        def fec(year, rows):
+            return "EcritureDate\tCompteNum\tEcritureLib\tDebit\tCredit\n" + "".join(
+                f"{year}0115\t{account}\t{label}\t{debit}\t{credit}\n"
+                for account, label, debit, credit in rows
+            )
+
+        response = api_client.post("/api/upload", files=self._files("fy2024.txt", fec(2024, [
+            ("401000", "Supplier", "0,00", "300,00"), ("512000", "Bank", "300,00", "0,00"),
+        ])), headers=headers)
+        session_id = response.json()["session_id"]
+        api_client.post("/api/process", json={"session_id": session_id}, headers=headers)
+        response = api_client.post(f"/api/session/{session_id}/files", files=self._files(
+            "fy2023.txt", fec(2023, [
+                ("512000", "Bank", "0,00", "50,00"), ("401000", "Supplier", "50,00", "0,00"),
+            ]),
+        ), headers=headers)
+        assert response.json()["reprocessed"] is True
+
+        session = api.SESSIONS[session_id]
+        expected = BalanceBuilder(AccountMapper()).build_multi_year(session["entries"])
+        balance_list = session["processed"]["balance_list"]
+        assert balance_list == expected
+        assert [[(k, v.entries) for k, v in bs._traces.items()] for bs in balance_list] == [
+            [(k, v.entries) for k, v in bs._traces.items()] for bs in expected
+        ]
+        api_client.delete(f"/api/session/{session_id}", headers=headers)
+
+    def test_process_builds_once_per_run(self, api_client, headers, fec_content, monkeypatch):
+        """Each run is one FusedBuilder call; statements are reused until files are added."""
+        from src.engine.fused_builder import FusedBuilder
+        from src.models.cube import AccountCube
+
+        calls = []
+        build = FusedBuilder.build
+        monkeypatch.setattr(FusedBuilder, "build", lambda self, entries, **kwargs: (
+            calls.append((kwargs.get("statements", True), kwargs.get("cube") is not None))
+            or build(self, entries, **kwargs)
+        ))
+        monkeypatch.setattr(
+            AccountCube, "to_entries", lambda self: pytest.fail("cube materialized")
+        )
+
+        response = api_client.post(
+            "/api/upload", files=self._files("first.txt", fec_content), headers=headers
+        )
+        session_id = response.json()["session_id"]
+        for _ in range(2):
+            response = api_client.post(
+                "/api/process", json={"session_id": session_id}, headers=headers
+            )
+            assert response.status_code == 200
+        api_client.post(
+            f"/api/session/{session_id}/files",
+            files=self._files("second.txt", fec_content),
+            headers=headers,
+        )
+        assert calls == [(True, True), (False, True), (True, True)]
+        api_client.delete(f"/api/session/{session_id}", headers=headers)
+
+    def test_add_file_unknown_session(self, api_client, headers, fec_content):
+        """Unknown sessions return 404."""
+        response = api_client.post(
+            "/api/session/00000000-0000-0000-0000-000000000000/files",
+            files=self._files("first.txt", fec_content),
+            headers=headers,
+        )
+        assert response.status_code == 404
+
+
+class TestAPIDeferredUpload:
+    """Tests for probing uploads and deferring their parse."""
+
+    @pytest.fixture
+    def headers(self):
+        from config.settings import settings
+        return {"X-API-Key": settings.API_KEY}
+
+    @pytest.fixture
+    def fec_content(self):
+        return (
+            "EcritureDate\tCompteNum\tEcritureLib\tDebit\tCredit\n"
+            "20230115\t706000\tSales\t0,00\t1000,00\n"
+            "20230115\t512000\tBank\t1000,00\t0,00\n"
+            "20240115\t706000\tSales\t0,00\t1500,00\n"
+            "20240115\t512000\tBank\t1500,00\t0,00\n"
+        )
+
+    def _files(self, name, content):
+        return [("files", (name, content.encode("utf-8"), "text/plain"))]
+
+    def test_deferred_upload_is_parsed_on_process(self, api_client, headers, fec_content):
+        """A deferred upload answers from the probe; processing parses it."""
+        response = api_client.post(
+            "/api/upload?defer=true",
+            files=self._files("deferred.txt", fec_content),
+            headers=headers,
+        )
+        assert response.status_code == 200
+        body = response.json()
+        session_id = body["session_id"]
+        assert body["total_entries"] is None
+        assert body["years"] == [2023, 2024]
+        assert body["files"][0]["estimated_entries"] == 4
+        assert body["files"][0]["delimiter"] == "\t"
+
+        response = api_client.post(
+            "/api/process", json={"session_id": session_id}, headers=headers
+        )
+        assert response.status_code == 200
+        assert response.json()["years"] == [2023, 2024]
+        api_client.delete(f"/api/session/{session_id}", headers=headers)
+
+    def test_deferred_upload_rejects_missing_columns(self, api_client, headers):
+        """The probe still validates the header."""
+        response = api_client.post(
+            "/api/upload?defer=true",
+            files=self._files("bad.txt", "Date\tCompte\n20240115\t706000\n"),
+            headers=headers,
+        )
+        assert response.status_code == 400
+
+    def test_probe_session(self, api_client, headers, fec_content):
+        """The probe endpoint describes each session file."""
+        response = api_client.post(
+            "/api/upload", files=self._files("probed.txt", fec_content), headers=headers
+        )
+        session_id = response.json()["session_id"]
+
+        response = api_client.get(f"/api/session/{session_id}/probe", headers=headers)
+        assert response.status_code == 200
+        probe = response.json()["files"][0]
+        assert probe["filename"] == "probed.txt"
+        assert probe["exact"] is True
+        assert probe["estimated_rows"] == 4
+        assert probe["columns"] == {"date": 0, "account": 1, "label": 2, "debit": 3, "credit": 4}
+        assert probe["sample"][0]["account"] == "706000"
+        api_client.delete(f"/api/session/{session_id}", headers=headers)
+
+
+class TestAPIMultiFileUpload:
+    """Tests for uploads of several files, parsed concurrently."""
+
+    # Valid size, but no amount columns
+    BAD_FEC = b"Date;Compte;Libelle\n" + b"20240101;411000;Client\n" * 10
+
+    @pytest.fixture
+    def headers(self):
+        from config.settings import settings
+        return {"X-API-Key": settings.API_KEY}
+
+    def _fec(self, year):
+        return (
+            "EcritureDate\tCompteNum\tEcritureLib\tDebit\tCredit\n"
+            f"{year}0115\t706000\tSales\t0,00\t1000,00\n"
+            f"{year}0115\t512000\tBank\t1000,00\t0,00\n"
+        )
+
+    def test_bad_file_reported_others_kept(self, api_client, headers):
+        """Files are merged in upload order; a bad file is only reported."""
+        files = [
+            ("files", ("fy2023.txt", self._fec(2023).encode("utf-8"), "text/plain")),
+            ("files", ("bad.txt", self.BAD_FEC, "text/plain")),
+            ("files", ("fy2024.txt", self._fec(2024).encode("utf-8"), "text/plain")),
+        ]
+        response = api_client.post("/api/upload", files=files, headers=headers)
+
+        assert response.status_code == 200
+        body = response.json()
+        assert [f["filename"] for f in body["files"]] == ["fy2023.txt", "fy2024.txt"]
+        assert body["total_entries"] == 4
+        assert body["years"] == [2023, 2024]
+        assert [e["filename"] for e in body["errors"]] == ["bad.txt"]
+        api_client.delete(f"/api/session/{body['session_id']}", headers=headers)
+
+    def test_all_files_bad(self, api_client, headers):
+        files = [
+            ("files", ("bad1.txt", self.BAD_FEC, "text/plain")),
+            ("files", ("bad2.txt", self.BAD_FEC, "text/plain")),
+        ]
+        response = api_client.post("/api/upload", files=files, headers=headers)
+        assert response.status_code == 400
+        assert "bad1.txt" in response.json()["detail"]
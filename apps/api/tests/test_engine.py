@@ -0,0 +1,456 @@
+"""
+Unit tests for financial statement builders.
+"""
+
+import os
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.engine.balance_builder import BalanceBuilder
+from src.engine.detail_builder import DetailBuilder
+from src.engine.fused_builder import FusedBuilder
+from src.engine.monthly_builder import MonthlyBuilder
+from src.engine.pl_builder import PLBuilder
+from src.engine.statement_cache import StatementCache
+from src.mapper.account_mapper import UNMAPPED, AccountMapper
+from src.mapper.registry import MappingRegistry
+from src.models.cube import AccountCube
+from src.models.entry import CentsJournalEntry, JournalEntry
+from src.parser.columnar import ColumnarParseResult
+
+
+def _year_entries(year: int, revenue: str) -> list:
+    """Revenue cashed at the bank during ``year``."""
+    amount = Decimal(revenue)
+    return [
+        JournalEntry(date=date(year, 6, 30), account_num="706000", label="Sales",
+                     debit=Decimal("0"), credit=amount, source_year=year),
+        JournalEntry(date=date(year, 6, 30), account_num="512000", label="Bank",
+                     debit=amount, credit=Decimal("0"), source_year=year),
+    ]
+
+
+class TestStatementCache:
+    """Tests for per-year statements with incremental invalidation."""
+
+    @pytest.fixture
+    def mapper(self):
+        return AccountMapper()
+
+    def test_matches_multi_year_builders(self, mapper):
+        """Cached statements equal the ones built from all entries."""
+        entries = _year_entries(2022, "1000") + _year_entries(2023, "2500")
+        statements = StatementCache(mapper)
+        statements.add_entries(entries)
+
+        expected_pl = PLBuilder(mapper).build_multi_year(entries)
+        expected_bs = BalanceBuilder(mapper).build_multi_year(entries)
+        assert statements.years == [2022, 2023]
+        assert [pl.revenue for pl in statements.pl_list()] == [pl.revenue for pl in expected_pl]
+        assert [bs.cash for bs in statements.balance_list()] == [bs.cash for bs in expected_bs]
+
+    def test_add_later_year_keeps_earlier_statements(self, mapper):
+        """A new year leaves the statements of earlier years cached."""
+        statements = StatementCache(mapper)
+        statements.add_entries(_year_entries(2022, "1000"))
+        pl_2022, bs_2022 = statements.pl(2022), statements.balance(2022)
+
+        affected = statements.add_entries(_year_entries(2023, "2500"))
+
+        assert affected == {2023}
+        assert statements.pl(2022) is pl_2022
+        assert statements.balance(2022) is bs_2022
+        assert statements.balance(2023).cash == Decimal("3500")
+
+    def test_add_earlier_year_rebuilds_later_balances(self, mapper):
+        """Balance sheets cumulate, so later years are rebuilt; later P&Ls are not."""
+        statements = StatementCache(mapper)
+        statements.add_entries(_year_entries(2023, "2500"))
+        pl_2023 = statements.pl(2023)
+        assert statements.balance(2023).cash == Decimal("2500")
+
+        affected = statements.add_entries(_year_entries(2022, "1000"))
+
+        assert affected == {2022}
+        assert statements.pl(2023) is pl_2023
+        assert statements.balance(2023).cash == Decimal("3500")
+        assert statements.balance(2022).cash == Decimal("1000")
+
+
+    def test_files_added_in_reverse_order(self, mapper):
+        """Later years uploaded first: statements keep the entry order of the session."""
+        def entry(year, account, label, debit, credit):
+            return JournalEntry(date=date(year, 3, 1), account_num=account, label=label,
+                                debit=Decimal(debit), credit=Decimal(credit), source_year=year)
+
+        fy2023 = [
+            entry(2023, "401000", "Supplier 23", "0", "300"),
+            entry(2023, "512000", "Bank 23", "300", "0"),
+        ]
+        fy2022 = [
+            entry(2022, "512000", "Bank 22", "0", "50"),
+            entry(2022, "401000", "Supplier 22", "50", "0"),
+            entry(2022, "401000", "Supplier 22b", "0", "20"),
+            entry(2022, "606000", "Fuel", "20", "0"),
+        ]
+        statements = StatementCache(mapper)
+        statements.add_entries(fy2023)
+        statements.balance_list()
+        statements.add_entries(fy2022)
+
+        def traces(sheets):
+            return [[(k, v.value, v.entries) for k, v in bs._traces.items()] for bs in sheets]
+
+        expected = BalanceBuilder(mapper).build_multi_year(fy2023 + fy2022)
+        assert statements.balance_list() == expected
+        assert traces(statements.balance_list()) == traces(expected)
+        # One balance sheet at a time gives the same result
+        single = StatementCache(mapper)
+        single.add_entries(fy2023)
+        single.add_entries(fy2022)
+        assert traces([single.balance(2023)]) == traces(expected[1:])
+
+    def test_store_statements_built_elsewhere(self, mapper):
+        """Stored statements are served until entries invalidate them."""
+        entries = _year_entries(2022, "1000") + _year_entries(2023, "2500")
+        statements = StatementCache(mapper)
+        statements.add_entries(entries)
+        assert not statements.complete
+
+        built = FusedBuilder(mapper).build(entries, views=False)
+        statements.store(built.pl_list, built.balance_list)
+        assert statements.complete
+        assert statements.pl_list()[1] is built.pl_list[1]
+
+        statements.add_entries(_year_entries(2023, "10"))
+        assert not statements.complete
+        assert statements.pl(2022) is built.pl_list[0]
+        with pytest.raises(ValueError):
+            statements.store(built.pl_list[:1], built.balance_list[:1])
+
+class TestAccountMapperLookup:
+    """Tests for the prefix trie and per-account memo of AccountMapper."""
+
+    @pytest.fixture
+    def mapper(self):
+        return AccountMapper()
+
+    @staticmethod
+    def _linear(mapper, account):
+        """Longest-prefix match by scanning every prefix."""
+        account = str(account).strip()
+        matches = [p for p in mapper.mapping if p and account.startswith(p)]
+        return mapper.mapping[max(matches, key=len)] if matches else None
+
+    def test_matches_linear_scan(self, mapper):
+        accounts = ["", "  ", "0", "999999", " 411000 ", "4011", "6"]
+        for prefix in mapper.mapping:
+            accounts += [prefix, prefix + "0", prefix + "99", prefix[:-1]]
+        for account in accounts:
+            assert mapper.get_category(account) == self._linear(mapper, account), account
+
+    def test_memoizes_each_account_once(self, mapper, monkeypatch):
+        calls = []
+        match = mapper._match
+        monkeypatch.setattr(
+            mapper, "_match", lambda account: calls.append(account) or match(account)
+        )
+
+        for _ in range(3):
+            mapper.get_category("706000")
+            mapper.get_pl_category("706000")
+            mapper.is_debit_positive("512000")
+        assert calls == ["706000", "512000"]
+
+    def test_categorize_many_matches_per_account(self, mapper):
+        accounts = ["706000", "512000", "401000", "606100", "999999", "", "108000"]
+        result = mapper.categorize_many(accounts)
+
+        assert len(result) == len(accounts)
+        for i, account in enumerate(accounts):
+            assert result.category(i) == mapper.get_category(account)
+            assert result.is_pl[i] == (mapper.get_pl_category(account) is not None)
+            assert result.is_balance[i] == (mapper.get_balance_category(account) is not None)
+            assert result.debit_positive[i] == mapper.is_debit_positive(account)
+        assert result.codes[accounts.index("999999")] == UNMAPPED
+        assert list(result.signs[:3]) == [-1, 1, -1]
+
+    def test_categorize_many_broadcasts_to_rows(self, mapper):
+        columns = ColumnarParseResult.from_entries(
+            _year_entries(2022, "1000") + _year_entries(2023, "2500")
+        )
+        rows = mapper.categorize_many(columns.accounts).take(columns.account_codes)
+
+        assert [rows.category(i) for i in range(len(rows))] == ["revenue", "cash"] * 2
+        revenue = rows.mask("revenue")
+        assert int(columns.credit_cents[revenue].sum()) == 350000
+        assert not rows.mask("not_a_category").any()
+
+    def test_categorize_many_empty(self, mapper):
+        result = mapper.categorize_many([])
+        assert len(result) == 0
+        assert result.is_pl.dtype == bool
+
+    def test_debit_positive(self, mapper):
+        assert mapper.is_debit_positive("512000") is True
+        assert mapper.is_debit_positive("401000") is False
+        assert mapper.is_debit_positive("606000") is True
+        assert mapper.is_debit_positive("706000") is False
+        assert mapper.is_debit_positive("") is True
+
+
+MAPPING_YAML = """
+revenue:
+  - prefix: "70"
+  - prefix: "706"
+cash:
+  - prefix: "512"
+"""
+
+
+class TestMappingRegistry:
+    """Tests for the shared registry of compiled mapping files."""
+
+    @pytest.fixture
+    def mapping_file(self, tmp_path):
+        path = tmp_path / "client.yml"
+        path.write_text(MAPPING_YAML, encoding="utf-8")
+        return path
+
+    def test_compiles_each_file_once(self, mapping_file, monkeypatch):
+        registry = MappingRegistry()
+        first = AccountMapper(mapping_file, registry=registry)
+
+        import src.mapper.registry as registry_module
+        monkeypatch.setattr(
+            registry_module.yaml, "safe_load", lambda data: pytest.fail("YAML re-parsed")
+        )
+        second = AccountMapper(mapping_file, registry=registry)
+
+        assert second._compiled is first._compiled
+        assert second.get_category("706100") == "revenue"
+        assert len(registry) == 1
+
+    def test_mapping_is_read_only(self, mapping_file):
+        mapper = AccountMapper(mapping_file, registry=MappingRegistry())
+        assert dict(mapper.mapping) == {"70": "revenue", "706": "revenue", "512": "cash"}
+        with pytest.raises(TypeError):
+            mapper.mapping["60"] = "purchases"
+
+    def test_reloads_changed_file(self, mapping_file):
+        registry = MappingRegistry()
+        before = AccountMapper(mapping_file, registry=registry)
+        stat = mapping_file.stat()
+
+        mapping_file.write_text(MAPPING_YAML.replace('"512"', '"51"'), encoding="utf-8")
+        os.utime(mapping_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        after = AccountMapper(mapping_file, registry=registry)
+
+        assert after.get_category("514000") == "cash"
+        assert before.get_category("514000") is None  # built before the edit
+        assert len(registry) == 1
+
+    def test_touch_keeps_compiled_mapping(self, mapping_file):
+        registry = MappingRegistry()
+        compiled = registry.get(mapping_file)
+        stat = mapping_file.stat()
+        os.utime(mapping_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        assert registry.get(mapping_file) is compiled
+
+    def test_holds_several_mappings(self, mapping_file, tmp_path):
+        other = tmp_path / "other.yml"
+        other.write_text('purchases:\n  - prefix: "60"\n', encoding="utf-8")
+        copy = tmp_path / "copy.yml"
+        copy.write_text(MAPPING_YAML, encoding="utf-8")
+        registry = MappingRegistry()
+
+        assert AccountMapper(mapping_file, registry=registry).get_category("601000") is None
+        assert AccountMapper(other, registry=registry).get_category("601000") == "purchases"
+        assert registry.get(copy) is registry.get(mapping_file)  # same content
+        assert len(registry) == 2
+
+    def test_shared_mapper(self, mapping_file):
+        registry = MappingRegistry()
+        mapper = registry.mapper(mapping_file)
+        assert registry.mapper(mapping_file) is mapper
+        assert mapper.get_category("512000") == "cash"
+
+        stat = mapping_file.stat()
+        mapping_file.write_text(MAPPING_YAML.replace('"512"', '"51"'), encoding="utf-8")
+        os.utime(mapping_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        edited = registry.mapper(mapping_file)
+        assert edited is not mapper
+        assert edited.get_category("514000") == "cash"
+
+
+def _mixed_entries(cents: bool = False) -> list:
+    """Entries over three years, out of order, with empty labels (also on
+    the first row of an account) and a FEC whose source year differs from
+    the entry dates."""
+    rows = [
+        (date(2023, 3, 5), "706000", "", "0", "800.50", 2023),
+        (date(2023, 3, 5), "411000", "", "800.50", "0", 2023),
+        (date(2023, 3, 20), "706000", "March sales", "0", "10", 2023),
+        (date(2022, 1, 10), "512000", "Bank", "1200", "0", 2022),
+        (date(2022, 1, 10), "706000", "Sales", "0", "1200", 2022),
+        (date(2023, 3, 5), "411000", "Client", "800.50", "0", 2023),
+        (date(2021, 12, 31), "101000", "Capital", "0", "5000", 2022),
+        (date(2021, 12, 31), "512000", "", "5000", "0", 2022),
+        (date(2023, 7, 1), "606100", "Fuel", "45.10", "0", 2023),
+        (date(2023, 7, 1), "401000", "Supplier", "0", "45.10", 2023),
+        (date(2022, 5, 2), "706000", "Late sales label", "0", "100", 2022),
+        (date(2023, 7, 1), "999999", "Suspense", "1", "0", 2023),
+        (date(2023, 7, 1), "512000", "", "0", "1", 2023),
+    ]
+    if cents:
+        return [
+            CentsJournalEntry(date=d, account_num=a, label=lib,
+                              debit_cents=int(Decimal(dr) * 100),
+                              credit_cents=int(Decimal(cr) * 100), source_year=y)
+            for d, a, lib, dr, cr, y in rows
+        ]
+    return [
+        JournalEntry(date=d, account_num=a, label=lib, debit=Decimal(dr), credit=Decimal(cr),
+                     source_year=y)
+        for d, a, lib, dr, cr, y in rows
+    ]
+
+
+class TestFusedBuilder:
+    """Tests for the single-pass builder used by /api/process."""
+
+    @pytest.fixture
+    def mapper(self):
+        return AccountMapper()
+
+    @staticmethod
+    def _traces(statements):
+        return [
+            [(name, traced.value, traced.entries) for name, traced in s._traces.items()]
+            for s in statements
+        ]
+
+    @pytest.mark.parametrize("cents", [False, True])
+    def test_statements_match_builders(self, mapper, cents):
+        entries = _mixed_entries(cents)
+        result = FusedBuilder(mapper).build(entries, views=False)
+
+        expected_pl = PLBuilder(mapper).build_multi_year(entries)
+        expected_bs = BalanceBuilder(mapper).build_multi_year(entries)
+        assert result.pl_list == expected_pl
+        assert result.balance_list == expected_bs
+        assert self._traces(result.pl_list) == self._traces(expected_pl)
+        assert self._traces(result.balance_list) == self._traces(expected_bs)
+        assert result.years == [2021, 2022, 2023]
+        assert result.detail_data == {}
+
+    @staticmethod
+    def _cube(entries):
+        cube = AccountCube()
+        for entry in entries:
+            cube.add(entry)
+        return cube
+
+    @pytest.mark.parametrize("cents", [False, True])
+    @pytest.mark.parametrize("source", ["entries", "cube_entries", "cube"])
+    def test_views_match_builders(self, mapper, cents, source):
+        # Expected views always come from the raw entries
+        entries = _mixed_entries(cents)
+        if source == "entries":
+            result = FusedBuilder(mapper).build(entries, statements=False, top_n=3)
+        elif source == "cube_entries":
+            summed = self._cube(entries).to_entries()
+            result = FusedBuilder(mapper).build(summed, statements=False, top_n=3)
+        else:
+            # The entries are not read without statements
+            result = FusedBuilder(mapper).build(
+                None, statements=False, top_n=3, cube=self._cube(entries)
+            )
+
+        monthly = MonthlyBuilder(mapper)
+        details = DetailBuilder(mapper)
+        assert result.pl_list is None
+        assert result.monthly_revenue == monthly.build_monthly_revenue(entries)
+        assert result.monthly_costs == monthly.build_monthly_costs(entries)
+        assert result.detail_data == {
+            "account_summary": details.build_account_summary(entries),
+            "top_accounts": details.build_top_accounts_all_years(entries, top_n=3),
+            "category_breakdown": details.build_category_breakdown_all_years(entries),
+            "pl_detail": details.build_pl_detail(entries, 2023),
+            "balance_detail": details.build_balance_detail(entries, 2023),
+        }
+        assert list(result.detail_data["category_breakdown"]) == list(
+            details.build_category_breakdown_all_years(entries)
+        )
+
+    @pytest.mark.parametrize("cents", [False, True])
+    def test_statements_with_cube_views(self, mapper, cents):
+        """Statements from the entries and views from the cube, in one call."""
+        entries = _mixed_entries(cents)
+        result = FusedBuilder(mapper).build(entries, top_n=3, cube=self._cube(entries))
+        expected = FusedBuilder(mapper).build(entries, top_n=3)
+        assert repr(result) == repr(expected)
+        assert self._traces(result.pl_list) == self._traces(expected.pl_list)
+        assert self._traces(result.balance_list) == self._traces(expected.balance_list)
+
+    def test_derived_monthly_views(self, mapper):
+        entries = _mixed_entries()
+        result = FusedBuilder(mapper).build(entries)
+        monthly = MonthlyBuilder(mapper)
+
+        revenue, costs = result.monthly_revenue, result.monthly_costs
+        assert MonthlyBuilder.ebitda_from(revenue, costs) == monthly.build_monthly_ebitda(entries)
+        assert MonthlyBuilder.quarterly_from(revenue) == monthly.build_quarterly_summary(entries)
+        assert MonthlyBuilder.cumulative_from(revenue) == monthly.build_cumulative_revenue(entries)
+        assert MonthlyBuilder.seasonality_from(revenue) == monthly.get_seasonality_index(entries)
+
+    def test_empty(self, mapper):
+        result = FusedBuilder(mapper).build([])
+        assert result.years == []
+        assert result.pl_list == [] and result.balance_list == []
+        assert "pl_detail" not in result.detail_data
+
+
+class TestBalanceMultiYear:
+    """Tests for balance sheets cumulated from per-year movements."""
+
+    @pytest.fixture
+    def mapper(self):
+        return AccountMapper()
+
+    @pytest.mark.parametrize("reverse", [False, True])
+    def test_matches_per_year_build(self, mapper, reverse):
+        entries = _mixed_entries()
+        if reverse:
+            entries = entries[::-1]
+        builder = BalanceBuilder(mapper)
+        sheets = builder.build_multi_year(entries)
+
+        assert [bs.year for bs in sheets] == [2022, 2023]
+        for bs in sheets:
+            expected = builder.build(entries, bs.year)
+            assert bs == expected
+            assert {k: (v.value, v.entries) for k, v in bs._traces.items()} == {
+                k: (v.value, v.entries) for k, v in expected._traces.items()
+            }
+            assert list(bs._traces) == list(expected._traces)
+
+    def test_cumulates_skipped_years(self, mapper):
+        entries = (
+            _year_entries(2021, "100") + _year_entries(2022, "1000") + _year_entries(2023, "2500")
+        )
+        movements = BalanceBuilder(mapper).movements(entries)
+        assert [bs.cash for bs in movements.cumulate([2023])] == [Decimal("3600")]
+        cash = [bs.cash for bs in movements.cumulate([2022, 2023])]
+        assert cash == [Decimal("1100"), Decimal("3600")]
+
+    def test_traces_are_shared_across_years(self, mapper):
+        entries = _year_entries(2022, "1000") + _year_entries(2023, "2500")
+        first, second = BalanceBuilder(mapper).build_multi_year(entries)
+        cash_2022 = first._traces["cash"].entries
+        cash_2023 = second._traces["cash"].entries
+        assert len(cash_2023) == 2
+        assert cash_2023[0] is cash_2022[0]
+        assert cash_2023 is not cash_2022
@@ -0,0 +1,1389 @@
+"""
+Unit tests for the FEC parser.
+
+Tests the standard parse path and the streaming/alternative parse modes.
+"""
+
+import re
+from datetime import date
+from decimal import Decimal
+
+import pytest
+
+from src.parser.fec_parser import FECParser
+
+FEC_HEADER = (
+    "JournalCode\tJournalLib\tEcritureNum\tEcritureDate\tCompteNum\tCompteLib\t"
+    "CompAuxNum\tCompAuxLib\tPieceRef\tPieceDate\tEcritureLib\tDebit\tCredit\t"
+    "EcritureLet\tDateLet\tValidDate\tMontantdevise\tIdevise"
+)
+
+
+def make_fec_row(num, day, account, label, debit, credit):
+    """Build a tab-separated FEC row in the standard 18-column layout."""
+    return (
+        f"VE\tVentes\t{num}\t{day}\t{account}\t{label}\t\t\tP{num}\t{day}\t"
+        f"{label}\t{debit}\t{credit}\t\t\t{day}\t\t"
+    )
+
+
+@pytest.fixture
+def fec_rows():
+    """Balanced FEC rows spread over two months."""
+    rows = []
+    for i in range(1, 51):
+        day = f"2024{1 + i % 2:02d}{1 + i % 28:02d}"
+        rows.append(make_fec_row(i, day, "411000", "Client", f"{i},50", "0,00"))
+        rows.append(make_fec_row(i, day, "706000", "Prestation", "0,00", f"{i},50"))
+    return rows
+
+
+@pytest.fixture
+def fec_file(temp_dir, fec_rows):
+    """Write a valid FEC file with a SIRET-style name."""
+    path = temp_dir / "123456789FEC20241231.txt"
+    path.write_text(FEC_HEADER + "\r\n" + "\r\n".join(fec_rows) + "\r\n", encoding="utf-8")
+    return path
+
+
+class TestFECParserBasics:
+    """Tests for the default parse path."""
+
+    def test_parse_entries(self, fec_file):
+        """Test parsing a well-formed file."""
+        parser = FECParser(fec_file)
+        entries = parser.parse()
+        assert len(entries) == 100
+        assert parser.encoding == "utf-8"
+        assert parser.delimiter == "\t"
+        assert parser.source_year == 2024
+        assert entries[0].account_num == "411000"
+        assert entries[0].debit == Decimal("1.50")
+        assert entries[0].date == date(2024, 2, 2)
+
+    def test_parse_errors_below_threshold(self, temp_dir, fec_rows):
+        """Test that a few bad rows are reported but do not fail the parse."""
+        rows = fec_rows + [make_fec_row(99, "not-a-date", "411000", "Bad", "1,00", "0,00")]
+        path = temp_dir / "bad.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        result = FECParser(path).parse_with_result()
+        assert result.total_rows == 101
+        assert len(result.entries) == 100
+        assert len(result.errors) == 1
+        assert result.errors[0].row == 102
+
+    def test_parse_errors_above_threshold(self, temp_dir):
+        """Test that a mostly invalid file is rejected."""
+        rows = [make_fec_row(i, "garbage", "411000", "Bad", "1,00", "0,00") for i in range(10)]
+        path = temp_dir / "bad.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        with pytest.raises(ValueError, match="exceeds threshold"):
+            FECParser(path).parse_with_result()
+
+    def test_parse_latin1_file(self, temp_dir, fec_rows):
+        """Test encoding fallback for non UTF-8 files."""
+        rows = fec_rows + [make_fec_row(99, "20240105", "401000", "Fournisseur é", "0,00", "1,00")]
+        path = temp_dir / "latin.txt"
+        path.write_bytes((FEC_HEADER + "\n" + "\n".join(rows)).encode("cp1252"))
+
+        parser = FECParser(path)
+        entries = parser.parse()
+        assert parser.encoding == "iso-8859-1"
+        assert entries[-1].label == "Fournisseur é"
+
+    @pytest.mark.parametrize("method", [
+        "parse_with_result", "parse_mmap", "parse_parallel", "parse_bulk", "parse_stream",
+    ])
+    def test_parse_cr_line_breaks(self, temp_dir, fec_rows, monkeypatch, method):
+        """Test CR-only (old Mac) line breaks parse like LF ones in every mode."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        rows = list(fec_rows)
+        rows[10] = make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00")
+        lf = temp_dir / "lf.txt"
+        lf.write_text(FEC_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        cr = temp_dir / "cr.txt"
+        cr.write_text(FEC_HEADER + "\r" + "\r".join(rows) + "\r", encoding="utf-8")
+
+        expected = FECParser(lf).parse_with_result()
+        parser = FECParser(cr)
+        if method == "parse_stream":
+            with open(cr, "rb") as f:
+                result = parser.parse_stream(f)
+        elif method == "parse_parallel":
+            result = parser.parse_parallel(workers=2)
+        else:
+            result = getattr(parser, method)()
+        if method == "parse_bulk":
+            assert result.to_entries() == FECParser(lf).parse_columnar().to_entries()
+            result = parser.parse_result
+        else:
+            assert result.entries == expected.entries
+        assert result.errors == expected.errors
+        assert len(expected.entries) == 99
+
+    def test_parse_mixed_line_breaks_small_chunks(self, temp_dir, fec_rows, monkeypatch):
+        """Test CR, LF and CRLF breaks split across read chunks."""
+        monkeypatch.setattr(FECParser, "READ_CHUNK_SIZE", 7)
+        breaks = ["\r", "\n", "\r\n"]
+        text = FEC_HEADER + "\r\n" + "".join(
+            row + breaks[i % 3] for i, row in enumerate(fec_rows)
+        )
+        path = temp_dir / "mixed.txt"
+        path.write_text(text, encoding="utf-8")
+
+        result = FECParser(path).parse_with_result()
+        assert result.total_rows == 100
+        assert not result.errors
+        assert [e.label for e in result.entries] == [
+            "Client" if i % 2 == 0 else "Prestation" for i in range(100)
+        ]
+
+
+class TestFECParserParseModes:
+    """Tests for parse_with_mode(), the PARSE_MODE entry point."""
+
+    @pytest.fixture
+    def error_file(self, temp_dir, fec_rows):
+        rows = list(fec_rows)
+        rows[10] = make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00")
+        path = temp_dir / "123456789FEC20241231.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        return path
+
+    @pytest.mark.parametrize("mode", FECParser.PARSE_MODES)
+    def test_modes_match_csv(self, error_file, mode, monkeypatch):
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        expected = FECParser(error_file, amount_mode="cents", aggregate=True)
+        expected_result = expected.parse_with_result()
+        parser = FECParser(error_file, amount_mode="cents", aggregate=True)
+        result = parser.parse_with_mode(mode)
+
+        assert result.entries == expected_result.entries == parser.entries
+        assert result.total_rows == expected_result.total_rows
+        assert [e.row for e in result.errors] == [e.row for e in expected_result.errors]
+        assert parser.cube.to_entries() == expected.cube.to_entries()
+
+    @pytest.mark.parametrize("mode", ["mmap", "parallel", "bulk"])
+    def test_modes_use_cache(self, fec_file, temp_dir, mode, monkeypatch):
+        from src.parser import ParseCache
+
+        cache = ParseCache(temp_dir / "cache", max_bytes=10 * 1024 * 1024)
+        expected = FECParser(fec_file, amount_mode="cents", cache=cache).parse_with_mode(mode)
+        assert len(list(cache.cache_dir.glob("*.npz"))) == 1
+
+        monkeypatch.setattr(FECParser, "_iter_parse", None)
+        monkeypatch.setattr(FECParser, "parse_mmap", None)
+        monkeypatch.setattr(FECParser, "parse_parallel", None)
+        monkeypatch.setattr(FECParser, "parse_bulk", None)
+        result = FECParser(fec_file, amount_mode="cents", cache=cache).parse_with_mode(mode)
+        assert result.entries == expected.entries
+
+    def test_invalid_modes(self, fec_file):
+        with pytest.raises(ValueError, match="parse mode"):
+            FECParser(fec_file).parse_with_mode("fast")
+        with pytest.raises(ValueError, match="cents"):
+            FECParser(fec_file).parse_with_mode("bulk")
+
+
+class TestFECParserStreaming:
+    """Tests for iter_entries() streaming mode."""
+
+    def test_iter_entries_matches_parse(self, fec_file):
+        """Test streaming yields the same entries as parse()."""
+        expected = FECParser(fec_file).parse()
+        parser = FECParser(fec_file)
+        assert list(parser.iter_entries()) == expected
+        assert parser.parse_result.total_rows == 100
+        assert parser.parse_result.entries == []
+
+    def test_iter_entries_batches(self, fec_file):
+        """Test fixed-size batches."""
+        batches = list(FECParser(fec_file).iter_entries(batch_size=30))
+        assert [len(b) for b in batches] == [30, 30, 30, 10]
+
+    def test_iter_entries_small_chunks(self, fec_file, monkeypatch):
+        """Test records split across read chunks are reassembled."""
+        monkeypatch.setattr(FECParser, "READ_CHUNK_SIZE", 7)
+        expected = FECParser(fec_file).parse()
+        assert list(FECParser(fec_file).iter_entries()) == expected
+
+    def test_iter_entries_invalid_batch_size(self, fec_file):
+        """Test batch_size must be positive."""
+        with pytest.raises(ValueError):
+            list(FECParser(fec_file).iter_entries(batch_size=0))
+
+
+class TestFECParserParallel:
+    """Tests for parse_parallel() chunked mode."""
+
+    @pytest.fixture(autouse=True)
+    def small_ranges(self, monkeypatch):
+        """Force the parallel path on small test files."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+
+    def test_parse_parallel_matches_sequential(self, fec_file):
+        """Test merged results are in file order."""
+        expected = FECParser(fec_file).parse_with_result()
+        result = FECParser(fec_file).parse_parallel(workers=3)
+        assert result.entries == expected.entries
+        assert result.total_rows == expected.total_rows
+
+    def test_parse_parallel_row_numbers(self, temp_dir, fec_rows):
+        """Test ParseError rows match the sequential parse."""
+        rows = list(fec_rows)
+        rows[10] = make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00")
+        rows[80] = make_fec_row(98, "20240101", "", "Bad", "1,00", "0,00")
+        path = temp_dir / "errors.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows) + "\n\n", encoding="utf-8")
+
+        expected = FECParser(path).parse_with_result()
+        result = FECParser(path).parse_parallel(workers=4)
+        assert [e.row for e in result.errors] == [12, 82]
+        assert result.errors == expected.errors
+        assert result.entries == expected.entries
+
+    def test_parse_parallel_quoted_fallback(self, temp_dir, fec_rows):
+        """Test files with quoted fields are parsed sequentially."""
+        rows = list(fec_rows)
+        rows[5] = make_fec_row(6, "20240101", "411000", '"Multi\nline"', "1,00", "0,00")
+        path = temp_dir / "quoted.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        expected = FECParser(path).parse_with_result()
+        result = FECParser(path).parse_parallel(workers=2)
+        assert result.entries == expected.entries
+        assert result.entries[5].label == "Multi\nline"
+
+    def test_parse_parallel_mixed_encoding_fallback(self, temp_dir, fec_rows, monkeypatch):
+        """Test files that do not decode with the detected encoding are parsed sequentially."""
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 16)
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_WINDOWS", 0)
+        rows = [row.encode("utf-8") for row in fec_rows]
+        rows[40] = make_fec_row(41, "20240105", "401000", "Café", "0,00", "1,00").encode("utf-8")
+        rows[60] = rows[60].replace(b"Ventes", b"Vent\xe9s")
+        path = temp_dir / "mixed.txt"
+        path.write_bytes(FEC_HEADER.encode("utf-8") + b"\n" + b"\n".join(rows))
+
+        expected = FECParser(path).parse_with_result()
+        result = FECParser(path).parse_parallel(workers=3)
+        assert result.entries == expected.entries
+        assert result.warnings == expected.warnings
+
+
+class TestFECParserEncoding:
+    """Tests for sample-based encoding detection and mid-stream failover."""
+
+    def test_sample_is_bounded(self, fec_file, monkeypatch):
+        """Test detection reads only head, tail and a few windows."""
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 64)
+        samples = FECParser(fec_file)._read_encoding_samples()
+        assert len(samples) == 2 + FECParser.ENCODING_SAMPLE_WINDOWS
+        assert all(len(sample) == 64 for sample, _ in samples)
+
+    def test_failover_mid_stream(self, temp_dir, fec_rows, monkeypatch):
+        """Test a bad byte outside the sample switches encoding mid-stream."""
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 16)
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_WINDOWS", 0)
+        monkeypatch.setattr(FECParser, "READ_CHUNK_SIZE", 256)
+        rows = list(fec_rows)
+        rows[60] = make_fec_row(61, "20240105", "401000", "Société", "0,00", "1,00")
+        path = temp_dir / "mixed.txt"
+        path.write_bytes((FEC_HEADER + "\n" + "\n".join(rows)).encode("cp1252"))
+
+        parser = FECParser(path)
+        result = parser.parse_with_result()
+        assert parser.encoding == "iso-8859-1"
+        assert len(result.entries) == 100
+        assert result.entries[60].label == "Société"
+        assert "decoding the rest of the file as iso-8859-1" in result.warnings[0]
+
+    def test_utf8_character_cut_by_window(self):
+        """Test windows cutting a multi-byte character still detect UTF-8."""
+        data = "é".encode("utf-8") * 10
+        assert FECParser._sample_decodes(data[1:-1], "utf-8", (True, True))
+        assert not FECParser._sample_decodes(data[:-1], "utf-8", (False, False))
+
+
+class TestFECParserCentsMode:
+    """Tests for the integer-cents amount mode."""
+
+    @pytest.mark.parametrize("raw, cents", [
+        ("261,54", 26154),
+        ("-12.50", -1250),
+        ("100", 10000),
+        ("", 0),
+        ("1 234,5", 123450),
+        ("1.234,56", 123456),
+    ])
+    def test_parse_amount_cents(self, fec_file, raw, cents):
+        """Test fast path and fallback produce the decimal-mode value."""
+        parser = FECParser(fec_file, amount_mode="cents")
+        assert parser._parse_amount_cents(raw) == cents
+        assert parser._parse_amount(raw) * 100 == cents
+
+    def test_parse_amount_cents_rejects_sub_cent(self, fec_file):
+        """Test amounts with more than 2 decimals are rejected."""
+        parser = FECParser(fec_file, amount_mode="cents")
+        with pytest.raises(ValueError, match="cents mode"):
+            parser._parse_amount_cents("1.005")
+
+    def test_invalid_amount_mode(self, fec_file):
+        """Test unknown amount modes are rejected."""
+        with pytest.raises(ValueError, match="amount_mode"):
+            FECParser(fec_file, amount_mode="float")
+
+    def test_cents_entries_match_decimal(self, fec_file):
+        """Test cents entries expose the same Decimal amounts."""
+        decimal_entries = FECParser(fec_file).parse()
+        cents_entries = FECParser(fec_file, amount_mode="cents").parse()
+        assert [(e.debit, e.credit, e.amount) for e in cents_entries] == [
+            (e.debit, e.credit, e.amount) for e in decimal_entries
+        ]
+        assert cents_entries[0].debit_cents == 150
+
+    def test_builders_match_decimal(self, fec_file):
+        """Test builders aggregate cents to the same statements."""
+        from src.engine import BalanceBuilder, DetailBuilder, MonthlyBuilder, PLBuilder
+        from src.mapper.account_mapper import AccountMapper
+
+        decimal_entries = FECParser(fec_file).parse()
+        cents_entries = FECParser(fec_file, amount_mode="cents").parse()
+        mapper = AccountMapper()
+
+        for build in (
+            PLBuilder(mapper).build_multi_year,
+            BalanceBuilder(mapper).build_multi_year,
+            MonthlyBuilder(mapper).build_monthly_revenue,
+            DetailBuilder(mapper).build_account_summary,
+            DetailBuilder(mapper).build_category_breakdown_all_years,
+        ):
+            assert build(cents_entries) == build(decimal_entries)
+
+    def test_cents_mode_is_bit_identical(self, temp_dir, fec_rows):
+        """Test both modes give the same Decimals, down to their scale."""
+        from src.engine import BalanceBuilder, DetailBuilder, MonthlyBuilder, PLBuilder
+        from src.engine.fused_builder import FusedBuilder
+        from src.mapper.account_mapper import AccountMapper
+
+        rows = fec_rows + [
+            make_fec_row(90, "20240105", "706000", "Whole", "0", "100"),
+            make_fec_row(91, "20240105", "411000", "One place", "1,5", "-0"),
+            make_fec_row(92, "20240106", "411000", "Thousands", "1.234,56", ""),
+            make_fec_row(93, "20240106", "512000", "Spaces", "1 000", "0,000"),
+        ]
+        path = temp_dir / "scales.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        decimal_entries = FECParser(path).parse()
+        cents_entries = FECParser(path, amount_mode="cents").parse()
+        assert [(str(e.debit), str(e.credit)) for e in cents_entries] == [
+            (str(e.debit), str(e.credit)) for e in decimal_entries
+        ]
+        assert str(decimal_entries[-3].debit) == "1.50"
+
+        mapper = AccountMapper()
+        for build in (
+            PLBuilder(mapper).build_multi_year,
+            BalanceBuilder(mapper).build_multi_year,
+            MonthlyBuilder(mapper).build_monthly_revenue,
+            DetailBuilder(mapper).build_account_summary,
+            DetailBuilder(mapper).build_category_breakdown_all_years,
+            FusedBuilder(mapper).build,
+        ):
+            assert repr(build(cents_entries)) == repr(build(decimal_entries))
+
+
+class TestFECParserDates:
+    """Tests for date-format lock-in and memoized date parsing."""
+
+    def test_date_format_locked(self, fec_file):
+        """Test the format is detected from the first rows."""
+        parser = FECParser(fec_file)
+        assert parser.date_format is None
+        parser.parse()
+        assert parser.date_format == "%Y%m%d"
+
+    def test_dates_are_memoized(self, fec_file):
+        """Test repeated date strings share one converted value."""
+        entries = FECParser(fec_file).parse()
+        same_day = [e.date for e in entries if e.date == entries[0].date]
+        assert len(same_day) > 1
+        assert all(d is same_day[0] for d in same_day)
+
+    def test_date_format_miss_falls_back(self, temp_dir, fec_rows):
+        """Test rows in another format still parse after lock-in."""
+        rows = fec_rows + [make_fec_row(99, "15/03/2024", "411000", "Client", "1,00", "0,00")]
+        path = temp_dir / "mixed_dates.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        parser = FECParser(path)
+        result = parser.parse_with_result()
+        assert parser.date_format == "%Y%m%d"
+        assert result.errors == []
+        assert result.entries[-1].date == date(2024, 3, 15)
+
+
+class TestFECParserInterning:
+    """Tests for per-file interning of account numbers and labels."""
+
+    @staticmethod
+    def assert_shared(entries):
+        by_account = {}
+        for entry in entries:
+            shared = by_account.setdefault(entry.account_num, entry)
+            assert entry.account_num is shared.account_num
+            assert entry.label is shared.label  # one label per account in fec_rows
+
+    def test_strings_are_shared(self, fec_file):
+        """Test equal account numbers and labels are one object."""
+        self.assert_shared(FECParser(fec_file).parse())
+        self.assert_shared(FECParser(fec_file).parse_mmap().entries)
+
+    def test_strings_shared_across_parallel_ranges(self, fec_file, monkeypatch):
+        """Test ranges parsed by different workers share strings after merge."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        self.assert_shared(FECParser(fec_file).parse_parallel(workers=3).entries)
+
+    def test_label_interning_is_bounded(self, fec_file, monkeypatch):
+        """Test labels past LABEL_INTERN_SIZE are kept but not interned."""
+        monkeypatch.setattr(FECParser, "LABEL_INTERN_SIZE", 1)
+        entries = FECParser(fec_file).parse()
+        assert {e.label for e in entries} == {"Client", "Prestation"}
+        assert entries[0].label is entries[2].label
+
+
+class TestFECParserColumnar:
+    """Tests for parse_columnar() and ColumnarParseResult."""
+
+    def test_columns_match_entries(self, fec_file):
+        """Test columns decode back to the cents-mode entries."""
+        entries = FECParser(fec_file, amount_mode="cents").parse()
+        columns = FECParser(fec_file).parse_columnar()
+
+        assert len(columns) == 100
+        assert columns.total_rows == 100
+        assert columns.days.dtype == "int32"
+        assert columns.debit_cents.dtype == "int64"
+        assert columns.accounts == ["411000", "706000"]
+        assert columns.source_year == 2024
+        assert [(e.date, e.account_num, e.label, e.debit_cents, e.credit_cents)
+                for e in columns.to_entries()] == [
+            (e.date, e.account_num, e.label, e.debit_cents, e.credit_cents) for e in entries
+        ]
+
+    def test_derived_columns(self, fec_file):
+        """Test vectorized years and months match the entry properties."""
+        entries = FECParser(fec_file).parse()
+        columns = FECParser(fec_file).parse_columnar()
+        assert columns.fiscal_years.tolist() == [e.fiscal_year for e in entries]
+        assert columns.effective_years.tolist() == [e.effective_year for e in entries]
+        assert columns.months.tolist() == [e.date.month for e in entries]
+        assert columns.years == [2024]
+
+    def test_account_totals(self, fec_file):
+        """Test group-by sums per account."""
+        columns = FECParser(fec_file).parse_columnar()
+        total = sum(i * 100 + 50 for i in range(1, 51))
+        assert columns.account_totals() == {"411000": (total, 0), "706000": (0, total)}
+        assert columns.account_totals(year=2023) == {}
+
+    def test_errors_are_reported(self, temp_dir, fec_rows):
+        """Test bad rows are skipped and recorded like the entry parse."""
+        rows = fec_rows + [make_fec_row(99, "20240105", "411000", "Bad", "1,005", "0,00")]
+        path = temp_dir / "errors.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        parser = FECParser(path)
+        columns = parser.parse_columnar()
+        assert len(columns) == 100
+        assert len(columns.errors) == 1
+        assert parser.parse_result.errors == columns.errors
+
+    @pytest.mark.parametrize(
+        "amount", ["99999999999999999999", "-99999999999999999,99", "Infinity"]
+    )
+    def test_out_of_range_amount_is_a_row_error(self, temp_dir, fec_rows, amount):
+        """Test amounts that do not fit int64 cents fail their row only."""
+        rows = fec_rows + [make_fec_row(99, "20240105", "411000", "Huge", amount, "0,00")]
+        path = temp_dir / "huge.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        columns = FECParser(path).parse_columnar()
+        assert len(columns) == 100
+        assert columns.error_count == 1
+        assert columns.errors[0].row == 102
+        assert columns.error_counts == {"debit": 1}
+
+    def test_from_entries(self, sample_entries):
+        """Test building columns from Decimal entries."""
+        from src.parser import ColumnarParseResult
+
+        columns = ColumnarParseResult.from_entries(sample_entries)
+        assert len(columns) == len(sample_entries)
+        assert [e.amount for e in columns.to_entries()] == [e.amount for e in sample_entries]
+
+
+class TestParseCache:
+    """Tests for the content-addressed parse cache."""
+
+    @pytest.fixture
+    def cache(self, temp_dir):
+        from src.parser import ParseCache
+        return ParseCache(temp_dir / "cache", max_bytes=10 * 1024 * 1024)
+
+    def test_hit_skips_parsing(self, fec_file, cache, monkeypatch):
+        """Test a second parse of the same bytes is loaded from the cache."""
+        expected = FECParser(fec_file, cache=cache).parse_with_result()
+        assert len(list(cache.cache_dir.glob("*.npz"))) == 1
+
+        def fail(*args):
+            raise AssertionError("file was parsed again")
+
+        monkeypatch.setattr(FECParser, "_iter_parse", fail)
+        parser = FECParser(fec_file, cache=cache)
+        result = parser.parse_with_result()
+        assert result.entries == expected.entries
+        assert result.total_rows == expected.total_rows
+        assert parser.encoding == "utf-8"
+        assert parser.delimiter == "\t"
+
+    def test_cached_errors_and_modes(self, temp_dir, fec_rows, cache):
+        """Test errors are cached and entries match each amount mode."""
+        rows = fec_rows + [make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00")]
+        path = temp_dir / "errors.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        expected = FECParser(path, cache=cache).parse_with_result()
+        result = FECParser(path, amount_mode="cents", cache=cache).parse_with_result()
+        assert result.errors == expected.errors
+        assert [e.debit_cents for e in result.entries] == [e.debit * 100 for e in expected.entries]
+
+    def test_source_year_from_file_name(self, temp_dir, fec_file, cache):
+        """Test a copy under another name gets its own source year."""
+        FECParser(fec_file, cache=cache).parse()
+        copy = temp_dir / "123456789FEC20231231.txt"
+        copy.write_bytes(fec_file.read_bytes())
+        assert {e.source_year for e in FECParser(copy, cache=cache).parse()} == {2023}
+
+    @pytest.mark.parametrize("amount", ["99999999999999999999", "Infinity"])
+    def test_amount_beyond_cents_is_not_cached(self, temp_dir, fec_rows, cache, amount):
+        """Test a valid decimal parse is returned, uncached, when cents cannot hold it."""
+        rows = fec_rows + [make_fec_row(99, "20240105", "411000", "Huge", amount, "0,00")]
+        path = temp_dir / "huge.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        expected = FECParser(path).parse()
+        assert FECParser(path, cache=cache).parse() == expected
+        assert list(cache.cache_dir.glob("*.npz")) == []
+
+    @pytest.mark.parametrize("kept", [0.5, 0.95])
+    def test_truncated_entry_is_a_miss(self, fec_file, cache, kept):
+        """Test a truncated entry is discarded and the file parsed again."""
+        expected = FECParser(fec_file, cache=cache).parse()
+        (entry,) = cache.cache_dir.glob("*.npz")
+        data = entry.read_bytes()
+        entry.write_bytes(data[:int(len(data) * kept)])
+
+        assert cache.load(cache.hash_file(fec_file)) is None
+        assert not entry.exists()
+        assert FECParser(fec_file, cache=cache).parse() == expected
+
+    def test_lru_eviction(self, temp_dir, fec_rows, cache):
+        """Test the least recently used entry is evicted first."""
+        import os
+
+        paths = []
+        for i in range(3):
+            path = temp_dir / f"file{i}.txt"
+            path.write_text(FEC_HEADER + "\n" + "\n".join(fec_rows[i:]), encoding="utf-8")
+            FECParser(path, cache=cache).parse()
+            paths.append(path)
+
+        # Age the entries, then touch the oldest one with a cache hit
+        for age, entry in enumerate(sorted(cache.cache_dir.glob("*.npz"))):
+            os.utime(entry, (1000 + age, 1000 + age))
+        FECParser(paths[0], cache=cache).parse()
+
+        sizes = [entry.stat().st_size for entry in cache.cache_dir.glob("*.npz")]
+        cache.max_bytes = sum(sizes) - 1
+        cache._evict()
+        assert cache.load(cache.hash_file(paths[0])) is not None
+        assert len(list(cache.cache_dir.glob("*.npz"))) == 2
+
+
+class TestFECParserMmap:
+    """Tests for the memory-mapped parse_mmap() path."""
+
+    def test_parse_mmap_matches_parse(self, fec_file):
+        """Test mmap parsing yields the same entries as the csv path."""
+        expected = FECParser(fec_file).parse_with_result()
+        parser = FECParser(fec_file)
+        result = parser.parse_mmap()
+        assert result.entries == expected.entries
+        assert result.total_rows == expected.total_rows
+        assert parser.delimiter == "\t"
+
+    def test_parse_mmap_errors(self, temp_dir, fec_rows):
+        """Test bad, short and blank rows are handled like the csv path."""
+        rows = list(fec_rows)
+        rows[10] = make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00")
+        rows[20] = "VE\tVentes\t21\t20240101"
+        rows[30] = "\t \t"
+        path = temp_dir / "errors.txt"
+        path.write_text(FEC_HEADER + "\r\n" + "\r\n".join(rows) + "\r\n\r\n", encoding="utf-8")
+
+        expected = FECParser(path).parse_with_result()
+        result = FECParser(path).parse_mmap()
+        assert [e.row for e in result.errors] == [12, 22]
+        assert result.errors == expected.errors
+        assert result.entries == expected.entries
+        assert result.total_rows == expected.total_rows == 99
+
+    def test_parse_mmap_quoted_fallback(self, temp_dir, fec_rows):
+        """Test files with quoted fields go through the csv path."""
+        rows = list(fec_rows)
+        rows[5] = make_fec_row(6, "20240101", "411000", '"Multi\nline"', "1,00", "0,00")
+        path = temp_dir / "quoted.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        result = FECParser(path).parse_mmap()
+        assert result.entries[5].label == "Multi\nline"
+
+    def test_parse_mmap_failover(self, temp_dir, fec_rows, monkeypatch):
+        """Test a bad byte outside the encoding sample switches encoding."""
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 16)
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_WINDOWS", 0)
+        rows = list(fec_rows)
+        rows[60] = make_fec_row(61, "20240105", "401000", "Société", "0,00", "1,00")
+        path = temp_dir / "mixed.txt"
+        path.write_bytes((FEC_HEADER + "\n" + "\n".join(rows)).encode("cp1252"))
+
+        parser = FECParser(path)
+        result = parser.parse_mmap()
+        assert parser.encoding == "iso-8859-1"
+        assert result.entries[60].label == "Société"
+        assert len(result.warnings) == 1
+
+    def test_parse_mmap_bad_byte_in_unused_column(self, temp_dir, fec_rows, monkeypatch):
+        """Test a byte failing to decode in an unused column fails over like the csv path."""
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 16)
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_WINDOWS", 0)
+        rows = [row.encode("utf-8") for row in fec_rows]
+        rows[40] = make_fec_row(41, "20240105", "401000", "Café", "0,00", "1,00").encode("utf-8")
+        rows[60] = rows[60].replace(b"Ventes", b"Vent\xe9s")
+        path = temp_dir / "mixed.txt"
+        path.write_bytes(FEC_HEADER.encode("utf-8") + b"\n" + b"\n".join(rows))
+
+        expected = FECParser(path).parse_with_result()
+        parser = FECParser(path)
+        result = parser.parse_mmap()
+        assert parser.encoding == "iso-8859-1"
+        assert result.entries == expected.entries
+        assert result.warnings == expected.warnings
+
+
+class TestFECParserStream:
+    """Tests for parse_stream() and GrowingFile."""
+
+    def test_parse_stream_matches_parse(self, fec_file, monkeypatch):
+        """Test a plain binary stream parses like the file."""
+        monkeypatch.setattr(FECParser, "READ_CHUNK_SIZE", 7)
+        expected = FECParser(fec_file).parse_with_result()
+        parser = FECParser(fec_file)
+        with open(fec_file, "rb") as f:
+            result = parser.parse_stream(f)
+        assert result.entries == expected.entries
+        assert result.total_rows == expected.total_rows
+        assert parser.source_year == 2024
+
+    def test_parse_while_writing(self, temp_dir, fec_file):
+        """Test a file is parsed from a concurrent writer's chunks."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.parser.stream import GrowingFile
+
+        expected = FECParser(fec_file).parse()
+        data = fec_file.read_bytes()
+        path = temp_dir / "upload" / fec_file.name
+        path.parent.mkdir()
+        growing = GrowingFile(path)
+        parser = FECParser(path)
+
+        with ThreadPoolExecutor(1) as pool, growing.reader() as reader:
+            future = pool.submit(parser.parse_stream, reader)
+            for i in range(0, len(data), 100):
+                growing.write(data[i:i + 100])
+            growing.close()
+            assert future.result().entries == expected
+
+    def test_abort_stops_reader(self, temp_dir):
+        """Test readers raise once the writer aborts."""
+        from src.parser.stream import GrowingFile
+
+        growing = GrowingFile(temp_dir / "partial.txt")
+        growing.write(b"abc")
+        with growing.reader() as reader:
+            assert reader.read(10) == b"abc"
+            growing.abort(ValueError("too large"))
+            with pytest.raises(ValueError, match="too large"):
+                reader.read(10)
+
+    def test_stalled_writer_times_out(self, temp_dir):
+        """Test readers give up when no bytes arrive within the timeout."""
+        from src.parser.stream import GrowingFile
+
+        growing = GrowingFile(temp_dir / "stalled.txt", timeout=0.05)
+        growing.write(b"abc")
+        with growing.reader() as reader:
+            assert reader.read(10) == b"abc"
+            with pytest.raises(TimeoutError, match="stalled.txt"):
+                reader.read(10)
+        growing.close()
+
+    def test_parse_stream_fills_cache(self, fec_file, temp_dir, monkeypatch):
+        """Test the streamed bytes are cached under the file's hash."""
+        from src.parser import ParseCache
+
+        cache = ParseCache(temp_dir / "cache", max_bytes=10 * 1024 * 1024)
+        with open(fec_file, "rb") as f:
+            expected = FECParser(fec_file, cache=cache).parse_stream(f)
+
+        monkeypatch.setattr(FECParser, "_iter_parse", None)
+        assert FECParser(fec_file, cache=cache).parse() == expected.entries
+
+
+class TestFECParserCompressed:
+    """Tests for .gz, .zip and .zst input."""
+
+    @staticmethod
+    def compress(fec_file, name):
+        import gzip
+        import zipfile
+
+        data = fec_file.read_bytes()
+        path = fec_file.with_name(name)
+        if name.endswith(".gz"):
+            path.write_bytes(gzip.compress(data))
+        elif name.endswith(".zip"):
+            with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+                archive.writestr(fec_file.name, data)
+        else:
+            zstandard = pytest.importorskip("zstandard")
+            path.write_bytes(zstandard.ZstdCompressor().compress(data))
+        return path
+
+    @pytest.mark.parametrize("suffix", [".txt.gz", ".zip", ".txt.zst"])
+    def test_compressed_matches_plain(self, fec_file, suffix, monkeypatch):
+        """Test every parse mode reads compressed files like the plain file."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        expected = FECParser(fec_file).parse()
+        path = self.compress(fec_file, "123456789FEC20241231" + suffix)
+
+        parser = FECParser(path)
+        assert parser.parse() == expected
+        assert parser.source_year == 2024
+        assert parser.delimiter == "\t"
+        assert FECParser(path).parse_mmap().entries == expected
+        assert FECParser(path).parse_parallel(workers=2).entries == expected
+        with open(path, "rb") as f:
+            assert FECParser(path).parse_stream(f).entries == expected
+
+    def test_compressed_upload_stream(self, temp_dir, fec_file):
+        """Test a zip being written is parsed from its non-seekable reader."""
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.parser.stream import GrowingFile
+
+        expected = FECParser(fec_file).parse()
+        data = self.compress(fec_file, "123456789FEC20241231.zip").read_bytes()
+        (temp_dir / "upload").mkdir()
+        growing = GrowingFile(temp_dir / "upload" / "123456789FEC20241231.zip")
+
+        with ThreadPoolExecutor(1) as pool, growing.reader() as reader:
+            future = pool.submit(FECParser(growing.file_path).parse_stream, reader)
+            for i in range(0, len(data), 100):
+                growing.write(data[i:i + 100])
+            growing.close()
+            assert future.result().entries == expected
+
+    @pytest.mark.parametrize("suffix", [".txt.gz", ".zip", ".txt.zst"])
+    def test_decompressed_size_limit(self, fec_file, suffix):
+        """Test data inflating past max_decompressed_bytes is rejected while read."""
+        size = fec_file.stat().st_size
+        path = self.compress(fec_file, "123456789FEC20241231" + suffix)
+
+        expected = FECParser(fec_file).parse()
+        assert FECParser(path, max_decompressed_bytes=size).parse() == expected
+        with pytest.raises(ValueError, match="exceeds the limit"):
+            FECParser(path, max_decompressed_bytes=size - 1).parse()
+        with open(path, "rb") as f, pytest.raises(ValueError, match="exceeds the limit"):
+            FECParser(path, max_decompressed_bytes=size - 1).parse_stream(f)
+
+    def test_zip_with_several_files(self, temp_dir):
+        """Test archives must hold a single FEC file."""
+        import zipfile
+
+        path = temp_dir / "many.zip"
+        with zipfile.ZipFile(path, "w") as archive:
+            archive.writestr("a.txt", FEC_HEADER)
+            archive.writestr("b.txt", FEC_HEADER)
+        with pytest.raises(ValueError, match="exactly one"):
+            FECParser(path).parse()
+
+    def test_truncated_gzip(self, fec_file):
+        """Test a truncated .gz is reported as invalid compressed data."""
+        path = self.compress(fec_file, "123456789FEC20241231.txt.gz")
+        path.write_bytes(path.read_bytes()[:-20])
+        with pytest.raises(ValueError, match="Invalid compressed data"):
+            FECParser(path).parse()
+        with open(path, "rb") as f, pytest.raises(ValueError, match="Invalid compressed data"):
+            FECParser(path).parse_stream(f)
+
+    def test_corrupt_zstd(self, temp_dir):
+        """Test garbage in a .zst is reported as invalid compressed data."""
+        pytest.importorskip("zstandard")
+        path = temp_dir / "123456789FEC20241231.txt.zst"
+        path.write_bytes(b"not zstd data" * 100)
+        with pytest.raises(ValueError, match="Invalid compressed data"):
+            FECParser(path).parse()
+
+
+class TestFECParserDetails:
+    """Tests for the optional-column side-store (details=True)."""
+
+    def test_details_off_by_default(self, fec_file):
+        """Test the default parse keeps no optional columns."""
+        parser = FECParser(fec_file)
+        entries = parser.parse()
+        assert parser.details is None
+        assert entries[0].details is None
+
+    def test_details_match_file(self, fec_file):
+        """Test every standard column is captured and typed on access."""
+        from dataclasses import astuple
+
+        parser = FECParser(fec_file, details=True)
+        entries = parser.parse()
+        assert [astuple(e) for e in entries] == [astuple(e) for e in FECParser(fec_file).parse()]
+        assert len(parser.details) == len(entries)
+
+        detail = entries[0].details
+        assert detail.journal_code == "VE"
+        assert detail.journal_lib == "Ventes"
+        assert detail.ecriture_num == "1"
+        assert detail.compte_lib == "Client"
+        assert detail.piece_ref == "P1"
+        assert detail.piece_date == entries[0].date
+        assert detail.valid_date == entries[0].date
+        assert detail.date_let is None
+        assert detail.montant_devise is None
+        assert parser.details.column("piece_ref")[:2] == ["P1", "P1"]
+
+    def test_details_in_cents_mode(self, fec_file):
+        """Test detailed cents entries still aggregate as cents."""
+        import pickle
+
+        parser = FECParser(fec_file, details=True, amount_mode="cents", aggregate=True)
+        entries = parser.parse()
+        assert entries[0].details.piece_ref == "P1"
+        assert entries[0].debit_cents == 150
+        assert parser.cube.cents is True
+        assert pickle.loads(pickle.dumps(entries[0])).details.piece_ref == "P1"
+        assert not hasattr(FECParser(fec_file, amount_mode="cents").parse()[0], "_details_ref")
+
+    def test_details_aligned_with_errors(self, temp_dir, fec_rows):
+        """Test rows that fail to parse get no detail row."""
+        rows = list(fec_rows)
+        rows[0] = make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00")
+        path = temp_dir / "errors.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        parser = FECParser(path, details=True, error_threshold=100)
+        entries = parser.parse()
+        assert len(parser.details) == len(entries) == 99
+        assert entries[0].details.piece_ref == "P1"
+
+    def test_missing_columns(self, temp_dir):
+        """Test columns absent from the file are empty."""
+        path = temp_dir / "minimal.txt"
+        path.write_text(
+            "EcritureDate;CompteNum;EcritureLib;Debit;Credit;PieceRef\n"
+            "20240101;411000;Client;1,00;0,00;F-12\n",
+            encoding="utf-8",
+        )
+        parser = FECParser(path, details=True)
+        detail = parser.parse()[0].details
+        assert parser.details.columns == ["piece_ref"]
+        assert detail.piece_ref == "F-12"
+        assert detail.journal_code == ""
+        assert parser.details.column("valid_date") == [None]
+
+
+class TestFECParserAggregate:
+    """Tests for the parse-time AccountCube (aggregate=True)."""
+
+    def test_cube_off_by_default(self, fec_file):
+        parser = FECParser(fec_file)
+        parser.parse()
+        assert parser.cube is None
+
+    @pytest.mark.parametrize("method", ["parse_with_result", "parse_mmap", "parse_parallel"])
+    def test_cube_matches_entries(self, fec_file, method, monkeypatch):
+        """Test every parse mode aggregates all parsed entries."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        parser = FECParser(fec_file, aggregate=True)
+        entries = getattr(parser, method)().entries
+
+        cube = parser.cube
+        assert cube.row_count == len(entries) == 100
+        assert len(cube) == 4  # 2 accounts x 2 months
+        debit = sum(e.debit for e in entries if e.account_num == "411000")
+        assert cube.totals(account="411000") == (debit, Decimal("0"), 50)
+
+    def test_cube_while_streaming(self, fec_file):
+        """Test iter_entries() builds the cube without keeping entries."""
+        parser = FECParser(fec_file, amount_mode="cents", aggregate=True)
+        count = sum(1 for _ in parser.iter_entries())
+        assert parser.cube.row_count == count == 100
+        assert parser.cube.cents is True
+
+    def test_builders_on_cube(self, fec_file):
+        """Test summing builders give the same result from cube entries."""
+        from src.engine.detail_builder import DetailBuilder
+        from src.engine.monthly_builder import MonthlyBuilder
+        from src.mapper.account_mapper import AccountMapper
+
+        parser = FECParser(fec_file, aggregate=True)
+        entries = parser.parse()
+        cells = parser.cube.to_entries()
+        mapper = AccountMapper()
+        for build in (
+            MonthlyBuilder(mapper).build_monthly_revenue,
+            DetailBuilder(mapper).build_account_summary,
+            DetailBuilder(mapper).build_category_breakdown_all_years,
+            lambda e: DetailBuilder(mapper).build_category_breakdown(e, 2024),
+        ):
+            assert build(cells) == build(entries)
+
+
+class TestFECParserErrorCollection:
+    """Tests for bounded error samples and early abort."""
+
+    @pytest.fixture
+    def noisy_file(self, temp_dir):
+        """2000 rows, every 10th with a bad date and every 15th with a bad debit."""
+        rows = []
+        for i in range(1, 2001):
+            day = "bad" if i % 10 == 0 else "20240115"
+            debit = "x" if i % 15 == 0 and i % 10 else "1,00"
+            rows.append(make_fec_row(i, day, "411000", "Client", debit, "0,00"))
+        path = temp_dir / "noisy.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+        return path
+
+    def test_errors_are_counted_and_sampled(self, noisy_file):
+        """All errors are counted by column; only a bounded sample is kept."""
+        from src.parser.fec_parser import ERROR_SAMPLE_HEAD, ERROR_SAMPLE_SIZE
+
+        result = FECParser(noisy_file, error_threshold=50).parse_with_result()
+
+        assert result.error_count == 267
+        assert result.error_counts == {"date": 200, "debit": 67}
+        assert len(result.errors) == ERROR_SAMPLE_SIZE
+        rows = [e.row for e in result.errors]
+        assert rows == sorted(rows)
+        assert result.errors[ERROR_SAMPLE_HEAD - 1].row < result.errors[ERROR_SAMPLE_HEAD].row
+        assert result.success_rate == pytest.approx((2000 - 267) / 2000 * 100)
+
+    def test_sample_same_in_all_modes(self, noisy_file, monkeypatch):
+        """Sequential, mmap and parallel parses keep the same error sample."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        expected = FECParser(noisy_file, error_threshold=50).parse_with_result()
+
+        for result in (
+            FECParser(noisy_file, error_threshold=50).parse_mmap(),
+            FECParser(noisy_file, error_threshold=50).parse_parallel(workers=4),
+        ):
+            assert result.errors == expected.errors
+            assert result.error_counts == expected.error_counts
+
+    def test_early_abort(self, temp_dir, monkeypatch):
+        """A mostly bad file is rejected well before its end in every mode."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        rows = [
+            make_fec_row(i, "bad" if i % 5 else "20240115", "411000", "Client", "1,00", "0,00")
+            for i in range(1, 20001)
+        ]
+        path = temp_dir / "broken.txt"
+        # No newline after the last row
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        for parse in ("parse_with_result", "parse_mmap", "parse_parallel"):
+            with pytest.raises(ValueError, match="stopped early") as excinfo:
+                getattr(FECParser(path), parse)()
+            rows_read = int(re.search(r"of the first (\d+) rows", str(excinfo.value)).group(1))
+            assert rows_read < 5000
+
+    def test_no_early_abort_just_above_threshold(self, temp_dir):
+        """A file only slightly above the threshold is rejected at its end."""
+        rows = [
+            make_fec_row(
+                i, "bad" if i % 33 == 0 else "20240115", "411000", "Client", "1,00", "0,00"
+            )
+            for i in range(1, 4001)
+        ]
+        path = temp_dir / "borderline.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+        parser = FECParser(path, error_threshold=2)
+        with pytest.raises(ValueError, match="exceeds threshold") as excinfo:
+            parser.parse_with_result()
+        assert "stopped early" not in str(excinfo.value)
+        assert parser.parse_result.total_rows == 4000
+
+    def test_early_abort_disabled(self, noisy_file):
+        """With early_abort=False the threshold is checked on the whole file."""
+        parser = FECParser(noisy_file, error_threshold=2, early_abort=False)
+        with pytest.raises(ValueError, match="exceeds threshold") as excinfo:
+            parser.parse_with_result()
+        assert "stopped early" not in str(excinfo.value)
+        assert parser.parse_result.total_rows == 2000
+
+    def test_no_early_abort_below_threshold(self, noisy_file):
+        """Error rates below the threshold never abort early."""
+        result = FECParser(noisy_file, error_threshold=15).parse_with_result()
+        assert result.total_rows == 2000
+
+    def test_no_early_abort_on_clustered_errors(self, temp_dir, monkeypatch):
+        """Errors packed at the start of a file below the threshold do not abort."""
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        rows = []
+        for i in range(1, 40001):
+            # 200 bad rows (0.5%), all in the first 1200 rows
+            day = "bad" if i <= 1200 and i % 6 == 0 else "20240115"
+            rows.append(make_fec_row(i, day, "411000", "Client", "1,00", "0,00"))
+        path = temp_dir / "clustered.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows) + "\n", encoding="utf-8")
+
+        for parse in ("parse_with_result", "parse_mmap", "parse_parallel"):
+            result = getattr(FECParser(path), parse)()
+            assert result.total_rows == 40000
+            assert result.error_count == 200
+
+
+class TestSyntheticFEC:
+    """Tests for the synthetic FEC generator."""
+
+    @pytest.mark.parametrize("encoding,delimiter,date_format,amount_format", [
+        ("utf-8", "\t", "%Y%m%d", "comma"),
+        ("cp1252", ";", "%d/%m/%Y", "space"),
+        ("latin-1", "|", "%Y-%m-%d", "dot_thousands"),
+        ("utf-8", "\t", "%d-%m-%Y", "nbsp"),
+        ("utf-8", "|", "%Y%m%d", "dot"),
+    ])
+    def test_formats_parse_balanced(
+        self, tmp_path, encoding, delimiter, date_format, amount_format
+    ):
+        """Every format parses without errors into balanced entries."""
+        from benchmarks.synthetic import fec_filename, generate_fec
+
+        path = generate_fec(
+            tmp_path / fec_filename(2023), 400, years=(2022, 2023), encoding=encoding,
+            delimiter=delimiter, date_format=date_format, amount_format=amount_format,
+        )
+        result = FECParser(path).parse_with_result()
+
+        assert result.total_rows == 400
+        assert not result.errors
+        assert sum(e.debit for e in result.entries) == sum(e.credit for e in result.entries)
+        assert {e.fiscal_year for e in result.entries} == {2022, 2023}
+        assert all(e.source_year == 2023 for e in result.entries)
+
+    def test_deterministic(self, tmp_path):
+        """The same seed produces the same bytes."""
+        from benchmarks.synthetic import generate_fec
+
+        first = generate_fec(tmp_path / "a.txt", 100, seed=7).read_bytes()
+        second = generate_fec(tmp_path / "b.txt", 100, seed=7).read_bytes()
+        assert first == second
+        assert first != generate_fec(tmp_path / "c.txt", 100, seed=8).read_bytes()
+
+    def test_invalid_amount_format(self, tmp_path):
+        """Unknown amount formats are rejected."""
+        from benchmarks.synthetic import generate_fec
+
+        with pytest.raises(ValueError, match="amount format"):
+            generate_fec(tmp_path / "a.txt", 10, amount_format="roman")
+
+
+class TestParserBenchmark:
+    """Tests for the parser benchmark suite."""
+
+    def test_benchmark_names(self):
+        """Every mode runs in both amount modes, except columnar (cents only)."""
+        from benchmarks.parser_benchmark import benchmark_names
+
+        assert benchmark_names(["csv", "columnar"]) == [
+            "csv/decimal", "csv/cents", "columnar/cents",
+        ]
+        with pytest.raises(ValueError):
+            benchmark_names(["fastest"])
+
+    def test_run_and_compare(self, tmp_path):
+        """Results are measured in a subprocess, stored and compared to the baseline."""
+        from dataclasses import replace
+
+        from benchmarks.parser_benchmark import (
+            find_regressions,
+            load_baselines,
+            run_benchmark,
+            save_baseline,
+        )
+        from benchmarks.synthetic import generate_fec
+
+        path = generate_fec(tmp_path / "FEC20241231.txt", 200)
+        results = run_benchmark(path, ["csv/decimal", "csv/cents"])
+
+        assert len(results) == 2
+        assert results[1].rows == 200
+        assert results[1].rows_per_sec > 0
+
+        baseline_path = tmp_path / "baselines.json"
+        save_baseline(baseline_path, "small", results)
+        baseline = load_baselines(baseline_path)["small"]
+        assert baseline["reference"] == "csv/decimal"
+        assert baseline["results"]["csv/decimal"]["speed"] == 1.0
+        assert "rows_per_sec" not in baseline["results"]["csv/cents"]
+        assert find_regressions(results, baseline) == []
+
+        # Ratios, not timings: a machine twice as fast is no change
+        faster = [replace(r, rows_per_sec=r.rows_per_sec * 2) for r in results]
+        assert find_regressions(faster, baseline) == []
+
+        baseline["results"]["csv/cents"]["speed"] *= 2
+        regressions = find_regressions(results, baseline, tolerance=0.1)
+        assert len(regressions) == 1
+        assert "csv/cents" in regressions[0]
+
+        with pytest.raises(ValueError, match="csv/decimal"):
+            find_regressions(results[1:], baseline)
+
+
+class TestFECParserBulk:
+    """Tests for the pandas parse_bulk() path."""
+
+    @staticmethod
+    def assert_same_columns(result, expected):
+        for name in ("days", "account_codes", "label_codes", "debit_cents", "credit_cents"):
+            assert getattr(result, name).tolist() == getattr(expected, name).tolist()
+        assert result.accounts == expected.accounts
+        assert result.labels == expected.labels
+        assert result.total_rows == expected.total_rows
+        assert result.source_year == expected.source_year
+        assert result.errors == expected.errors
+
+    @pytest.mark.parametrize("encoding,delimiter,date_format,amount_format", [
+        ("utf-8", "\t", "%Y%m%d", "comma"),
+        ("cp1252", ";", "%d/%m/%Y", "space"),
+        ("latin-1", "|", "%Y-%m-%d", "dot_thousands"),
+        ("utf-8", "\t", "%d-%m-%Y", "nbsp"),
+        ("utf-8", "|", "%Y%m%d", "dot"),
+    ])
+    def test_matches_columnar(
+        self, tmp_path, monkeypatch, encoding, delimiter, date_format, amount_format
+    ):
+        """Columns are identical to parse_columnar(), across pandas chunks."""
+        from benchmarks.synthetic import fec_filename, generate_fec
+        from src.parser import bulk
+
+        monkeypatch.setattr(bulk, "BULK_CHUNK_ROWS", 150)
+        monkeypatch.setattr(bulk, "LAYOUT_BLOCK_SIZE", 4096)
+        path = generate_fec(
+            tmp_path / fec_filename(2023), 1000, years=(2022, 2023), encoding=encoding,
+            delimiter=delimiter, date_format=date_format, amount_format=amount_format,
+        )
+        expected = FECParser(path).parse_columnar()
+        parser = FECParser(path)
+        result = parser.parse_bulk()
+
+        self.assert_same_columns(result, expected)
+        assert parser.parse_result.total_rows == 1000
+        assert parser.delimiter == delimiter
+        assert parser.date_format == date_format
+
+    @pytest.mark.parametrize("bad_row", [
+        make_fec_row(99, "bad-date", "411000", "Bad", "1,00", "0,00"),
+        make_fec_row(99, "20240105", "", "Bad", "1,00", "0,00"),
+        make_fec_row(99, "20240105", "411000", "Bad", "1,005", "0,00"),
+        "VE\tVentes\t99\t20240105\t411000\tBad\t\t\tP99\t20240105\tBad\t1,00",
+        make_fec_row(99, "20240105", "411000", '"Quoted"', "1,00", "0,00"),
+    ])
+    def test_malformed_rows_fall_back(self, temp_dir, fec_rows, monkeypatch, bad_row):
+        """Bad, short and quoted rows are parsed row by row with errors reported."""
+        from src.parser import bulk
+
+        monkeypatch.setattr(bulk, "LAYOUT_BLOCK_SIZE", 512)
+        rows = list(fec_rows)
+        rows[30] = bad_row
+        path = temp_dir / "123456789FEC20241231.txt"
+        path.write_text(FEC_HEADER + "\r\n" + "\r\n".join(rows) + "\r\n\r\n", encoding="utf-8")
+
+        self.assert_same_columns(FECParser(path).parse_bulk(), FECParser(path).parse_columnar())
+
+    def test_amount_overflow_is_rejected(self, fec_file):
+        """Amounts whose cents do not fit in int64 are not wrapped."""
+        import pandas as pd
+
+        from src.parser.bulk import BulkFormatError, _amount_cents
+
+        parser = FECParser(fec_file)
+        column = pd.Series(["92233720368547757,99", "1,00"], dtype=object)
+        assert _amount_cents(parser, column, "debit").tolist() == [9223372036854775799, 100]
+        with pytest.raises(BulkFormatError):
+            _amount_cents(parser, pd.Series(["92233720368547759,00"], dtype=object), "debit")
+
+    def test_short_last_line_falls_back(self, temp_dir, fec_rows):
+        """A truncated last line without newline is an error row, not zero amounts."""
+        path = temp_dir / "truncated.txt"
+        truncated = "\nVE\tVentes\t1\t20240101"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(fec_rows) + truncated, encoding="utf-8")
+
+        columns = FECParser(path).parse_bulk()
+        assert len(columns) == 100
+        assert columns.error_count == 1
+
+    def test_aggregate(self, fec_file):
+        """The cube holds the entries read in bulk."""
+        parser = FECParser(fec_file, aggregate=True)
+        columns = parser.parse_bulk()
+        assert parser.cube.row_count == len(columns) == 100
+        debit = sum(Decimal(f"{i}.50") for i in range(1, 51))
+        assert parser.cube.totals(account="411000") == (debit, Decimal("0"), 50)
+
+    def test_benchmark_mode(self):
+        """Bulk is benchmarked in cents mode only."""
+        from benchmarks.parser_benchmark import benchmark_names
+
+        assert benchmark_names(["bulk"]) == ["bulk/cents"]
+
+
+class TestFECParserProbe:
+    """Tests for probe(), the sampled file inspection."""
+
+    def test_small_file_is_exact(self, fec_file):
+        """Files smaller than the sample are read whole."""
+        parser = FECParser(fec_file)
+        probe = parser.probe(sample_rows=3)
+
+        assert probe.exact is True
+        assert probe.estimated_rows == 100
+        assert probe.years == [2024]
+        assert probe.encoding == parser.encoding == "utf-8"
+        assert probe.delimiter == parser.delimiter == "\t"
+        assert probe.date_format == "%Y%m%d"
+        assert probe.columns == {"date": 3, "account": 4, "label": 10, "debit": 11, "credit": 12}
+        assert probe.source_year == 2024
+        assert [row["account"] for row in probe.sample] == ["411000", "706000", "411000"]
+        assert probe.sample[0]["debit"] == "1.50"
+
+    def test_large_file_is_sampled(self, tmp_path, monkeypatch):
+        """Only windows are read; years and row count still come out right."""
+        from benchmarks.synthetic import fec_filename, generate_fec
+
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 2048)
+        path = generate_fec(tmp_path / fec_filename(2023), 20_000, years=(2021, 2022, 2023))
+        probe = FECParser(path).probe()
+
+        assert probe.exact is False
+        assert probe.years == [2021, 2022, 2023]
+        assert probe.sampled_rows < 1000
+        assert probe.sample_errors == 0
+        assert abs(probe.estimated_rows - 20_000) < 2_000
+
+    def test_sample_errors_are_counted(self, temp_dir, fec_rows):
+        """Invalid sampled rows are counted, not raised."""
+        rows = list(fec_rows)
+        rows[1] = make_fec_row(2, "bad-date", "411000", "Bad", "1,00", "0,00")
+        path = temp_dir / "errors.txt"
+        path.write_text(FEC_HEADER + "\n" + "\n".join(rows), encoding="utf-8")
+
+        probe = FECParser(path).probe()
+        assert probe.sampled_rows == 100
+        assert probe.sample_errors == 1
+
+    def test_compressed_head(self, tmp_path, monkeypatch):
+        """Compressed files are probed from their decompressed head."""
+        import gzip
+
+        from benchmarks.synthetic import generate_fec
+
+        monkeypatch.setattr(FECParser, "ENCODING_SAMPLE_SIZE", 2048)
+        path = generate_fec(tmp_path / "FEC20241231.txt", 2_000)
+        gz_path = tmp_path / "FEC20241231.txt.gz"
+        gz_path.write_bytes(gzip.compress(path.read_bytes()))
+
+        probe = FECParser(gz_path).probe()
+        assert probe.compression == "gzip"
+        assert probe.estimated_rows is None
+        assert probe.years == [2024]
+        assert probe.sampled_rows > 0
+
+    def test_missing_columns(self, temp_dir):
+        path = temp_dir / "bad.txt"
+        path.write_text("Date\tCompte\n20240115\t706000\n", encoding="utf-8")
+        with pytest.raises(ValueError, match="Missing required columns"):
+            FECParser(path).probe()
+
+
+class TestParseFiles:
+    """Tests for parse_files(), several files in a process pool."""
+
+    @pytest.fixture
+    def files(self, tmp_path):
+        from benchmarks.synthetic import fec_filename, generate_fec
+
+        bad = tmp_path / "bad.txt"
+        bad.write_text("Date;Compte;Montant\n20240101;411000;10\n", encoding="utf-8")
+        return [
+            generate_fec(tmp_path / fec_filename(2022), 300, years=(2022,), seed=1),
+            bad,
+            generate_fec(tmp_path / fec_filename(2023), 200, years=(2023,), seed=2),
+        ]
+
+    def test_order_and_errors(self, files):
+        """Outcomes follow the input order; a bad file does not stop the others."""
+        from src.parser.multi import parse_files
+
+        outcomes = parse_files(files, max_workers=3, aggregate=True)
+
+        assert [outcome.file_path for outcome in outcomes] == [str(path) for path in files]
+        assert [outcome.ok for outcome in outcomes] == [True, False, True]
+        assert "Missing required columns" in outcomes[1].error
+        assert outcomes[1].entries == []
+        assert [len(outcome.entries) for outcome in outcomes] == [300, 0, 200]
+        assert outcomes[0].years == [2022]
+        assert outcomes[2].cube.row_count == 200
+        assert outcomes[0].encoding == "utf-8"
+
+    def test_parallel_matches_sequential(self, files):
+        """Worker processes return the same entries as parsing in process."""
+        from src.parser.multi import parse_files
+
+        parallel = parse_files(files, max_workers=2)
+        sequential = parse_files(files, max_workers=1)
+        assert [o.entries for o in parallel] == [o.entries for o in sequential]
+        assert [o.error for o in parallel] == [o.error for o in sequential]
+
+    @pytest.mark.parametrize("mode", ["mmap", "parallel", "bulk"])
+    def test_parse_modes(self, files, mode, monkeypatch):
+        """Every parse mode gives the outcomes of the csv mode."""
+        from src.parser.multi import parse_files
+
+        monkeypatch.setattr(FECParser, "PARALLEL_MIN_BYTES", 0)
+        expected = parse_files(files, max_workers=1, amount_mode="cents", aggregate=True)
+        outcomes = parse_files(files, max_workers=2, amount_mode="cents", aggregate=True, mode=mode)
+        assert [o.entries for o in outcomes] == [o.entries for o in expected]
+        assert [o.error for o in outcomes] == [o.error for o in expected]
+        assert outcomes[0].cube.row_count == 300
@@ -6,7 +6,11 @@ Tests JournalEntry, ProfitLoss, BalanceSheet, and KPIs models.
 
 import pytest
 from decimal import Decimal
-from src.models.entry import JournalEntry
+from datetime import date
+from src.models.cube import AccountCube
+from src.models.entry import (
+    AggregatedCentsJournalEntry, AggregatedJournalEntry, CentsJournalEntry, JournalEntry,
+)
 from src.models.financials import ProfitLoss, BalanceSheet, KPIs
 
 
@@ -56,6 +60,119 @@ class TestJournalEntry:
             pass
 
 
+class TestJournalEntrySlots:
+    """Tests for the slotted entry representation."""
+
+    def test_derived_fields(self):
+        """Years and class are computed once, at creation."""
+        entry = JournalEntry(date=date(2023, 12, 31), account_num="601000", label="Achat",
+                             debit=Decimal("10.00"), credit=Decimal("0"), source_year=2024)
+        assert not hasattr(entry, "__dict__")
+        assert (entry.fiscal_year, entry.effective_year, entry.account_class) == (2023, 2024, "6")
+
+        cents = CentsJournalEntry(date=date(2023, 12, 31), account_num="", label="",
+                                  debit_cents=1050, credit_cents=0)
+        assert not hasattr(cents, "__dict__")
+        assert (cents.effective_year, cents.account_class) == (2023, "")
+        assert cents.debit == Decimal("10.50")
+        assert cents.row_count == 1 and cents.details is None
+
+    def test_equality_ignores_derived_fields(self):
+        entry = AggregatedJournalEntry(date=date(2024, 1, 1), account_num="411", label="Client",
+                                       debit=Decimal("1"), credit=Decimal("0"))
+        other = AggregatedJournalEntry(date=date(2024, 1, 1), account_num="411", label="Client",
+                                       debit=Decimal("1"), credit=Decimal("0"))
+        entry.row_count = 1
+        other.row_count = 5
+        assert entry == other
+
+    def test_row_count_only_on_aggregated_entries(self):
+        """Plain entries stand for one row and have no slot to say otherwise."""
+        entry = CentsJournalEntry(date=date(2024, 1, 1), account_num="411", label="Client",
+                                  debit_cents=100, credit_cents=0)
+        assert entry.row_count == 1
+        with pytest.raises(AttributeError):
+            entry.row_count = 3
+
+    def test_pickle_roundtrip(self):
+        """Entries cross process boundaries (parallel parsing) intact."""
+        import pickle
+
+        entry = AggregatedCentsJournalEntry(date=date(2024, 1, 1), account_num="411",
+                                            label="Client", debit_cents=100, credit_cents=0,
+                                            source_year=2024)
+        entry.row_count = 3
+        copy = pickle.loads(pickle.dumps(entry))
+        assert copy == entry
+        assert (copy.debit_cents, copy.row_count, copy.effective_year) == (100, 3, 2024)
+
+
+class TestAccountCube:
+    """Tests for the (account, year, month) aggregate."""
+
+    def test_cells_sum_entries(self, sample_entries):
+        """Test entries of one account and month share a cell."""
+        cube = AccountCube()
+        for entry in sample_entries:
+            cube.add(entry)
+
+        assert cube.row_count == len(sample_entries)
+        assert cube.cents is False
+        assert cube.totals(account="411") == (Decimal("1000.00"), Decimal("1000.00"), 2)
+        aggregated = [e for e in cube.to_entries() if e.account_num == "411"]
+        assert len(aggregated) == 1
+        assert aggregated[0].row_count == 2
+        assert aggregated[0].date == date(2024, 1, 1)
+
+    def test_cents_and_merge(self):
+        """Test cents storage, merge and year filtering."""
+        def entry(day, debit_cents, label=""):
+            return CentsJournalEntry(day, "701", label, debit_cents, 0, source_year=day.year)
+
+        first, second = AccountCube(), AccountCube()
+        first.add(entry(date(2023, 5, 2), 150))
+        second.add(entry(date(2023, 5, 9), 250, "Ventes"))
+        second.add(entry(date(2024, 5, 9), 100))
+        first.merge(second)
+
+        assert first.cents is True
+        assert first.years == [2023, 2024]
+        assert first.totals(fiscal_year=2023) == (Decimal("4.00"), Decimal("0.00"), 2)
+        assert [e.label for e in first.to_entries()][:2] == ["", "Ventes"]
+        assert first.filter_years([2024]).totals() == (Decimal("1.00"), Decimal("0.00"), 1)
+
+    def test_entries_match_raw_order(self):
+        """Test builders see accounts and labels in raw entry order."""
+        from src.engine.detail_builder import DetailBuilder
+        from src.mapper.account_mapper import AccountMapper
+
+        rows = [
+            (date(2024, 1, 5), "706000", "", "0", "100"),
+            (date(2024, 1, 6), "411000", "Client", "100", "0"),
+            (date(2024, 1, 7), "706000", "Ventes", "0", "50"),
+            (date(2024, 1, 7), "411000", "", "50", "0"),
+            (date(2024, 2, 1), "607000", "Achats", "150", "0"),
+            (date(2024, 2, 1), "401000", "Fournisseur", "0", "150"),
+        ]
+        entries = [
+            JournalEntry(date=d, account_num=a, label=lib, debit=Decimal(dr), credit=Decimal(cr))
+            for d, a, lib, dr, cr in rows
+        ]
+        cube = AccountCube()
+        for entry in entries:
+            cube.add(entry)
+        cells = cube.to_entries()
+
+        assert sum(e.row_count for e in cells) == len(entries)
+        details = DetailBuilder(AccountMapper())
+        assert details.build_account_summary(cells) == details.build_account_summary(entries)
+        assert details.build_top_accounts_all_years(cells, top_n=3) == \
+            details.build_top_accounts_all_years(entries, top_n=3)
+        breakdown = details.build_category_breakdown_all_years(entries)
+        assert details.build_category_breakdown_all_years(cells) == breakdown
+        assert list(details.build_category_breakdown_all_years(cells)) == list(breakdown)
+
+
 class TestProfitLoss:
     """Tests for ProfitLoss financial model."""
 
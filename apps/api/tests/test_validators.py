@@ -36,6 +36,14 @@ class TestFileValidation:
         assert is_valid is False
         assert "Invalid file type" in error
 
+    def test_validate_fec_file_compressed(self, temp_dir):
+        """Test compressed FEC files are accepted by their inner extension."""
+        for name in ("fec.txt.gz", "fec.zip", "fec.txt.zst"):
+            assert validate_fec_file(temp_dir / name, 1000) == (True, "")
+        is_valid, error = validate_fec_file(temp_dir / "fec.xlsx.gz", 1000)
+        assert is_valid is False
+        assert "Invalid file type: .xlsx" in error
+
     def test_validate_fec_file_too_large(self, temp_dir):
         """Test validation rejects files exceeding size limit."""
         test_file = temp_dir / "test.txt"